@@ -0,0 +1,81 @@
+"""
+baseinfo Lambda cold start 벤치마크.
+
+Lambda 모듈마다 새 파이썬 프로세스를 띄워 (1) 핸들러 모듈 import 시간과
+(2) 첫 S3 클라이언트 생성(get_s3: boto3 import + client 생성) 시간을 따로 측정하고 중앙값을 출력합니다.
+import 시간에 boto3가 다시 포함되면(모듈 수준 client 생성 등) 첫 열이 크게 늘어나므로 회귀를 바로 확인할 수 있습니다.
+마지막으로 웜 상태에서 호출마다 boto3.client('s3')를 새로 만들 때(기존 방식)와 get_s3() 재사용 비용을 비교합니다.
+
+  python bench/bench_cold_start.py
+  python bench/bench_cold_start.py --runs 10 --max-import-ms 150
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+LAMBDAS = ['DSGEOBaseInfoLambda', 'DSWorkBaseInfo', 'dsOutBaseinfo', 'dsOutBaseinfo_v2']
+
+PROBE = """
+import sys, time
+sys.path[:0] = [{lambda_dir!r}, {root!r}]
+t0 = time.perf_counter()
+import {module}
+t1 = time.perf_counter()
+from dsgreen.baseinfo_runtime import get_s3
+get_s3()
+t2 = time.perf_counter()
+print((t1 - t0) * 1000, (t2 - t1) * 1000)
+"""
+
+
+def measure(module: str, runs: int):
+    env = {**os.environ, 'AWS_DEFAULT_REGION': os.environ.get('AWS_DEFAULT_REGION', 'ap-northeast-2')}
+    code = PROBE.format(lambda_dir=os.path.join(ROOT, 'lambda'), root=ROOT, module=module)
+    imports, inits = [], []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, env=env, check=True)
+        import_ms, init_ms = out.stdout.split()
+        imports.append(float(import_ms))
+        inits.append(float(init_ms))
+    return statistics.median(imports), statistics.median(inits)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--max-import-ms', type=float, default=None, help='import 시간이 이 값을 넘으면 실패(exit 1)')
+    args = parser.parse_args()
+
+    print(f"{'lambda':<22}{'import':>10}{'first get_s3':>14}{'total':>10}  (median of {args.runs})")
+    failed = []
+    for module in LAMBDAS:
+        import_ms, init_ms = measure(module, args.runs)
+        print(f"{module:<22}{import_ms:>8.1f}ms{init_ms:>12.1f}ms{import_ms + init_ms:>8.1f}ms")
+        if args.max_import_ms is not None and import_ms > args.max_import_ms:
+            failed.append(module)
+
+    sys.path.insert(0, ROOT)
+    os.environ.setdefault('AWS_DEFAULT_REGION', 'ap-northeast-2')
+    import time
+    import boto3
+    from dsgreen.baseinfo_runtime import get_s3
+    get_s3()
+    t0 = time.perf_counter()
+    for _ in range(20):
+        boto3.client('s3')
+    t1 = time.perf_counter()
+    for _ in range(20):
+        get_s3()
+    t2 = time.perf_counter()
+    print(f"warm: boto3.client('s3') {(t1 - t0) / 20 * 1000:.2f}ms/call, get_s3() {(t2 - t1) / 20 * 1000:.4f}ms/call")
+
+    if failed:
+        print(f"import time over {args.max_import_ms}ms: {', '.join(failed)}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+"""
+baseinfo 저장 압축(identity/gzip/zstd) 및 응답 gzip 크기 벤치마크.
+
+ToUpload의 baseinfo 파일별로 저장 크기와 인코딩/디코딩 시간을 비교하고,
+FakeS3(요청 지연 + 대역폭)로 prefix 전체 로딩 시간과 geo bundle 응답 크기를 측정합니다.
+zstd는 zstandard 패키지가 설치된 경우에만 측정합니다.
+
+  python bench/bench_compression.py
+  python bench/bench_compression.py --latency 0.02 --bandwidth 20e6
+"""
+import argparse
+import glob
+import gzip
+import importlib.util
+import os
+import sys
+import time
+
+import boto3
+
+from fake_s3 import FakeS3
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+BASEINFO_DIR = os.path.join(ROOT, 'ToUpload', 'dsgeoadmin', 'baseinfo')
+
+
+def _encodings():
+    encodings = ['identity', 'gzip']
+    if importlib.util.find_spec('zstandard'):
+        encodings.append('zstd')
+    else:
+        print("zstandard 미설치: zstd 측정 생략")
+    return encodings
+
+
+def _ms(seconds):
+    return f"{seconds * 1000:.1f}ms"
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--latency', type=float, default=0.02, help='요청당 지연 (초)')
+    parser.add_argument('--bandwidth', type=float, default=20e6, help='get_object 전송 속도 (bytes/초)')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    fake = FakeS3(latency=args.latency, bandwidth=args.bandwidth)
+    boto3.client = lambda *a, **k: fake
+    sys.path.insert(0, ROOT)
+    from dsgreen import baseinfo_runtime as rt
+
+    paths = sorted(glob.glob(os.path.join(BASEINFO_DIR, '*', '*.json')))
+    raws = {}
+    for path in paths:
+        with open(path, 'rb') as f:
+            raws[os.path.relpath(path, BASEINFO_DIR).replace(os.sep, '/')] = f.read()
+
+    encodings = _encodings()
+    totals = {encoding: [0, 0.0, 0.0] for encoding in encodings}
+
+    print(f"{'file':<40}" + ''.join(f"{encoding:>12}" for encoding in encodings))
+    for name, raw in raws.items():
+        row = f"{name:<40}"
+        for encoding in encodings:
+            t0 = time.perf_counter()
+            for _ in range(args.repeat):
+                body = rt.encode_body(raw, encoding)
+            t1 = time.perf_counter()
+            for _ in range(args.repeat):
+                assert rt.decode_body(body) == raw
+            t2 = time.perf_counter()
+            totals[encoding][0] += len(body)
+            totals[encoding][1] += (t1 - t0) / args.repeat
+            totals[encoding][2] += (t2 - t1) / args.repeat
+            row += f"{len(body):>12,}"
+        print(row)
+
+    print()
+    print(f"{'encoding':<10}{'bytes':>14}{'ratio':>8}{'encode':>12}{'decode':>12}{'load prefix':>14}")
+    for encoding in encodings:
+        fake.objects.clear()
+        for name, raw in raws.items():
+            fake.objects[('dsbaseinfo', name)] = rt.encode_body(raw, encoding)
+
+        t0 = time.perf_counter()
+        for prefix in ('common/', 'geo/'):
+            rt.load_all_json_from_prefix('dsbaseinfo', prefix, use_cache=False)
+        load = time.perf_counter() - t0
+
+        size, encode, decode = totals[encoding]
+        print(f"{encoding:<10}{size:>14,}{size / totals['identity'][0]:>8.2f}"
+              f"{_ms(encode):>12}{_ms(decode):>12}{_ms(load):>14}")
+
+    # geo bundle 응답: Lambda가 돌려주는 JSON 본문 vs API Gateway(minimumCompressionSize)가 gzip한 본문
+    bundle = rt.publish_bundle('dsbaseinfo', 'geo')
+    plain = rt.json_codec.dumps({'statusCode': 200, 'body': bundle['data'], 'headers': {}})
+    t0 = time.perf_counter()
+    compressed = gzip.compress(plain, compresslevel=6)
+    t1 = time.perf_counter()
+    print()
+    print(f"geo 응답: {len(plain):,} bytes -> API Gateway gzip 약 {len(compressed):,} bytes ({_ms(t1 - t0)})")
+
+if __name__ == '__main__':
+    main()
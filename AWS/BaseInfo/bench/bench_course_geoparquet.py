@@ -0,0 +1,189 @@
+"""
+코스 GeoDataFrame 로드 벤치마크 (GeoJSON + from_features vs GeoParquet 사본).
+
+fromS3AsGDF의 두 경로(from_features / read_geoparquet_bytes)에서 S3 전송을 제외한 부분(bytes -> GeoDataFrame)의 시간과 최대 메모리를 비교합니다.
+경로마다 별도 프로세스에서 실행하여 로드 중 최대 RSS 증가를 잽니다 (pyarrow 메모리 포함,
+Linux /proc/self/clear_refs로 import 후 최대 RSS 기록을 초기화; 초기화할 수 없으면 ru_maxrss 기준).
+코스 파일은 download_course_geojson으로 받은 폴더(Downloaded/{grp}/geojson{date}/)를 사용합니다.
+파일이 없으면 합성 코스(홀마다 꼭짓점이 많은 polygon)로 실행합니다.
+
+  python bench/bench_course_geoparquet.py
+  python bench/bench_course_geoparquet.py --dir Downloaded/dsgeoadmin/geojson20260301 --repeat 5
+"""
+import argparse
+import glob
+import io
+import json
+import math
+import os
+import re
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+PATHS = ['geojson', 'geoparquet', 'geojson-bbox', 'geoparquet-bbox']
+
+
+def _circle(cx, cy, r, vertices):
+    ring = [[cx + r * math.cos(2 * math.pi * k / vertices), cy + r * math.sin(2 * math.pi * k / vertices)]
+            for k in range(vertices)]
+    return {'type': 'Polygon', 'coordinates': [ring + [ring[0]]]}
+
+
+def synthetic_course(holes=27, areas_per_hole=40, vertices=400):
+    """홀마다 홀영역 + 그린/지역 polygon (실제 코스처럼 꼭짓점이 많은) 합성 코스"""
+    features = []
+    size = 0.003
+    for hole in range(1, holes + 1):
+        x0 = 127.0 + (hole - 1) % 9 * size
+        y0 = 37.0 + (hole - 1) // 9 * size
+        props = {'Client': 'Synthetic', 'Course': 'ABC'[(hole - 1) // 9], 'Hole': hole, 'Id': len(features)}
+        features.append({'type': 'Feature', 'properties': {**props, 'Type': '홀영역'},
+                         'geometry': _circle(x0 + size / 2, y0 + size / 2, size / 2, vertices)})
+        for k in range(areas_per_hole):
+            features.append({'type': 'Feature',
+                             'properties': {**props, 'Id': len(features), 'Type': '그린' if k == 0 else '지역'},
+                             'geometry': _circle(x0 + (k % 8 + 0.5) * size / 8, y0 + (k // 8 + 0.5) * size / 8,
+                                                 size / 20, vertices // 4)})
+    return {'type': 'FeatureCollection', 'features': features}
+
+
+def _bbox(course):
+    """코스 왼쪽 아래 1/9 영역 (bbox 필터 비교용)"""
+    xs = [x for f in course['features'] for ring in f['geometry']['coordinates'] for x, _ in ring]
+    ys = [y for f in course['features'] for ring in f['geometry']['coordinates'] for _, y in ring]
+    minx, miny, maxx, maxy = min(xs), min(ys), max(xs), max(ys)
+    return (minx, miny, minx + (maxx - minx) / 3, miny + (maxy - miny) / 3)
+
+
+def _rss_kb(field):
+    """/proc/self/status의 VmRSS/VmHWM (KB)"""
+    with open('/proc/self/status') as f:
+        return int(re.search(field + r':\s+(\d+)', f.read()).group(1))
+
+
+def _reset_peak_rss():
+    """최대 RSS 기록을 현재 값으로 초기화하고 기준값(KB) 반환"""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return _rss_kb('VmRSS')
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _peak_rss():
+    try:
+        return _rss_kb('VmHWM')
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def child(path_name, data_file, bbox, repeat):
+    """한 경로를 repeat번 실행하고 {'seconds': 최소 시간, 'peak_mb': 로드 중 최대 RSS 증가, 'rows'} 출력"""
+    import geopandas as gpd
+    from dsgreen import json_codec
+    from dsgreen.aws_helpers import _filter_bbox, read_geoparquet_bytes
+
+    # 첫 호출에만 드는 비용(import, pyproj CRS, arrow 메모리 풀 초기화)은 feature 1개짜리로 미리 치름
+    tiny = gpd.GeoDataFrame.from_features(synthetic_course(holes=1, areas_per_hole=0, vertices=8)['features'],
+                                          crs=int(4326))
+    warmup = io.BytesIO()
+    tiny.to_parquet(warmup, write_covering_bbox=True)
+    read_geoparquet_bytes(warmup.getvalue(), bbox)
+    _filter_bbox(tiny, bbox)
+
+    with open(data_file, 'rb') as f:
+        raw = f.read()
+    base_kb = _reset_peak_rss()
+
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        if path_name.startswith('geojson'):
+            gdf = gpd.GeoDataFrame.from_features(json_codec.loads(raw)['features'], crs=int(4326))
+            if path_name.endswith('bbox'):
+                gdf = _filter_bbox(gdf, bbox)
+        else:
+            gdf = read_geoparquet_bytes(raw, bbox if path_name.endswith('bbox') else None)
+        best = min(best, time.perf_counter() - t0)
+        rows = len(gdf)
+        del gdf
+
+    peak_mb = (_peak_rss() - base_kb) / 1024
+    print(json.dumps({'seconds': best, 'peak_mb': peak_mb, 'rows': rows}))
+
+
+def _run_child(path_name, data_file, bbox, repeat):
+    out = subprocess.run([sys.executable, os.path.abspath(__file__), '--child', path_name, '--file', data_file,
+                          '--bbox', ','.join(map(str, bbox)), '--repeat', str(repeat)],
+                         capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--dir', default=None, help='코스 GeoJSON 폴더 (기본값: Downloaded/*/geojson*)')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--child', default=None, help=argparse.SUPPRESS)
+    parser.add_argument('--file', default=None, help=argparse.SUPPRESS)
+    parser.add_argument('--bbox', default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child, args.file, tuple(float(v) for v in args.bbox.split(',')), args.repeat)
+        return 0
+
+    import geopandas as gpd
+    from dsgreen import json_codec
+    from dsgreen.aws_helpers import _filter_bbox, read_geoparquet_bytes
+    from dsgreen.baseinfo_runtime import decode_body
+
+    pattern = os.path.join(args.dir, '*.json') if args.dir else os.path.join(ROOT, 'Downloaded', '*', 'geojson*', '*.json')
+    courses = []
+    for path in sorted(glob.glob(pattern)):
+        with open(path, 'rb') as f:
+            courses.append((os.path.basename(path), decode_body(f.read())))
+    if not courses:
+        print(f"코스 파일 없음 ({pattern}) - 합성 코스 사용")
+        courses = [('synthetic', json_codec.dumps(synthetic_course()))]
+
+    mismatches = 0
+    print(f"{'course':<16}{'path':<17}{'size KB':>9}{'rows':>7}{'load ms':>10}{'peak MB':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, raw in courses:
+            course = json_codec.loads(raw)
+            if not course.get('features'):
+                continue
+            gdf = gpd.GeoDataFrame.from_features(course['features'], crs=int(4326))
+            buffer = io.BytesIO()
+            gdf.to_parquet(buffer, write_covering_bbox=True)
+
+            files = {'geojson': os.path.join(tmp, 'course.json'), 'geoparquet': os.path.join(tmp, 'course.parquet')}
+            with open(files['geojson'], 'wb') as f:
+                f.write(raw)
+            with open(files['geoparquet'], 'wb') as f:
+                f.write(buffer.getvalue())
+
+            bbox = _bbox(course)
+            if not (read_geoparquet_bytes(buffer.getvalue()).equals(gdf)
+                    and read_geoparquet_bytes(buffer.getvalue(), bbox).equals(_filter_bbox(gdf, bbox))):
+                print(f"{name}: GeoParquet 결과가 GeoJSON과 다름")
+                mismatches += 1
+
+            for path_name in PATHS:
+                data_file = files[path_name.split('-')[0]]
+                result = _run_child(path_name, data_file, bbox, args.repeat)
+                print(f"{name[:15]:<16}{path_name:<17}{os.path.getsize(data_file) / 1024:>9.0f}{result['rows']:>7}"
+                      f"{result['seconds'] * 1e3:>10.1f}{result['peak_mb']:>9.1f}")
+    print(f"결과 불일치: {mismatches}건")
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
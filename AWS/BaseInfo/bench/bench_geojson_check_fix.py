@@ -0,0 +1,272 @@
+"""
+GeoJSON 검사+수정 벤치마크 (기존 check_geojson_file + fix_geojson_file vs check_and_fix_geojson_file).
+
+기존 방식은 파일마다 검사 때 한 번, 수정 때 한 번 읽고 수정할 것이 없어도 항상 다시 씁니다.
+단일 패스 엔진은 한 번 읽어 검사와 수정을 같은 루프에서 하고 바뀐 파일만 (임시 파일 + 교체로) 씁니다.
+폴더를 임시 폴더 두 곳에 복사해 각각 실행하고 검사 결과, 수정 결과, 수정 후 파일 내용이 같은지 확인합니다.
+코스 파일은 download_course_geojson으로 받은 폴더(Downloaded/{grp}/geojson{date}/)를 사용합니다.
+파일이 없으면 합성 코스(일부 feature에 문제가 있는 것 포함)로 실행합니다.
+--props 파일이 없으면 스크립트 안의 기본 properties(SYNTHETIC_PROPS)를 사용합니다.
+
+  python bench/bench_geojson_check_fix.py
+  python bench/bench_geojson_check_fix.py --dir Downloaded/dsgeoadmin/geojson20260301 --repeat 3
+  python bench/bench_geojson_check_fix.py --props ./sample_cleanup/default_feature_properties.json
+"""
+import argparse
+import glob
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+from dsgreen import json_codec  # noqa: E402
+from dsgreen.aws_helpers import check_and_fix_geojson_file, load_default_feature_properties  # noqa: E402
+
+UNWANTED_TYPES = ['Undefined', '그린B']
+
+# --props 파일이 없을 때 쓰는 기본 properties (str/int/float/list 타입이 모두 있음)
+SYNTHETIC_PROPS = {'Type': 'Undefined', 'Hole': 0, 'Course': '', 'Client': '', 'mapdscourseid': '',
+                   'Area': 0.0, 'Tags': [], 'Id': 0, 'Color': 'rgba(0,0,0,1)'}
+
+
+def legacy_check(file_path, default_props, unwanted_types):
+    """변경 전 check_geojson_file (비교 기준, 파일 읽기도 변경 전과 같은 표준 json)"""
+    basename = os.path.basename(file_path)
+    expected_courseid = basename.replace('.json', '')
+    result = {
+        'file': basename,
+        'expected_courseid': expected_courseid,
+        'feature_count': 0,
+        'unwanted_types': defaultdict(int),
+        'missing_keys': set(),
+        'type_mismatches': defaultdict(set),
+        'extra_keys': set(),
+        'wrong_courseid': defaultdict(int),
+    }
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except Exception as e:
+        result['error'] = str(e)
+        return result
+
+    features = data.get('features', [])
+    result['feature_count'] = len(features)
+    for feature in features:
+        props = feature.get('properties', {})
+        feature_type = props.get('Type', '')
+        if feature_type in unwanted_types:
+            result['unwanted_types'][feature_type] += 1
+        for key in default_props.keys():
+            if key not in props:
+                result['missing_keys'].add(key)
+        for key, value in props.items():
+            if key in default_props:
+                expected_type = type(default_props[key])
+                actual_type = type(value)
+                if expected_type != actual_type:
+                    result['type_mismatches'][key].add(f"{actual_type.__name__} (expected: {expected_type.__name__})")
+            else:
+                result['extra_keys'].add(key)
+        mapdscourseid = props.get('mapdscourseid', '')
+        if mapdscourseid != expected_courseid:
+            result['wrong_courseid'][mapdscourseid] += 1
+    return result
+
+
+def legacy_fix(file_path, default_props, unwanted_types):
+    """변경 전 fix_geojson_file (비교 기준, 표준 json으로 읽고 항상 다시 씀)"""
+    basename = os.path.basename(file_path)
+    expected_courseid = basename.replace('.json', '')
+    result = {'file': basename, 'deleted_features': 0, 'fixed_missing_keys': 0, 'fixed_extra_keys': 0,
+              'fixed_type_mismatches': 0, 'fixed_wrong_courseid': 0}
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except Exception as e:
+        result['error'] = str(e)
+        return result
+
+    filtered_features = []
+    for feature in data.get('features', []):
+        if feature.get('properties', {}).get('Type', '') in unwanted_types:
+            result['deleted_features'] += 1
+        else:
+            filtered_features.append(feature)
+
+    for feature in filtered_features:
+        props = feature.get('properties', {})
+        if props.get('mapdscourseid', '') != expected_courseid:
+            props['mapdscourseid'] = expected_courseid
+            result['fixed_wrong_courseid'] += 1
+        for key, default_value in default_props.items():
+            if key not in props:
+                props[key] = default_value.copy() if isinstance(default_value, list) else default_value
+                result['fixed_missing_keys'] += 1
+            else:
+                expected_type = type(default_value)
+                if not isinstance(props[key], expected_type):
+                    try:
+                        if expected_type == list:
+                            if isinstance(props[key], str):
+                                props[key] = json.loads(props[key])
+                            else:
+                                props[key] = list(props[key]) if props[key] else default_value.copy()
+                        elif expected_type == float:
+                            props[key] = float(props[key])
+                        elif expected_type == int:
+                            props[key] = int(props[key])
+                        elif expected_type == str:
+                            props[key] = str(props[key])
+                        result['fixed_type_mismatches'] += 1
+                    except (ValueError, TypeError, json.JSONDecodeError):
+                        props[key] = default_value.copy() if isinstance(default_value, list) else default_value
+                        result['fixed_type_mismatches'] += 1
+        for key in [k for k in props.keys() if k not in default_props]:
+            del props[key]
+            result['fixed_extra_keys'] += 1
+        feature['properties'] = props
+
+    data['features'] = filtered_features
+    with open(file_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    return result
+
+
+def _box(x0, y0, x1, y1):
+    return {'type': 'Polygon', 'coordinates': [[[x0, y0], [x1, y0], [x1, y1], [x0, y1], [x0, y0]]]}
+
+
+def synthetic_courses(folder, default_props, count=40, features_per_course=600):
+    """합성 코스 파일 (4개 중 1개는 문제 있음: 잘못된 Type/mapdscourseid, 빠진/추가 key, 타입 불일치)"""
+    for n in range(1, count + 1):
+        course_id = f'SYN{n:03d}'
+        broken = n % 4 == 0
+        features = []
+        for k in range(features_per_course):
+            props = {key: value.copy() if isinstance(value, list) else value for key, value in default_props.items()}
+            props.update({'mapdscourseid': course_id, 'Hole': k % 18 + 1, 'Id': k, 'Type': '지역'})
+            if broken and k % 50 == 0:
+                props['Type'] = 'Undefined'
+            if broken and k % 30 == 1:
+                props['Hole'] = str(props['Hole'])
+                props['legacy_note'] = 'x'
+                props.pop('Course', None)
+                props['mapdscourseid'] = 'OLD' + course_id
+            x0 = 127.0 + k * 1e-4
+            features.append({'type': 'Feature', 'properties': props, 'geometry': _box(x0, 37.0, x0 + 1e-4, 37.0001)})
+        json_codec.dump_file(os.path.join(folder, f'{course_id}.json'), {'type': 'FeatureCollection', 'features': features})
+
+
+def _files(folder):
+    return sorted(glob.glob(os.path.join(folder, '*.json')))
+
+
+def _run_legacy(folder, default_props):
+    checks, fixes = {}, {}
+    for path in _files(folder):
+        checks[path] = legacy_check(path, default_props, UNWANTED_TYPES)
+        fixes[path] = legacy_fix(path, default_props, UNWANTED_TYPES)
+    return checks, fixes, sum('error' not in r for r in fixes.values())
+
+
+def _run_fused(folder, default_props):
+    checks, fixes, written = {}, {}, 0
+    for path in _files(folder):
+        outcome = check_and_fix_geojson_file(path, default_props, UNWANTED_TYPES)
+        checks[path] = outcome['check']
+        fixes[path] = outcome['fix']
+        written += outcome['written']
+    return checks, fixes, written
+
+
+def _comparable(results):
+    """{파일명: 결과} (파싱 실패 메시지는 json과 orjson의 문구가 다르므로 실패 여부만 비교)"""
+    return {os.path.basename(path): {**result, 'error': True} if 'error' in result else result
+            for path, result in results.items()}
+
+
+def _contents(folder):
+    result = {}
+    for path in _files(folder):
+        with open(path, 'rb') as f:
+            result[os.path.basename(path)] = f.read()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--dir', default=None, help='코스 GeoJSON 폴더 (기본값: Downloaded/*/geojson*)')
+    parser.add_argument('--props', default='./sample_cleanup/default_feature_properties.json',
+                        help='기본 properties 템플릿 (load_default_feature_properties)')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    if os.path.exists(args.props):
+        default_props = load_default_feature_properties(args.props)
+    else:
+        print(f"기본 properties 파일 없음 ({args.props}) - 합성 기본 properties 사용")
+        default_props = SYNTHETIC_PROPS
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = args.dir
+        if source is None:
+            folders = sorted(glob.glob(os.path.join(ROOT, 'Downloaded', '*', 'geojson*')))
+            source = folders[-1] if folders and _files(folders[-1]) else None
+        if source is None or not _files(source):
+            print(f"코스 파일 없음 ({args.dir or 'Downloaded/*/geojson*'}) - 합성 코스 사용")
+            source = os.path.join(tmp, 'source')
+            os.makedirs(source)
+            synthetic_courses(source, default_props)
+
+        size_mb = sum(os.path.getsize(p) for p in _files(source)) / 1024 / 1024
+        print(f"{source}: {len(_files(source))}개 파일, {size_mb:.1f}MB")
+
+        mismatches = 0
+        best = {}
+        for _ in range(args.repeat):
+            runs = {}
+            for path_name, run in (('legacy', _run_legacy), ('fused', _run_fused)):
+                work = os.path.join(tmp, path_name)
+                shutil.rmtree(work, ignore_errors=True)
+                shutil.copytree(source, work)
+
+                # 1차: 수정 전 폴더 / 2차: 이미 수정된 폴더 (다시 쓸 파일 없음)
+                for pass_name in ('dirty', 'clean'):
+                    t0 = time.perf_counter()
+                    checks, fixes, written = run(work, default_props)
+                    seconds = time.perf_counter() - t0
+                    key = (pass_name, path_name)
+                    best[key] = min(best.get(key, (float('inf'), 0)), (seconds, written))
+                    runs[key] = (_comparable(checks), _comparable(fixes))
+                runs[path_name] = _contents(work)
+
+            for pass_name in ('dirty', 'clean'):
+                if runs[(pass_name, 'legacy')] != runs[(pass_name, 'fused')]:
+                    print(f"{pass_name}: 검사/수정 결과가 기존과 다름")
+                    mismatches += 1
+            if runs['legacy'] != runs['fused']:
+                print("수정 후 파일 내용이 기존과 다름")
+                mismatches += 1
+
+        print(f"{'pass':<8}{'path':<8}{'seconds':>10}{'written':>9}")
+        for pass_name in ('dirty', 'clean'):
+            for path_name in ('legacy', 'fused'):
+                seconds, written = best[(pass_name, path_name)]
+                print(f"{pass_name:<8}{path_name:<8}{seconds:>10.3f}{written:>9}")
+            legacy_s = best[(pass_name, 'legacy')][0]
+            fused_s = best[(pass_name, 'fused')][0]
+            print(f"{pass_name}: {legacy_s / max(fused_s, 1e-9):.2f}x")
+
+    print(f"결과 불일치: {mismatches}건")
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
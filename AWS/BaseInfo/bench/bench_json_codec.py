@@ -0,0 +1,71 @@
+"""
+JSON 코덱 마이크로 벤치마크.
+
+ToUpload의 baseinfo 파일 전체를 대상으로 기존 방식(json/simplejson, indent=2 쓰기,
+replace_data의 dumps->loads(parse_float=Decimal) 왕복)과 dsgreen.json_codec의
+파싱/직렬화 시간과 출력 크기를 비교합니다.
+
+  python bench/bench_json_codec.py
+  python bench/bench_json_codec.py --repeat 20
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from decimal import Decimal
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+BASEINFO_DIR = os.path.join(ROOT, 'ToUpload', 'dsgeoadmin', 'baseinfo')
+sys.path.insert(0, ROOT)
+
+from dsgreen import json_codec  # noqa: E402
+
+
+def _time(fn, repeat):
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - t0) / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    raws = []
+    for path in sorted(glob.glob(os.path.join(BASEINFO_DIR, '*', '*.json'))):
+        with open(path, 'rb') as f:
+            raws.append(f.read())
+    values = [json.loads(raw) for raw in raws]
+
+    cases = [
+        ('loads  json', lambda: [json.loads(raw.decode('utf-8')) for raw in raws]),
+        ('loads  codec', lambda: [json_codec.loads(raw) for raw in raws]),
+        ('dumps  json indent=2', lambda: [json.dumps(v, ensure_ascii=False, indent=2).encode('utf-8') for v in values]),
+        ('dumps  codec compact', lambda: [json_codec.dumps(v) for v in values]),
+        ('dumps  codec pretty', lambda: [json_codec.dumps(v, pretty=True) for v in values]),
+        ('replace_data round trip', lambda: [json.loads(json.dumps(v).encode('UTF-8'), parse_float=Decimal) for v in values]),
+    ]
+    try:
+        import simplejson
+        cases.insert(1, ('loads  simplejson', lambda: [simplejson.loads(raw.decode('utf-8')) for raw in raws]))
+        cases.insert(4, ('dumps  simplejson indent=2',
+                         lambda: [simplejson.dumps(v, ensure_ascii=False, indent=2).encode('utf-8') for v in values]))
+    except ImportError:
+        pass
+
+    print(f"backend={json_codec.BACKEND}, files={len(raws)}, bytes={sum(map(len, raws)):,}, repeat={args.repeat}")
+    print(f"{'case':<28}{'time':>12}{'output bytes':>16}")
+    for name, fn in cases:
+        elapsed, result = _time(fn, args.repeat)
+        size = sum(len(r) for r in result) if name.startswith('dumps') else ''
+        print(f"{name:<28}{elapsed * 1000:>10.1f}ms{size:>16,}" if size else f"{name:<28}{elapsed * 1000:>10.1f}ms")
+
+    assert [json_codec.loads(raw) for raw in raws] == values
+
+
+if __name__ == '__main__':
+    main()
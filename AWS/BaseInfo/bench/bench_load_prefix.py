@@ -0,0 +1,57 @@
+"""
+load_all_json_from_prefix 순차/병렬 로딩 벤치마크.
+
+로컬 S3 대역(FakeS3)에 객체당 지연을 넣고 파일 수를 늘려가며
+max_workers=1(기존 순차 방식)과 병렬 로딩의 소요 시간을 비교합니다.
+
+  python bench/bench_load_prefix.py
+  python bench/bench_load_prefix.py --latency 0.05 --counts 4 12 48 --workers 8
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import boto3
+
+from fake_s3 import FakeS3
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+SAMPLE = os.path.join(ROOT, 'ToUpload', 'dsgeoadmin', 'baseinfo', 'common', 'dsOrgList.json')
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--latency', type=float, default=0.03, help='요청당 지연 (초)')
+    parser.add_argument('--counts', type=int, nargs='+', default=[1, 4, 12, 32, 64])
+    parser.add_argument('--workers', type=int, default=8)
+    args = parser.parse_args()
+
+    fake = FakeS3(latency=args.latency)
+    boto3.client = lambda *a, **k: fake
+    sys.path.insert(0, ROOT)
+    from dsgreen import baseinfo_runtime as rt
+
+    with open(SAMPLE, encoding='utf-8') as f:
+        body = json.dumps(json.load(f), ensure_ascii=False).encode('utf-8')
+
+    print(f"latency={args.latency * 1000:.0f}ms/request, workers={args.workers}")
+    print(f"{'files':>6} {'sequential':>12} {'parallel':>12} {'speedup':>8}")
+    for count in args.counts:
+        fake.objects.clear()
+        for i in range(count):
+            fake.objects[('dsbaseinfo', f'bench{count}/file{i:04d}.json')] = body
+
+        t0 = time.perf_counter()
+        seq = rt.load_all_json_from_prefix('dsbaseinfo', f'bench{count}/', max_workers=1)
+        t1 = time.perf_counter()
+        par = rt.load_all_json_from_prefix('dsbaseinfo', f'bench{count}/', max_workers=args.workers)
+        t2 = time.perf_counter()
+
+        assert seq == par and list(seq) == list(par)
+        print(f"{count:>6} {(t1 - t0) * 1000:>10.1f}ms {(t2 - t1) * 1000:>10.1f}ms {(t1 - t0) / (t2 - t1):>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
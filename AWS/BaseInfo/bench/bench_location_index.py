@@ -0,0 +1,191 @@
+"""
+get_location_from_gps 벤치마크 (기존 feature 전체 shape()+contains vs dsgreen.location_index).
+
+코스 GeoJSON 파일마다 bbox 안의 임의 GPS 점으로 두 방식의 결과가 같은지 확인하고 조회당 시간을 비교합니다.
+best 열은 get_best_location_from_gps(우선순위 순서 검사, 첫 포함에서 중단)와 bbox 후보/contains 검사 평균 수,
+batch 열은 get_best_locations_from_gps(점 배열 한 번에)로, 점마다 기존 방식 + 우선순위 선택한 결과와 비교합니다.
+코스 파일은 download_course_geojson으로 받은 폴더(Downloaded/{grp}/geojson{date}/)를 사용합니다.
+파일이 없으면 합성 코스(18홀)로 실행합니다.
+
+  python bench/bench_location_index.py
+  python bench/bench_location_index.py --dir Downloaded/dsgeoadmin/geojson20260301 --points 2000
+"""
+import argparse
+import glob
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+from shapely.geometry import Point, shape  # noqa: E402
+
+from dsgreen import json_codec  # noqa: E402
+from dsgreen.baseinfo_runtime import decode_body  # noqa: E402
+from dsgreen.location_index import build_location_index, clear_location_index_cache  # noqa: E402
+from dsgreen.aws_helpers import (  # noqa: E402
+    get_best_location_from_gps, get_best_locations_from_gps, get_location_from_gps,
+)
+
+
+def legacy_get_location_from_gps(crs_geojson, gps):
+    """변경 전 구현 (비교 기준)"""
+    lng = float(gps.get('longitude', 0))
+    lat = float(gps.get('latitude', 0))
+    if lng == 0 or lat == 0:
+        return []
+    point = Point(lng, lat)
+    results = []
+    for feature in crs_geojson.get('features', []):
+        try:
+            polygon = shape(feature['geometry'])
+            if polygon.contains(point):
+                props = feature.get('properties', {})
+                results.append({
+                    'Hole': int(props.get('Hole', 0)) if props.get('Hole') is not None else 0,
+                    'Area': props.get('Type', ''),
+                    'Client': props.get('Client', ''),
+                    'Course': props.get('Course', '')
+                })
+        except Exception:
+            continue
+    return results
+
+
+def legacy_best(locations, priority=('홀영역', '그린', '지역', '코스', '전면')):
+    """변경 전 get_best_location_from_gps의 우선순위 선택"""
+    for area_type in priority:
+        for loc in locations:
+            if loc.get('Area') == area_type:
+                return loc
+    return locations[0] if locations else None
+
+
+def _box(x0, y0, x1, y1):
+    return {'type': 'Polygon', 'coordinates': [[[x0, y0], [x1, y0], [x1, y1], [x0, y1], [x0, y0]]]}
+
+
+def synthetic_course(holes=18, areas_per_hole=12):
+    """홀마다 홀영역 1개 + 그린/지역 여러 개, 코스/전면을 감싸는 합성 코스"""
+    features = []
+    size = 0.003
+    for hole in range(1, holes + 1):
+        x0 = 127.0 + (hole - 1) % 6 * size
+        y0 = 37.0 + (hole - 1) // 6 * size
+        props = {'Client': 'Synthetic', 'Course': 'A' if hole <= 9 else 'B'}
+        features.append({'type': 'Feature', 'properties': {**props, 'Hole': hole, 'Type': '홀영역'},
+                         'geometry': _box(x0, y0, x0 + size, y0 + size)})
+        for k in range(areas_per_hole):
+            ax = x0 + (k % 4) * size / 4
+            ay = y0 + (k // 4) * size / 4
+            features.append({'type': 'Feature',
+                             'properties': {**props, 'Hole': hole, 'Type': '그린' if k == 0 else '지역'},
+                             'geometry': _box(ax, ay, ax + size / 5, ay + size / 5)})
+    features.append({'type': 'Feature', 'properties': {'Client': 'Synthetic', 'Course': 'A', 'Hole': 0, 'Type': '코스'},
+                     'geometry': _box(127.0, 37.0, 127.0 + 6 * size, 37.0 + 3 * size)})
+    features.append({'type': 'Feature', 'properties': {'Client': 'Synthetic', 'Course': '', 'Hole': 0, 'Type': '전면'},
+                     'geometry': _box(126.99, 36.99, 127.03, 37.02)})
+    return {'type': 'FeatureCollection', 'features': features}
+
+
+def _bounds(crs_geojson):
+    xs, ys = [], []
+    for feature in crs_geojson.get('features', []):
+        try:
+            minx, miny, maxx, maxy = shape(feature['geometry']).bounds
+        except Exception:
+            continue
+        xs += [minx, maxx]
+        ys += [miny, maxy]
+    return (min(xs), min(ys), max(xs), max(ys)) if xs else None
+
+
+def _time(fn, points):
+    t0 = time.perf_counter()
+    results = [fn(p) for p in points]
+    return time.perf_counter() - t0, results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--dir', default=None, help='코스 GeoJSON 폴더 (기본값: Downloaded/*/geojson*)')
+    parser.add_argument('--points', type=int, default=1000, help='코스당 GPS 점 수')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    pattern = os.path.join(args.dir, '*.json') if args.dir else os.path.join(ROOT, 'Downloaded', '*', 'geojson*', '*.json')
+    courses = []
+    for path in sorted(glob.glob(pattern)):
+        with open(path, 'rb') as f:
+            courses.append((os.path.basename(path), json_codec.loads(decode_body(f.read()))))
+    if not courses:
+        print(f"코스 파일 없음 ({pattern}) - 합성 코스 사용")
+        courses = [('synthetic', synthetic_course())]
+
+    rng = random.Random(args.seed)
+    total_legacy = total_build = total_index = total_batch = 0.0
+    total_points = mismatches = total_candidates = total_tests = 0
+
+    print(f"{'course':<20}{'features':>9}{'legacy us/pt':>14}{'build ms':>10}{'index us/pt':>13}{'best us/pt':>12}{'cand/test':>11}{'batch us/pt':>13}{'speedup':>9}")
+    for name, crs_geojson in courses:
+        bounds = _bounds(crs_geojson)
+        if bounds is None:
+            continue
+        minx, miny, maxx, maxy = bounds
+        points = [{'longitude': rng.uniform(minx, maxx), 'latitude': rng.uniform(miny, maxy)}
+                  for _ in range(args.points)]
+
+        legacy_s, legacy_results = _time(lambda p: legacy_get_location_from_gps(crs_geojson, p), points)
+
+        clear_location_index_cache()
+        t0 = time.perf_counter()
+        build_location_index(crs_geojson)
+        build_s = time.perf_counter() - t0
+        index_s, index_results = _time(lambda p: get_location_from_gps(crs_geojson, p), points)
+
+        counts = []
+
+        def best(p):
+            stats = {}
+            location = get_best_location_from_gps(crs_geojson, p, stats=stats)
+            counts.append((stats['candidates'], stats['tests']))
+            return location
+        best_s, best_results = _time(best, points)
+        candidates = sum(c for c, _ in counts)
+        tests = sum(t for _, t in counts)
+
+        t0 = time.perf_counter()
+        batch_results = get_best_locations_from_gps(crs_geojson, [p['longitude'] for p in points],
+                                                    [p['latitude'] for p in points])
+        batch_s = time.perf_counter() - t0
+
+        mismatches += sum(a != b for a, b in zip(legacy_results, index_results))
+        mismatches += sum(legacy_best(a) != b for a, b in zip(legacy_results, best_results))
+        mismatches += sum(legacy_best(a) != b for a, b in zip(legacy_results, batch_results))
+        total_candidates += candidates
+        total_tests += tests
+        total_legacy += legacy_s
+        total_build += build_s
+        total_index += index_s
+        total_batch += batch_s
+        total_points += len(points)
+        print(f"{name[:19]:<20}{len(crs_geojson.get('features', [])):>9}"
+              f"{legacy_s / len(points) * 1e6:>14.1f}{build_s * 1e3:>10.2f}"
+              f"{index_s / len(points) * 1e6:>13.1f}{best_s / len(points) * 1e6:>12.1f}"
+              f"{f'{candidates / len(points):.1f}/{tests / len(points):.1f}':>11}{batch_s / len(points) * 1e6:>13.2f}"
+              f"{legacy_s / max(batch_s, 1e-9):>8.0f}x")
+
+    if total_points:
+        print(f"\n합계 {len(courses)}개 코스, {total_points}점: legacy {total_legacy:.3f}s, "
+              f"index build {total_build:.3f}s + lookup {total_index:.3f}s "
+              f"({total_legacy / max(total_build + total_index, 1e-9):.1f}x), batch {total_batch:.3f}s")
+        print(f"best: 점당 bbox 후보 {total_candidates / total_points:.2f}개, "
+              f"contains 검사 {total_tests / total_points:.2f}회")
+    print(f"결과 불일치: {mismatches}건")
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
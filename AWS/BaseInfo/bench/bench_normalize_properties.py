@@ -0,0 +1,161 @@
+"""
+clean_and_normalize_features 벤치마크 (기존 key마다 type()+if/elif 변환 vs default_props를 한 번 컴파일한 변환 표).
+
+코스 GeoJSON의 features를 복사해 두 방식으로 정규화하고 결과 properties가 같은지 확인한 뒤 시간을 비교합니다.
+코스 파일은 download_course_geojson으로 받은 폴더(Downloaded/{grp}/geojson{date}/)를 사용합니다.
+파일이 없으면 합성 코스(빠진 key, 추가 key, 타입이 다른 값이 섞인 feature)로 실행합니다.
+--props 파일이 없으면 스크립트 안의 기본 properties(SYNTHETIC_PROPS)를 사용합니다.
+
+  python bench/bench_normalize_properties.py
+  python bench/bench_normalize_properties.py --dir Downloaded/dsgeoadmin/geojson20260301 --repeat 5
+"""
+import argparse
+import contextlib
+import copy
+import glob
+import io
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+from dsgreen import json_codec  # noqa: E402
+from dsgreen.baseinfo_runtime import decode_body  # noqa: E402
+from dsgreen.aws_helpers import clean_and_normalize_features, load_default_feature_properties  # noqa: E402
+
+# --props 파일이 없을 때 쓰는 기본 properties (str/int/float/list 타입이 모두 있음)
+SYNTHETIC_PROPS = {'Type': 'Undefined', 'Hole': 0, 'Course': '', 'Client': '', 'mapdscourseid': '',
+                   'Area': 0.0, 'Tags': [], 'Id': 0, 'Color': 'rgba(0,0,0,1)'}
+
+
+def legacy_clean_and_normalize_features(features, default_props, mapdscourseid=None):
+    """변경 전 clean_and_normalize_features (비교 기준, 출력 제외)"""
+    client_to_courseid = {}
+    if not mapdscourseid:
+        for feature in features:
+            props = feature.get('properties', {})
+            client = props.get('Client', '')
+            courseid = props.get('mapdscourseid')
+            if client and courseid:
+                client_to_courseid[client] = courseid
+
+    for feature in features:
+        if 'properties' not in feature:
+            continue
+        current_props = feature['properties']
+        cleaned_props = {}
+        for key, default_value in default_props.items():
+            if key in current_props:
+                value = current_props[key]
+                expected_type = type(default_value)
+                if not isinstance(value, expected_type):
+                    try:
+                        if expected_type == list:
+                            if isinstance(value, str):
+                                value = json.loads(value)
+                            else:
+                                value = list(value) if value else default_value.copy()
+                        elif expected_type == float:
+                            value = float(value)
+                        elif expected_type == int:
+                            value = int(value)
+                        elif expected_type == str:
+                            value = str(value)
+                    except (ValueError, TypeError, json.JSONDecodeError):
+                        value = default_value.copy() if isinstance(default_value, list) else default_value
+                cleaned_props[key] = value
+            else:
+                cleaned_props[key] = default_value.copy() if isinstance(default_value, list) else default_value
+
+        if mapdscourseid:
+            cleaned_props['mapdscourseid'] = mapdscourseid
+        elif not cleaned_props.get('mapdscourseid'):
+            client = cleaned_props.get('Client', '')
+            if client and client in client_to_courseid:
+                cleaned_props['mapdscourseid'] = client_to_courseid[client]
+        feature['properties'] = cleaned_props
+    return features
+
+
+def synthetic_features(default_props, count=20000):
+    """기본 properties에서 일부 key를 빼거나 더하고 값 타입을 바꾼 feature (geometry 없음)"""
+    samples = {int: ['3', 2.7, 'x', None], float: ['1.5', 2, 'y', None], str: [7, 1.25, None],
+               list: ['[1, 2]', '[bad', (3, 4), '', 5]}
+    features = []
+    for k in range(count):
+        props = {key: value.copy() if isinstance(value, list) else value for key, value in default_props.items()}
+        for n, (key, value) in enumerate(default_props.items()):
+            if (k + n) % 7 == 0:
+                props.pop(key)
+            elif (k + n) % 11 == 0 and type(value) in samples:
+                choices = samples[type(value)]
+                props[key] = choices[(k + n) % len(choices)]
+        if k % 5 == 0:
+            props['legacy_note'] = 'x'
+        props['Client'] = f'Client{k % 4}'
+        props['mapdscourseid'] = f'MGC{k % 4:03d}' if k % 3 else ''
+        features.append({'type': 'Feature', 'properties': props, 'geometry': None})
+    return features
+
+
+def _time(fn, features, default_props, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        work = copy.deepcopy(features)
+        t0 = time.perf_counter()
+        fn(work, default_props)
+        best = min(best, time.perf_counter() - t0)
+    return best, work
+
+
+def _new(features, default_props):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return clean_and_normalize_features(features, default_props)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--dir', default=None, help='코스 GeoJSON 폴더 (기본값: Downloaded/*/geojson*)')
+    parser.add_argument('--props', default='./sample_cleanup/default_feature_properties.json',
+                        help='기본 properties 템플릿 (load_default_feature_properties)')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    if os.path.exists(args.props):
+        default_props = load_default_feature_properties(args.props)
+    else:
+        print(f"기본 properties 파일 없음 ({args.props}) - 합성 기본 properties 사용")
+        default_props = SYNTHETIC_PROPS
+
+    pattern = os.path.join(args.dir, '*.json') if args.dir else os.path.join(ROOT, 'Downloaded', '*', 'geojson*', '*.json')
+    features = []
+    for path in sorted(glob.glob(pattern)):
+        with open(path, 'rb') as f:
+            try:
+                course = json_codec.loads(decode_body(f.read()))
+            except ValueError:
+                continue
+        # geometry는 정규화와 무관하므로 복사 비용을 줄이기 위해 뺌
+        features += [{'type': 'Feature', 'properties': feature['properties']}
+                     for feature in course.get('features', []) if 'properties' in feature]
+    if not features:
+        print(f"코스 파일 없음 ({pattern}) - 합성 feature 사용")
+        features = synthetic_features(default_props)
+
+    legacy_s, legacy_result = _time(legacy_clean_and_normalize_features, features, default_props, args.repeat)
+    new_s, new_result = _time(_new, features, default_props, args.repeat)
+    mismatches = sum(a != b or [type(v) for v in a['properties'].values()] != [type(v) for v in b['properties'].values()]
+                     for a, b in zip(legacy_result, new_result))
+
+    print(f"{len(features)}개 feature, key {len(default_props)}개")
+    print(f"legacy {legacy_s:.3f}s ({legacy_s / len(features) * 1e6:.2f} us/feature), "
+          f"compiled {new_s:.3f}s ({new_s / len(features) * 1e6:.2f} us/feature), {legacy_s / max(new_s, 1e-9):.2f}x")
+    print(f"결과 불일치: {mismatches}건")
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,64 @@
+"""
+dsgreen.aws_helpers import 시간 회귀 검사.
+
+새 파이썬 프로세스에서 aws_helpers를 import하여
+(1) geopandas/pandas/fiona/shapely/pyproj/boto3가 import 시점에 로드되지 않는지,
+(2) import 시간(중앙값)이 --max-ms 이하인지 확인하고, 어기면 exit 1로 종료합니다.
+GIS 함수(fromS3AsGDF 등)를 호출했을 때의 추가 import 시간도 참고로 출력합니다.
+
+  python bench/check_import_time.py
+  python bench/check_import_time.py --runs 10 --max-ms 200
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+HEAVY = ['geopandas', 'pandas', 'fiona', 'shapely', 'pyproj', 'boto3']
+
+PROBE = """
+import sys, time
+sys.path.insert(0, {root!r})
+t0 = time.perf_counter()
+import dsgreen.aws_helpers
+t1 = time.perf_counter()
+loaded = [name for name in {heavy!r} if name in sys.modules]
+import geopandas, fiona
+t2 = time.perf_counter()
+print((t1 - t0) * 1000, (t2 - t1) * 1000, ','.join(loaded) or '-')
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--max-ms', type=float, default=250.0, help='aws_helpers import 시간 상한 (ms)')
+    args = parser.parse_args()
+
+    code = PROBE.format(root=ROOT, heavy=HEAVY)
+    import_ms, gis_ms, loaded = [], [], set()
+    for _ in range(args.runs):
+        out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+        helpers, gis, names = out.stdout.split()
+        import_ms.append(float(helpers))
+        gis_ms.append(float(gis))
+        loaded.update(name for name in names.split(',') if name != '-')
+
+    median = statistics.median(import_ms)
+    print(f"import dsgreen.aws_helpers: {median:.1f}ms (median of {args.runs}, limit {args.max_ms:.0f}ms)")
+    print(f"GIS stack on first use (geopandas+fiona): {statistics.median(gis_ms):.1f}ms")
+
+    errors = []
+    if loaded:
+        errors.append(f"heavy modules loaded at import: {', '.join(sorted(loaded))}")
+    if median > args.max_ms:
+        errors.append(f"import took {median:.1f}ms > {args.max_ms:.0f}ms")
+    for error in errors:
+        print(f"FAIL: {error}")
+    sys.exit(1 if errors else 0)
+
+
+if __name__ == '__main__':
+    main()
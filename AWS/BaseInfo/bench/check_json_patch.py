@@ -0,0 +1,146 @@
+"""
+baseinfo PATCH 엔진 검사 (dsgreen.baseinfo_runtime의 JSON Patch RFC 6902 / Merge Patch RFC 7396).
+
+add/remove/replace/move/copy/test, 배열 끝 '-', test의 타입 비교(true != 1), 잘못된 body 형식(400),
+연산 하나가 실패하면 아무것도 바뀌지 않는지(원본 미수정, 부분 적용 없음)를 확인하고 실패가 있으면 exit 1로 종료합니다.
+S3 없이 실행됩니다 (patch_baseinfo는 저장 전에 400을 반환하는 경우만 확인).
+
+  python bench/check_json_patch.py
+"""
+import copy
+import os
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+from dsgreen.baseinfo_runtime import (  # noqa: E402
+    _apply_json_patch, _apply_merge_patch, patch_baseinfo, resolve_patch_changes,
+)
+
+DOC = {'a': 1, 'flag': True, 'list': [1, 2, 3], 'obj': {'x': 'y', 'n': 1.0}, 'a/b': 'slash', 'm~n': 'tilde'}
+
+# (이름, 연산들, 기대 결과)
+CASES = [
+    ('add key', [{'op': 'add', 'path': '/b', 'value': 2}], {**DOC, 'b': 2}),
+    ('add replaces key', [{'op': 'add', 'path': '/a', 'value': 5}], {**DOC, 'a': 5}),
+    ('add list index', [{'op': 'add', 'path': '/list/1', 'value': 9}], {**DOC, 'list': [1, 9, 2, 3]}),
+    ('add list end -', [{'op': 'add', 'path': '/list/-', 'value': 4}], {**DOC, 'list': [1, 2, 3, 4]}),
+    ('add list at len', [{'op': 'add', 'path': '/list/3', 'value': 4}], {**DOC, 'list': [1, 2, 3, 4]}),
+    ('remove key', [{'op': 'remove', 'path': '/a'}], {k: v for k, v in DOC.items() if k != 'a'}),
+    ('remove list item', [{'op': 'remove', 'path': '/list/0'}], {**DOC, 'list': [2, 3]}),
+    ('replace nested', [{'op': 'replace', 'path': '/obj/x', 'value': 'z'}], {**DOC, 'obj': {'x': 'z', 'n': 1.0}}),
+    ('replace escaped', [{'op': 'replace', 'path': '/a~1b', 'value': 1},
+                         {'op': 'replace', 'path': '/m~0n', 'value': 2}], {**DOC, 'a/b': 1, 'm~n': 2}),
+    ('replace root', [{'op': 'replace', 'path': '', 'value': [1]}], [1]),
+    ('move', [{'op': 'move', 'from': '/obj/x', 'path': '/moved'}], {**DOC, 'obj': {'n': 1.0}, 'moved': 'y'}),
+    ('move list', [{'op': 'move', 'from': '/list/0', 'path': '/list/-'}], {**DOC, 'list': [2, 3, 1]}),
+    ('copy', [{'op': 'copy', 'from': '/list', 'path': '/list2'}], {**DOC, 'list2': [1, 2, 3]}),
+    ('test ok', [{'op': 'test', 'path': '/obj', 'value': {'n': 1, 'x': 'y'}}], DOC),
+    ('test bool', [{'op': 'test', 'path': '/flag', 'value': True}], DOC),
+]
+
+# (이름, 연산들) - 모두 예외가 나야 함
+FAILURES = [
+    ('test value', [{'op': 'test', 'path': '/a', 'value': 2}]),
+    ('test true vs 1', [{'op': 'test', 'path': '/a', 'value': True}]),
+    ('test 1 vs true', [{'op': 'test', 'path': '/flag', 'value': 1}]),
+    ('test list type', [{'op': 'test', 'path': '/list', 'value': [1, 2, True]}]),
+    ('remove missing', [{'op': 'remove', 'path': '/missing'}]),
+    ('replace missing', [{'op': 'replace', 'path': '/missing', 'value': 1}]),
+    ('add past end', [{'op': 'add', 'path': '/list/5', 'value': 1}]),
+    ('remove -', [{'op': 'remove', 'path': '/list/-'}]),
+    ('bad pointer', [{'op': 'add', 'path': 'a', 'value': 1}]),
+    ('unknown op', [{'op': 'frobnicate', 'path': '/a'}]),
+    ('remove root', [{'op': 'remove', 'path': ''}]),
+    ('later op fails', [{'op': 'replace', 'path': '/a', 'value': 7}, {'op': 'remove', 'path': '/list/0'},
+                        {'op': 'test', 'path': '/a', 'value': 1}]),
+]
+
+# 잘못된 PATCH body - S3를 읽기 전에 400이어야 함 (500/AttributeError가 아니라)
+BAD_BODIES = [
+    ('array body', [{'op': 'add'}]),
+    ('string body', 'patch'),
+    ('keys not object', {'keys': [1]}),
+    ('patches not list', {'patches': {'key': 'a'}}),
+    ('item not object', {'patches': ['a']}),
+    ('patch not list', {'patches': [{'key': 'dsOrgList', 'patch': {'op': 'add'}}]}),
+    ('op not object', {'patches': [{'key': 'dsOrgList', 'patch': ['add']}]}),
+    ('op without path', {'patches': [{'key': 'dsOrgList', 'patch': [{'op': 'add', 'value': 1}]}]}),
+    ('move without from', {'patches': [{'key': 'dsOrgList', 'patch': [{'op': 'move', 'path': '/a'}]}]}),
+    ('neither patch nor merge', {'patches': [{'key': 'dsOrgList'}]}),
+]
+
+MERGE_CASES = [
+    ('merge', {'a': 2, 'obj': {'x': None, 'k': 1}, 'flag': None},
+     {k: v for k, v in DOC.items() if k != 'flag'} | {'a': 2, 'obj': {'n': 1.0, 'k': 1}}),
+    ('merge non-object', [1], [1]),
+]
+
+
+def main():
+    failures = []
+    original = copy.deepcopy(DOC)
+
+    for name, operations, expected in CASES:
+        try:
+            result = _apply_json_patch(DOC, operations)
+        except Exception as e:
+            failures.append(f"{name}: {e!r}")
+            continue
+        if result != expected:
+            failures.append(f"{name}: {result!r} != {expected!r}")
+
+    for name, operations in FAILURES:
+        try:
+            result = _apply_json_patch(DOC, operations)
+            failures.append(f"{name}: no error ({result!r})")
+        except (KeyError, IndexError, TypeError, ValueError):
+            pass
+
+    for name, patch, expected in MERGE_CASES:
+        result = _apply_merge_patch(DOC, patch)
+        if result != expected:
+            failures.append(f"{name}: {result!r} != {expected!r}")
+
+    if DOC != original:
+        failures.append(f"원본 문서가 수정됨: {DOC!r}")
+
+    # 여러 key 중 하나라도 실패하면 아무 key도 반환하지 않음
+    stored = {'dsOrgList': copy.deepcopy(DOC), 'task_info': [1, 2]}
+    body = {'keys': {'vehicle_info': []},
+            'patches': [{'key': 'task_info', 'patch': [{'op': 'add', 'path': '/-', 'value': 3}]},
+                        {'key': 'dsOrgList', 'patch': [{'op': 'test', 'path': '/a', 'value': True}]}]}
+    try:
+        changes = resolve_patch_changes(body, stored.get)
+        failures.append(f"resolve atomic: no error ({changes!r})")
+    except ValueError:
+        pass
+    if stored != {'dsOrgList': original, 'task_info': [1, 2]}:
+        failures.append(f"resolve atomic: 저장된 값이 수정됨 {stored!r}")
+
+    changes = resolve_patch_changes({'patches': [{'key': 'task_info', 'patch': [{'op': 'add', 'path': '/-', 'value': 3}]},
+                                                 {'key': 'task_info', 'patch': [{'op': 'remove', 'path': '/0'}]}]},
+                                    stored.get)
+    if changes != {'task_info': [2, 3]} or stored['task_info'] != [1, 2]:
+        failures.append(f"resolve chained: {changes!r}")
+
+    for name, bad_body in BAD_BODIES:
+        event = {'body-json': bad_body, 'params': {}, 'context': {'http-method': 'PATCH'}}
+        try:
+            response = patch_baseinfo(event, 'geo', bucket_name='unused')
+        except Exception as e:
+            failures.append(f"{name}: {e!r}")
+            continue
+        if response['statusCode'] != 400:
+            failures.append(f"{name}: status {response['statusCode']}")
+
+    total = len(CASES) + len(FAILURES) + len(MERGE_CASES) + len(BAD_BODIES) + 2
+    for failure in failures:
+        print(f"❌ {failure}")
+    print(f"{total - len(failures)}/{total} 통과")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,75 @@
+"""
+벤치마크용 로컬 S3 대역(stand-in).
+
+boto3 S3 클라이언트 중 baseinfo 코드가 사용하는 메서드만 메모리에서 흉내내고,
+요청마다 latency(초)만큼 대기하여 실제 S3 왕복 지연을 재현합니다.
+bandwidth(bytes/초)를 주면 get_object가 본문 크기에 비례한 전송 시간도 대기합니다.
+"""
+import hashlib
+import io
+import time
+
+
+class FakeS3:
+
+    def __init__(self, latency: float = 0.03, bandwidth: float = None):
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.objects = {}
+        self.calls = {}
+
+    def _hit(self, name):
+        self.calls[name] = self.calls.get(name, 0) + 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def put_object(self, Bucket, Key, Body, **kwargs):
+        self._hit('put_object')
+        if isinstance(Body, str):
+            Body = Body.encode('utf-8')
+        self.objects[(Bucket, Key)] = Body
+        return {'ETag': '"%s"' % hashlib.md5(Body).hexdigest()}
+
+    def get_object(self, Bucket, Key, **kwargs):
+        self._hit('get_object')
+        body = self.objects[(Bucket, Key)]
+        if self.bandwidth:
+            time.sleep(len(body) / self.bandwidth)
+        return {
+            'Body': io.BytesIO(body),
+            'ContentLength': len(body),
+            'ETag': '"%s"' % hashlib.md5(body).hexdigest(),
+        }
+
+    def list_objects_v2(self, Bucket, Prefix='', MaxKeys=1000, ContinuationToken=None, **kwargs):
+        self._hit('list_objects_v2')
+        keys = sorted(key for bucket, key in self.objects if bucket == Bucket and key.startswith(Prefix))
+        start = int(ContinuationToken or 0)
+        page = keys[start:start + MaxKeys]
+        contents = []
+        for key in page:
+            body = self.objects[(Bucket, key)]
+            contents.append({'Key': key, 'Size': len(body), 'ETag': '"%s"' % hashlib.md5(body).hexdigest()})
+        response = {'KeyCount': len(contents), 'IsTruncated': start + MaxKeys < len(keys)}
+        if contents:
+            response['Contents'] = contents
+        if response['IsTruncated']:
+            response['NextContinuationToken'] = str(start + MaxKeys)
+        return response
+
+    def get_paginator(self, operation_name):
+        return _Paginator(getattr(self, operation_name))
+
+
+class _Paginator:
+
+    def __init__(self, method):
+        self._method = method
+
+    def paginate(self, **kwargs):
+        while True:
+            page = self._method(**kwargs)
+            yield page
+            if not page.get('IsTruncated'):
+                return
+            kwargs['ContinuationToken'] = page['NextContinuationToken']
@@ -1,73 +1,354 @@
 
-import geopandas as gpd
-import pandas as pd
+import hashlib
 import json
 import os
+import re
+import sys
 import tempfile
-import boto3
-import fiona
 import glob
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from botocore.exceptions import ClientError
+
+from dsgreen import json_codec
+# S3 baseinfo 로딩/디코딩은 Lambda와 같은 런타임 사용 (병렬 로딩, 웜 캐시, gzip/zstd)
+# S3 클라이언트는 get_s3()로 처음 쓸 때 만들고 재사용 (boto3도 그때 import)
+from dsgreen import baseinfo_runtime
+from dsgreen.baseinfo_runtime import decode_body, get_s3
+
+# geopandas/fiona/shapely/pyproj 등 GIS 스택은 사용하는 함수 안에서 import
+# (S3/JSON 유틸리티만 쓰는 스크립트가 수 초의 import 비용을 내지 않도록)
 
 _Bucket='dsgeousergrp'
 _GRP_Name = 'dsgeoadmin'
 
-def load_all_json_from_prefix(bucket_name:str , prefix: str):
-    s3 = boto3.client('s3')
-    result_dict = {}
+# download_s3_folder 동시 다운로드 수와 동기화 기록 파일 (local_dir 아래, .json이 아니므로 JSON 처리 대상에서 제외됨)
+DOWNLOAD_MAX_WORKERS = int(os.environ.get('DOWNLOAD_MAX_WORKERS', '8'))
+SYNC_MANIFEST_NAME = '.s3sync'
+# upload_baseinfo_to_s3 / upload_geojson_to_s3 동시 업로드(및 MD5 계산) 수
+UPLOAD_MAX_WORKERS = int(os.environ.get('UPLOAD_MAX_WORKERS', '8'))
 
-    # 1. prefix 경로 아래의 모든 객체 리스트 가져오기
-    response = s3.list_objects_v2(Bucket=bucket_name, Prefix=prefix)
+# check_geojson_files 동시 검사 프로세스 수와 검사 결과 캐시 파일 (폴더 아래, 내용 해시가 같은 파일은 다시 검사하지 않음)
+CHECK_MAX_WORKERS = int(os.environ.get('CHECK_MAX_WORKERS', str(os.cpu_count() or 1)))
+CHECK_CACHE_NAME = '.geojson_check'
 
-    if 'Contents' not in response:
-        print("No files found.")
-        return result_dict
+# 코스 GeoJSON 캐시 ((bucket, S3 key) → ETag, 크기, 파싱된 GeoJSON). 같은 코스를 반복해서 읽는 배치 작업용
+# COURSE_CACHE_MAX_BYTES: 메모리에 둘 원본 JSON 크기 합계 상한 (초과 시 LRU 제거)
+# COURSE_CACHE_DIR: 지정하면 원본을 디스크에도 보관 (프로세스를 다시 띄워도 ETag가 같으면 다운로드 생략)
+COURSE_CACHE_MAX_BYTES = int(os.environ.get('COURSE_CACHE_MAX_BYTES', str(256 * 1024 * 1024)))
+COURSE_CACHE_DIR = os.environ.get('COURSE_CACHE_DIR', '')
 
-    for obj in response['Contents']:
-        key = obj['Key']
-        if key.endswith('.json'):
-            try:
-                content_object = s3.get_object(Bucket=bucket_name, Key=key)
-                file_content = content_object['Body'].read().decode('utf-8')
-                json_data = json.loads(file_content)
+# 코스 GeoJSON을 올릴 때 {grp}/coursegeoparquet/{course_id}.parquet도 함께 저장 (fromS3AsGDF의 빠른 경로)
+# parquet의 S3 메타데이터 source-etag가 현재 GeoJSON ETag와 다르면(웹 등 다른 경로로 수정됨) GeoJSON으로 읽음
+COURSE_GEOPARQUET = os.environ.get('COURSE_GEOPARQUET', '1') == '1'
 
-                # 파일명에서 .json 제거하고 딕셔너리 key로 사용
-                filename = key.split('/')[-1].replace('.json', '')
-                result_dict[filename] = json_data
+_geoparquet_crs = {}  # GeoParquet 메타데이터의 PROJJSON -> pyproj CRS (파싱이 파일마다 수십 ms라 재사용)
 
-            except Exception as e:
-                print(f"Error reading {key}: {e}")
+_course_cache = OrderedDict()
+_course_cache_stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0, 'evictions': 0, 'bytes': 0}
+
+def load_all_json_from_prefix(bucket_name: str, prefix: str, max_workers: int = None, errors: dict = None, use_cache: bool = False):
+    """
+    prefix 아래의 JSON 파일 전체를 {파일명: 데이터}로 반환 (baseinfo_runtime의 병렬 로더 사용).
+
+    로컬/노트북용이라 기본값은 호출마다 새로 읽음 (use_cache=True면 Lambda와 같은 웜 캐시의 공유 객체를 반환하므로 수정하지 말 것)
+    """
+    return baseinfo_runtime.load_all_json_from_prefix(bucket_name, prefix, max_workers=max_workers, errors=errors,
+                                                      use_cache=use_cache)
+
+def _decode_local_file(path: str):
+    """다운로드한 파일이 압축 저장본이면 평문 JSON으로 덮어씀 (로컬 도구는 평문만 읽음)"""
+    with open(path, 'rb') as f:
+        body = f.read()
+    raw = decode_body(body)
+    if raw is not body:
+        with open(path, 'wb') as f:
+            f.write(raw)
 
-    return result_dict
-  
 def saveJson(gdf, filename):
+  import fiona
 
   with fiona.Env(OSR_WKT_FORMAT="WKT2_2018"):
     gdf.to_file(filename, driver='GeoJSON')
 
 def upload2S3(filename, course_id, bucket_name: str, __GRP_Name: str):
-  import boto3
-  s3 = boto3.client('s3')
-  json_content_ = json.load(open(filename, encoding="utf8"))
-  s3.put_object(Body=json.dumps(json_content_).encode('utf-8'),Bucket=bucket_name,Key=__GRP_Name +'/coursegeojson/' +course_id+'.json')
-
-def fromS3AsGDF(_course_id, bucket_name: str, __GRP_Name: str):
-  import boto3
-  s3 = boto3.client('s3')
-  #S3로부터 전면 geojson화일 다운
-  content_object = s3.get_object(Bucket=bucket_name,Key=__GRP_Name +'/coursegeojson/' +_course_id+'.json')
-  file_content = content_object['Body'].read().decode('utf-8')
-  json_content = json.loads(file_content)
+  s3 = get_s3()
+  json_content_ = json_codec.load_file(filename)
+  s3_key = __GRP_Name +'/coursegeojson/' +course_id+'.json'
+  response = s3.put_object(Body=json_codec.dumps(json_content_),Bucket=bucket_name,Key=s3_key)
+  if COURSE_GEOPARQUET:
+    upload_course_geoparquet(bucket_name, s3_key, json_content_, response.get('ETag'))
+
+def _course_cache_put(cache_key: tuple, etag: str, size: int, data):
+  """메모리 캐시에 저장하고 COURSE_CACHE_MAX_BYTES를 넘으면 오래된 코스부터 제거"""
+  old = _course_cache.pop(cache_key, None)
+  if old is not None:
+    _course_cache_stats['bytes'] -= old['size']
+  if size > COURSE_CACHE_MAX_BYTES:
+    return
+
+  _course_cache[cache_key] = {'etag': etag, 'size': size, 'data': data}
+  _course_cache_stats['bytes'] += size
+  while _course_cache_stats['bytes'] > COURSE_CACHE_MAX_BYTES:
+    _, evicted = _course_cache.popitem(last=False)
+    _course_cache_stats['bytes'] -= evicted['size']
+    _course_cache_stats['evictions'] += 1
+
+def _course_disk_path(bucket_name: str, s3_key: str) -> str:
+  return os.path.join(COURSE_CACHE_DIR, bucket_name, *s3_key.split('/'))
+
+def _course_disk_get(bucket_name: str, s3_key: str):
+  """디스크 캐시의 (ETag, 원본 bytes). 없으면 (None, None)"""
+  path = _course_disk_path(bucket_name, s3_key)
+  try:
+    with open(path + '.etag', 'r') as f:
+      etag = f.read().strip()
+    with open(path, 'rb') as f:
+      return etag, f.read()
+  except OSError:
+    return None, None
+
+def _course_disk_put(bucket_name: str, s3_key: str, etag: str, raw: bytes):
+  """원본과 ETag를 디스크 캐시에 저장 (임시 파일에 쓴 뒤 교체하여 중간 상태가 남지 않게)"""
+  path = _course_disk_path(bucket_name, s3_key)
+  os.makedirs(os.path.dirname(path), exist_ok=True)
+  for target, content in ((path, raw), (path + '.etag', etag.encode('utf-8'))):
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    with os.fdopen(fd, 'wb') as f:
+      f.write(content)
+    os.replace(tmp_path, target)
+
+def load_course_cached(bucket_name: str, s3_key: str):
+  """
+  코스 GeoJSON을 캐시를 거쳐 읽어 파싱된 dict로 반환 (객체가 없으면 ClientError).
+
+  메모리 → 디스크(COURSE_CACHE_DIR) 순으로 찾고, 캐시에 있으면 조건부 GET(If-None-Match)으로
+  ETag를 재검증하여 바뀌지 않았으면(304) 다운로드/파싱 없이 재사용.
+  반환된 dict는 호출 간에 공유되므로 수정하면 안 됨 (수정할 때는 copy.deepcopy).
+  """
+  s3 = get_s3()
+  cache_key = (bucket_name, s3_key)
+
+  cached = _course_cache.get(cache_key)
+  disk_etag = disk_raw = None
+  if cached is None and COURSE_CACHE_DIR:
+    disk_etag, disk_raw = _course_disk_get(bucket_name, s3_key)
+  known_etag = cached['etag'] if cached else disk_etag
+
+  try:
+    kwargs = {'IfNoneMatch': known_etag} if known_etag else {}
+    content_object = s3.get_object(Bucket=bucket_name, Key=s3_key, **kwargs)
+  except ClientError as e:
+    if known_etag and e.response.get('ResponseMetadata', {}).get('HTTPStatusCode') == 304:
+      if cached:
+        _course_cache.move_to_end(cache_key)
+        _course_cache_stats['memory_hits'] += 1
+        return cached['data']
+      data = json_codec.loads(disk_raw)
+      _course_cache_stats['disk_hits'] += 1
+      _course_cache_put(cache_key, disk_etag, len(disk_raw), data)
+      return data
+    raise
+
+  raw = decode_body(content_object['Body'].read())
+  data = json_codec.loads(raw)
+  etag = content_object.get('ETag')
+  _course_cache_stats['misses'] += 1
+  _course_cache_put(cache_key, etag, len(raw), data)
+  if COURSE_CACHE_DIR and etag:
+    _course_disk_put(bucket_name, s3_key, etag, raw)
+  return data
+
+def course_cache_stats() -> dict:
+  """코스 캐시 hit/miss/eviction 카운터, hit rate, 현재 항목 수와 크기"""
+  lookups = _course_cache_stats['memory_hits'] + _course_cache_stats['disk_hits'] + _course_cache_stats['misses']
+  hits = lookups - _course_cache_stats['misses']
+  return {**_course_cache_stats, 'entries': len(_course_cache), 'hit_rate': hits / lookups if lookups else 0.0}
+
+def clear_course_cache(disk: bool = False):
+  """메모리 캐시(disk=True면 COURSE_CACHE_DIR도)와 카운터 초기화"""
+  import shutil
+
+  _course_cache.clear()
+  for key in _course_cache_stats:
+    _course_cache_stats[key] = 0
+  if disk and COURSE_CACHE_DIR:
+    shutil.rmtree(COURSE_CACHE_DIR, ignore_errors=True)
+
+def _geoparquet_key(geojson_key: str):
+  """coursegeojson key -> GeoParquet 사본 key (코스 GeoJSON이 아니면 None)"""
+  if '/coursegeojson/' not in geojson_key or not geojson_key.endswith('.json'):
+    return None
+  return geojson_key.replace('/coursegeojson/', '/coursegeoparquet/')[:-len('.json')] + '.parquet'
+
+def upload_course_geoparquet(bucket_name: str, geojson_key: str, json_content: dict, source_etag: str = None) -> bool:
+  """
+  코스 GeoJSON의 GeoParquet 사본을 저장 (bbox covering 컬럼 포함, 메타데이터에 원본 ETag 기록).
+
+  source_etag가 없으면 S3의 현재 GeoJSON ETag를 조회. 변환/저장에 실패하면 False
+  (fromS3AsGDF는 ETag가 맞지 않는 사본을 쓰지 않으므로 GeoJSON으로 읽게 됨).
+  """
+  import io
+
+  parquet_key = _geoparquet_key(geojson_key)
+  if parquet_key is None:
+    return False
+
+  s3 = get_s3()
+  try:
+    import geopandas as gpd
+
+    if source_etag is None:
+      source_etag = s3.head_object(Bucket=bucket_name, Key=geojson_key)['ETag']
+    gdf = gpd.GeoDataFrame.from_features(json_content['features'], crs=int(4326))
+    buffer = io.BytesIO()
+    gdf.to_parquet(buffer, write_covering_bbox=True)
+    s3.put_object(Body=buffer.getvalue(), Bucket=bucket_name, Key=parquet_key,
+                  ContentType='application/vnd.apache.parquet', Metadata={'source-etag': source_etag.strip('"')})
+  except Exception as e:
+    print(f"GeoParquet 저장 실패 {parquet_key}: {e}")
+    return False
+  return True
+
+def _upload_geoparquet_siblings(bucket_name: str, items: list, max_workers: int = None) -> int:
+  """업로드된 코스 GeoJSON(items의 local_path)마다 GeoParquet 사본 저장, 성공 수 반환"""
+  def write(item):
+    with open(item['local_path'], 'rb') as f:
+      json_content = json_codec.loads(decode_body(f.read()))
+    return upload_course_geoparquet(bucket_name, item['s3_key'], json_content)
+
+  items = [item for item in items if _geoparquet_key(item['s3_key'])]
+  if not COURSE_GEOPARQUET or not items:
+    return 0
+  with ThreadPoolExecutor(max_workers=max(1, min(max_workers or UPLOAD_MAX_WORKERS, len(items)))) as executor:
+    written = sum(executor.map(write, items))
+  print(f"GeoParquet 사본: {written}/{len(items)}개")
+  return written
+
+def read_geoparquet_bytes(raw: bytes, bbox: tuple = None):
+  """
+  GeoParquet bytes -> GeoDataFrame (geopandas.read_parquet와 같은 결과).
+
+  pyarrow로 직접 읽어 bbox covering 컬럼으로 행 그룹/행을 거르고, CRS(PROJJSON)는 한 번만 파싱해서 재사용.
+  """
+  import io
+  import geopandas as gpd
+  import pyarrow.compute as pc
+  import pyarrow.parquet as pq
+  from pyproj import CRS
+
+  source = io.BytesIO(raw)
+  geo = json.loads(pq.read_schema(source).metadata[b'geo'])
+  geometry_column = geo['primary_column']
+  column_meta = geo['columns'][geometry_column]
+  covering = column_meta.get('covering', {}).get('bbox')
+
+  filters = None
+  if bbox is not None and covering:
+    minx, miny, maxx, maxy = bbox
+    field = {name: pc.field(*path) for name, path in covering.items()}
+    filters = (field['xmin'] <= maxx) & (field['xmax'] >= minx) & (field['ymin'] <= maxy) & (field['ymax'] >= miny)
+
+  source.seek(0)
+  table = pq.read_table(source, filters=filters)
+  if covering:
+    table = table.drop_columns([covering['xmin'][0]])
+
+  crs_json = json.dumps(column_meta.get('crs', 'OGC:CRS84'), sort_keys=True)
+  crs = _geoparquet_crs.get(crs_json)
+  if crs is None:
+    crs = _geoparquet_crs[crs_json] = CRS.from_user_input(json.loads(crs_json))
+
+  df = table.to_pandas()
+  df[geometry_column] = gpd.GeoSeries.from_wkb(df[geometry_column], crs=crs)
+  gdf = gpd.GeoDataFrame(df, geometry=geometry_column, crs=crs)
+  if bbox is not None and not covering:
+    gdf = _filter_bbox(gdf, bbox)
+  return gdf
+
+def _load_course_geoparquet_cached(bucket_name: str, parquet_key: str) -> dict:
+  """
+  GeoParquet 사본을 코스 캐시(메모리)를 거쳐 읽어 {'raw': parquet bytes, 'source_etag'} 반환 (객체가 없으면 ClientError).
+
+  load_course_cached와 같이 캐시에 있으면 조건부 GET(If-None-Match)으로 parquet ETag를 재검증하여
+  바뀌지 않았으면(304) 다시 받지 않음. source-etag는 S3 메타데이터라 304 응답에는 없으므로 디스크 캐시는 쓰지 않음.
+  """
+  s3 = get_s3()
+  cache_key = (bucket_name, parquet_key)
+  cached = _course_cache.get(cache_key)
+
+  try:
+    kwargs = {'IfNoneMatch': cached['etag']} if cached else {}
+    parquet_object = s3.get_object(Bucket=bucket_name, Key=parquet_key, **kwargs)
+  except ClientError as e:
+    if cached and e.response.get('ResponseMetadata', {}).get('HTTPStatusCode') == 304:
+      _course_cache.move_to_end(cache_key)
+      _course_cache_stats['memory_hits'] += 1
+      return cached['data']
+    raise
+
+  raw = parquet_object['Body'].read()
+  data = {'raw': raw, 'source_etag': parquet_object.get('Metadata', {}).get('source-etag')}
+  _course_cache_stats['misses'] += 1
+  _course_cache_put(cache_key, parquet_object.get('ETag'), len(raw), data)
+  return data
+
+def _read_course_geoparquet(bucket_name: str, geojson_key: str, bbox: tuple = None):
+  """GeoParquet 사본이 현재 GeoJSON과 같은 버전이면 GeoDataFrame, 아니면(없음/오래됨/읽기 실패) None"""
+  parquet_key = _geoparquet_key(geojson_key)
+  if parquet_key is None:
+    return None
+
+  s3 = get_s3()
+  try:
+    parquet = _load_course_geoparquet_cached(bucket_name, parquet_key)
+    source_etag = s3.head_object(Bucket=bucket_name, Key=geojson_key)['ETag']
+  except ClientError:
+    return None
+  if parquet['source_etag'] != source_etag.strip('"'):
+    return None
+
+  try:
+    return read_geoparquet_bytes(parquet['raw'], bbox)
+  except Exception as e:
+    print(f"GeoParquet 읽기 실패 {parquet_key}, GeoJSON 사용: {e}")
+    return None
+
+def _filter_bbox(gdf, bbox: tuple):
+  """geometry bbox가 bbox(minx, miny, maxx, maxy)와 겹치는 행만 (read_parquet(bbox=...)와 같은 기준)"""
+  minx, miny, maxx, maxy = bbox
+  bounds = gdf.bounds
+  mask = (bounds.minx <= maxx) & (bounds.maxx >= minx) & (bounds.miny <= maxy) & (bounds.maxy >= miny)
+  return gdf[mask].reset_index(drop=True)
+
+def fromS3AsGDF(_course_id, bucket_name: str, __GRP_Name: str, bbox: tuple = None):
+  """
+  코스 GeoJSON을 GeoDataFrame으로 로드.
+
+  최신 GeoParquet 사본이 있으면 pyarrow로 읽고(bbox는 covering 컬럼으로 필터),
+  없으면 GeoJSON을 읽어 변환. bbox=(minx, miny, maxx, maxy)이면 geometry bbox가 겹치는 행만 반환.
+  두 경로 모두 코스 캐시를 거치므로 같은 코스를 다시 읽으면 조건부 GET(304)으로 다운로드를 생략.
+  """
+  import geopandas as gpd
+  s3_key = __GRP_Name +'/coursegeojson/' +_course_id+'.json'
+  if COURSE_GEOPARQUET:
+    gdf = _read_course_geoparquet(bucket_name, s3_key, bbox)
+    if gdf is not None:
+      return gdf
+
+  #S3로부터 전면 geojson화일 다운 (바뀌지 않았으면 캐시 사용)
+  json_content = load_course_cached(bucket_name, s3_key)
   gdf = gpd.GeoDataFrame.from_features(json_content['features'], crs=int(4326))
+  if bbox is not None:
+    gdf = _filter_bbox(gdf, bbox)
 
   return gdf
 
 def AreafromS3AsGDF(_course_id, bucket_name: str, __GRP_Name: str):
-  import boto3
-  s3 = boto3.client('s3')
-  #S3로부터 전면 geojson화일 다운
-  content_object = s3.get_object(Bucket=bucket_name,Key=__GRP_Name +'/geojson/' +_course_id+'.json')
-  file_content = content_object['Body'].read().decode('utf-8')
-  json_content = json.loads(file_content)
+  import geopandas as gpd
+  #S3로부터 전면 geojson화일 다운 (바뀌지 않았으면 캐시 사용)
+  json_content = load_course_cached(bucket_name, __GRP_Name +'/geojson/' +_course_id+'.json')
   gdf = gpd.GeoDataFrame.from_features(json_content['features'], crs=int(4326))
 
   return gdf
@@ -84,7 +365,47 @@ def cal_bearing(row):
   return bearing
 
 
-def download_s3_folder(bucket_name: str, local_dir: str, s3_prefix: str = ''):
+def _etag_matches(path: str, etag: str, part_size: int = 8 * 1024 * 1024) -> bool:
+    """
+    로컬 파일 내용이 S3 ETag와 같은지.
+    단일 파트는 파일 MD5, 멀티파트('-N')는 part_size(boto3 기본 8MB) 단위 MD5들의 MD5로 비교.
+    """
+    digest = hashlib.md5()
+    parts = []
+    multipart = '-' in etag
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(part_size), b''):
+            if multipart:
+                parts.append(hashlib.md5(chunk).digest())
+            else:
+                digest.update(chunk)
+    if multipart:
+        return f"{hashlib.md5(b''.join(parts)).hexdigest()}-{len(parts)}" == etag
+    return digest.hexdigest() == etag
+
+def _load_sync_manifest(local_dir: str) -> dict:
+    """download_s3_folder가 남긴 {상대경로: {etag, size, local_size, local_mtime_ns}} (없으면 빈 dict)"""
+    try:
+        return json_codec.load_file(os.path.join(local_dir, SYNC_MANIFEST_NAME)).get('files', {})
+    except (OSError, ValueError):
+        return {}
+
+def _is_synced(local_path: str, obj: dict, entry: dict) -> bool:
+    """로컬 파일이 S3 객체와 같은지 (manifest 기록 우선, 없으면 크기 + MD5/ETag 비교)"""
+    try:
+        stat = os.stat(local_path)
+    except OSError:
+        return False
+
+    etag = obj.get('ETag', '').strip('"')
+    if entry:
+        # 다운로드 후 후처리(압축 해제, 한글 indent 등)로 내용이 바뀌므로 기록해 둔 로컬 상태로 비교
+        return (entry.get('etag') == etag and entry.get('local_size') == stat.st_size
+                and entry.get('local_mtime_ns') == stat.st_mtime_ns)
+    return stat.st_size == obj['Size'] and _etag_matches(local_path, etag)
+
+def download_s3_folder(bucket_name: str, local_dir: str, s3_prefix: str = '', sync: bool = True,
+                       max_workers: int = None, postprocess=None) -> dict:
     """
     Download all files from an S3 bucket or folder to a local directory.
 
@@ -93,44 +414,94 @@ def download_s3_folder(bucket_name: str, local_dir: str, s3_prefix: str = ''):
         local_dir: Local directory path to download files to
         s3_prefix: S3 prefix/folder path (e.g., 'folder/subfolder/').
                    Default is '' which downloads the entire bucket.
+        sync: Skip files whose local copy is unchanged. Files downloaded by a previous run are
+              checked against the manifest (local_dir/.s3sync: ETag plus local size/mtime),
+              other files by size and MD5 vs ETag. False downloads everything.
+        max_workers: Concurrent downloads (default: DOWNLOAD_MAX_WORKERS)
+        postprocess: Optional callable(local_path) run on each downloaded file before it is
+                     recorded in the manifest (e.g. re-indenting JSON)
+
+    Returns:
+        dict: {'transferred', 'transferred_bytes', 'skipped', 'skipped_bytes',
+               'failed': [{'key', 'error'}], 'downloaded': [relative paths], 'elapsed_ms'}
     """
-    import os
-    s3 = boto3.client('s3')
+    s3 = get_s3()
+    started = time.perf_counter()
+    summary = {'transferred': 0, 'transferred_bytes': 0, 'skipped': 0, 'skipped_bytes': 0,
+               'failed': [], 'downloaded': []}
 
     # Ensure local directory exists
-    if not os.path.exists(local_dir):
-        os.makedirs(local_dir)
-
-    # List all objects with the given prefix
+    os.makedirs(local_dir, exist_ok=True)
+    manifest = _load_sync_manifest(local_dir) if sync else {}
+    new_manifest = {}
+    listed = 0
+
+    def download(key, relative_path, local_file_path, obj):
+        # Create subdirectories if needed
+        local_file_dir = os.path.dirname(local_file_path)
+        if local_file_dir:
+            os.makedirs(local_file_dir, exist_ok=True)
+        s3.download_file(bucket_name, key, local_file_path)
+        _decode_local_file(local_file_path)
+        if postprocess is not None:
+            postprocess(local_file_path)
+        stat = os.stat(local_file_path)
+        return {'etag': obj.get('ETag', '').strip('"'), 'size': obj['Size'],
+                'local_size': stat.st_size, 'local_mtime_ns': stat.st_mtime_ns}
+
+    # List all objects with the given prefix (every page; an empty page no longer ends the listing)
     paginator = s3.get_paginator('list_objects_v2')
-
-    for page in paginator.paginate(Bucket=bucket_name, Prefix=s3_prefix):
-        if 'Contents' not in page:
-            print(f"No files found in {s3_prefix}")
-            return
-
-        for obj in page['Contents']:
-            key = obj['Key']
-
-            # Skip if it's just the folder itself
-            if key.endswith('/'):
+    with ThreadPoolExecutor(max_workers=max(1, max_workers or DOWNLOAD_MAX_WORKERS)) as executor:
+        futures = {}
+        for page in paginator.paginate(Bucket=bucket_name, Prefix=s3_prefix):
+            for obj in page.get('Contents', []):
+                key = obj['Key']
+
+                # Skip if it's just the folder itself
+                if key.endswith('/'):
+                    continue
+                listed += 1
+
+                # Get relative path from prefix
+                relative_path = key[len(s3_prefix):].lstrip('/')
+                local_file_path = os.path.join(local_dir, relative_path)
+
+                entry = manifest.get(relative_path)
+                if sync and _is_synced(local_file_path, obj, entry):
+                    summary['skipped'] += 1
+                    summary['skipped_bytes'] += obj['Size']
+                    new_manifest[relative_path] = entry or {
+                        'etag': obj.get('ETag', '').strip('"'), 'size': obj['Size'],
+                        'local_size': obj['Size'], 'local_mtime_ns': os.stat(local_file_path).st_mtime_ns}
+                    continue
+
+                future = executor.submit(download, key, relative_path, local_file_path, obj)
+                futures[future] = (key, relative_path, obj)
+
+        for future in as_completed(futures):
+            key, relative_path, obj = futures[future]
+            try:
+                new_manifest[relative_path] = future.result()
+            except Exception as e:
+                print(f"Error downloading {key}: {e}")
+                summary['failed'].append({'key': key, 'error': str(e)})
                 continue
-
-            # Get relative path from prefix
-            relative_path = key[len(s3_prefix):].lstrip('/')
-            local_file_path = os.path.join(local_dir, relative_path)
-
-            # Create subdirectories if needed
-            local_file_dir = os.path.dirname(local_file_path)
-            if local_file_dir and not os.path.exists(local_file_dir):
-                os.makedirs(local_file_dir)
-
-            # Download file
-            # print(f"Downloading: {key} -> {local_file_path}")
-            s3.download_file(bucket_name, key, local_file_path)
-
-    print(f"Download {len(page['Contents'])} complete: {local_dir}")
-    
+            summary['transferred'] += 1
+            summary['transferred_bytes'] += obj['Size']
+            summary['downloaded'].append(relative_path)
+
+    if not listed:
+        print(f"No files found in {s3_prefix}")
+    elif sync:
+        json_codec.dump_file(os.path.join(local_dir, SYNC_MANIFEST_NAME),
+                             {'bucket': bucket_name, 'prefix': s3_prefix, 'files': new_manifest}, pretty=False)
+
+    summary['downloaded'].sort()
+    summary['elapsed_ms'] = round((time.perf_counter() - started) * 1000, 1)
+    print(f"Download {summary['transferred']} ({summary['transferred_bytes']:,} bytes), "
+          f"skipped {summary['skipped']}, failed {len(summary['failed'])} "
+          f"in {summary['elapsed_ms']}ms: {local_dir}")
+    return summary
 
 def load_s3_json(bucket_name: str, s3_key: str, src_folder: str = None):
   """
@@ -145,7 +516,7 @@ def load_s3_json(bucket_name: str, s3_key: str, src_folder: str = None):
     dict: Parsed JSON content
   """
   
-  s3 = boto3.client('s3')
+  s3 = get_s3()
   
   if src_folder:
     # Create folder if it doesn't exist
@@ -163,10 +534,10 @@ def load_s3_json(bucket_name: str, s3_key: str, src_folder: str = None):
       # Download file to specified location
       print(f"Downloading: {s3_key} from bucket: {bucket_name}")
       s3.download_file(bucket_name, s3_key, local_path)
+      _decode_local_file(local_path)
       
       # Read and parse JSON
-      with open(local_path, 'r', encoding='utf-8') as f:
-        json_content = json.load(f)
+      json_content = json_codec.load_file(local_path)
       
       print(f"Successfully loaded and saved JSON to {local_path}")
       return json_content
@@ -180,15 +551,14 @@ def load_s3_json(bucket_name: str, s3_key: str, src_folder: str = None):
   
 def save_s3_json(data, bucket_name, s3_key, src_folder):
   """Save JSON data to S3 bucket"""
-  s3_client = boto3.client('s3')
+  s3_client = get_s3()
   
   # Create local file path for backup
   local_file_path = os.path.join(src_folder, s3_key)
   os.makedirs(os.path.dirname(local_file_path), exist_ok=True)
   
   # Save JSON to local file first
-  with open(local_file_path, 'w', encoding='utf8') as f:
-    json.dump(data, f, ensure_ascii=False, indent=2)
+  json_codec.dump_file(local_file_path, data)
   
   # Upload to S3
   try:
@@ -236,14 +606,18 @@ def copy_files_from_downloaded2upload(src_folder, dest_folder):
         
     print(f"{len(files)} files copied from {src_folder} to {dest_folder} successfully.")
     
+def _fix_korean_file(path):
+  """JSON 파일 하나를 한글 그대로(ensure_ascii=False), indent=2로 다시 저장"""
+  with open(path, 'rb') as fp:
+    data = json_codec.loads(decode_body(fp.read()))
+  json_codec.dump_file(path, data)
+
 def fix_korean_json(folder):
   for f in os.listdir(folder):
     if f.endswith('.json'):
-      path = os.path.join(folder, f)
-      data = json.load(open(path, encoding='utf-8'))
-      json.dump(data, open(path, 'w', encoding='utf-8'), ensure_ascii=False, indent=2)
+      _fix_korean_file(os.path.join(folder, f))
 
-def load_course_from_s3(bucket_name: str, course_id: str, grp_name: str = 'dsgeoadmin'):
+def load_course_from_s3(bucket_name: str, course_id: str, grp_name: str = 'dsgeoadmin', use_cache: bool = False):
   """
   S3에서 코스 GeoJSON 데이터를 로드하여 JSON dict로 반환.
 
@@ -251,23 +625,29 @@ def load_course_from_s3(bucket_name: str, course_id: str, grp_name: str = 'dsgeo
     bucket_name: S3 버킷 이름 (예: 'dsgeousergrp')
     course_id: 코스 ID (예: 'TGC001')
     grp_name: 그룹 폴더명 (기본값: 'dsgeoadmin')
+    use_cache: 읽기 전용으로 코스 캐시 사용 (기본값: False, 호출마다 새 dict)
 
   Returns:
     dict: GeoJSON 형식의 코스 데이터
+          use_cache=True이면 load_course_cached의 공유 객체(ETag로 재검증)이므로 수정하지 말 것
+          (같은 객체라서 get_location_from_gps의 코스 인덱스도 재사용됨)
     
-  # 코스 데이터 로드
+  # 코스 데이터 로드 (수정해도 됨)
 data = load_course_from_s3('dsgeousergrp', 'TGC001')
 
 # grp_name 지정 가능
 data = load_course_from_s3('dsgeousergrp', 'TGC001', grp_name='dsgeoadmin')
+
+# 반복 조회/GPS 위치 찾기처럼 읽기만 할 때는 캐시 공유 객체 사용
+data = load_course_from_s3('dsgeousergrp', 'TGC001', use_cache=True)
   """
-  s3 = boto3.client('s3')
   s3_key = f'{grp_name}/coursegeojson/{course_id}.json'
 
   try:
-    content_object = s3.get_object(Bucket=bucket_name, Key=s3_key)
-    file_content = content_object['Body'].read().decode('utf-8')
-    json_content = json.loads(file_content)
+    if use_cache:
+      return load_course_cached(bucket_name, s3_key)
+    content_object = get_s3().get_object(Bucket=bucket_name, Key=s3_key)
+    json_content = json_codec.loads(decode_body(content_object['Body'].read()))
     return json_content
   except Exception as e:
     print(f"Error loading {s3_key} from {bucket_name}: {e}")
@@ -289,13 +669,12 @@ def load_baseinfo_from_s3(bucket_name: str, file_name: str, subfolder: str = 'co
     data = load_baseinfo_from_s3('dsgeousergrp', 'course_info.json')
     data = load_baseinfo_from_s3('dsgeousergrp', 'area_def.json', subfolder='geo')
   """
-  s3 = boto3.client('s3')
+  s3 = get_s3()
   s3_key = f'{subfolder}/{file_name}'
 
   try:
     content_object = s3.get_object(Bucket=bucket_name, Key=s3_key)
-    file_content = content_object['Body'].read().decode('utf-8')
-    json_content = json.loads(file_content)
+    json_content = json_codec.loads(decode_body(content_object['Body'].read()))
     return json_content
   except Exception as e:
     print(f"Error loading {s3_key} from {bucket_name}: {e}")
@@ -316,8 +695,11 @@ def get_location_from_gps(crs_geojson: dict, gps: dict) -> list:
 
   Example:
     locations = get_location_from_gps(crs_geojson, gps)
+
+  crs_geojson을 제자리에서 수정했다면 dsgreen.location_index.evict_location_index(crs_geojson) 호출
+  (clean_and_normalize_features는 자동으로 처리)
   """
-  from shapely.geometry import Point, shape
+  from dsgreen.location_index import get_location_index
 
   lng = float(gps.get('longitude', 0))
   lat = float(gps.get('latitude', 0))
@@ -325,33 +707,21 @@ def get_location_from_gps(crs_geojson: dict, gps: dict) -> list:
   if lng == 0 or lat == 0:
     return []
 
-  point = Point(lng, lat)
-  results = []
-
-  for feature in crs_geojson.get('features', []):
-    try:
-      polygon = shape(feature['geometry'])
-      if polygon.contains(point):
-        props = feature.get('properties', {})
-        results.append({
-          'Hole': int(props.get('Hole', 0)) if props.get('Hole') is not None else 0,
-          'Area': props.get('Type', ''),
-          'Client': props.get('Client', ''),
-          'Course': props.get('Course', '')
-        })
-    except Exception:
-      continue
+  # 코스별 STRtree 인덱스는 한 번만 만들고 같은 crs_geojson이면 재사용
+  return get_location_index(crs_geojson).lookup(lng, lat)
 
-  return results
-
-def get_best_location_from_gps(crs_geojson: dict, gps: dict, priority: list = None) -> dict:
+def get_best_location_from_gps(crs_geojson: dict, gps: dict, priority: list = None, stats: dict = None) -> dict:
   """
   GPS 좌표를 기반으로 우선순위에 따라 가장 적합한 location 정보를 반환.
 
+  코스 인덱스에서 bbox 후보를 우선순위 순서로 검사하고 처음 포함되는 feature에서 멈춤
+  (모든 포함 polygon을 모은 뒤 고르던 것과 결과 동일).
+
   Args:
     crs_geojson: 코스 GeoJSON 데이터 (features 포함)
     gps: GPS 정보 dict (longitude, latitude 필수)
     priority: Area 우선순위 리스트 (기본값: ['홀영역', '그린', '지역', '코스', '전면'])
+    stats: 프로파일링용 dict - 주면 {'candidates': bbox 후보 수, 'tests': contains 검사 수}를 채움
 
   Returns:
     dict: 우선순위가 가장 높은 location 정보 {'Hole': int, 'Area': str, 'Client': str, 'Course': str}
@@ -361,21 +731,115 @@ def get_best_location_from_gps(crs_geojson: dict, gps: dict, priority: list = No
     location = get_best_location_from_gps(crs_geojson, gps)
     location = get_best_location_from_gps(crs_geojson, gps, priority=['그린', '홀영역', '코스'])
   """
+  from dsgreen.location_index import get_location_index
+
   if priority is None:
     priority = ['홀영역', '그린', '지역', '코스', '전면']
 
-  locations = get_location_from_gps(crs_geojson, gps)
+  lng = float(gps.get('longitude', 0))
+  lat = float(gps.get('latitude', 0))
 
-  if not locations:
+  if lng == 0 or lat == 0:
+    if stats is not None:
+      stats.update(candidates=0, tests=0)
     return None
 
-  for area_type in priority:
-    for loc in locations:
-      if loc.get('Area') == area_type:
-        return loc
+  return get_location_index(crs_geojson).best_location(lng, lat, priority, stats=stats)
+
+def get_best_locations_from_gps(crs_geojson: dict, longitudes, latitudes, priority: list = None) -> list:
+  """
+  여러 GPS 좌표를 한 번에 처리하는 get_best_location_from_gps (같은 코스의 점들).
+
+  shapely 2 벡터 predicate로 모든 점을 한 번에 조회하고 우선순위 규칙은 get_best_location_from_gps와 동일.
+
+  Args:
+    crs_geojson: 코스 GeoJSON 데이터 (features 포함)
+    longitudes, latitudes: 경도/위도 배열 (list, numpy array, pandas Series, Decimal 가능)
+    priority: Area 우선순위 리스트 (기본값: ['홀영역', '그린', '지역', '코스', '전면'])
+
+  Returns:
+    list: 점마다 {'Hole': int, 'Area': str, 'Client': str, 'Course': str} 또는 None
+
+  Example:
+    locations = get_best_locations_from_gps(crs_geojson, [r['gps']['longitude'] for r in records],
+                                            [r['gps']['latitude'] for r in records])
+  """
+  from dsgreen.location_index import get_location_index
+
+  index = get_location_index(crs_geojson)
+  return index.records_for(index.best_locations(longitudes, latitudes, priority))
+
+def assign_locations_to_df(crs_geojson: dict, df, lng_col: str = 'longitude', lat_col: str = 'latitude',
+                           priority: list = None):
+  """
+  DataFrame의 경도/위도 컬럼으로 Hole/Area/Client/Course 컬럼을 채운 복사본을 반환.
 
-  # 우선순위에 없는 Area가 있으면 첫번째 반환
-  return locations[0] if locations else None
+  위치를 찾지 못한 행은 Hole=0, Area/Client/Course=None.
+
+  Example:
+    df = assign_locations_to_df(crs_geojson, df)
+    df = assign_locations_to_df(crs_geojson, df, lng_col='lng', lat_col='lat', priority=['그린', '홀영역'])
+  """
+  from dsgreen.location_index import get_location_index
+
+  index = get_location_index(crs_geojson)
+  best = index.best_locations(df[lng_col].to_numpy(dtype=float), df[lat_col].to_numpy(dtype=float), priority)
+  missing = {'Hole': 0, 'Area': None, 'Client': None, 'Course': None}
+  columns = {key: [index.records[i][key] if i >= 0 else default for i in best]
+             for key, default in missing.items()}
+  return df.assign(**columns)
+
+def _evict_location_index(features):
+    """features(또는 코스 dict)로 만든 위치 인덱스 캐시 제거 (location_index를 아직 import하지 않았으면 캐시도 없음)"""
+    location_index = sys.modules.get('dsgreen.location_index')
+    if location_index is not None:
+        location_index.evict_location_index(features)
+
+_MISSING = object()  # 변환 표 조회용 (값이 None인 key와 구분)
+
+def _property_default_factory(default_value):
+    """기본값 생성 함수 (list는 feature마다 새 복사본)"""
+    if isinstance(default_value, list):
+        return default_value.copy
+    return lambda: default_value
+
+def _property_coercer(default_value):
+    """
+    default_value 타입으로의 변환 함수 (값이 그 타입이 아닐 때만 호출).
+
+    list는 문자열이면 json.loads, 아니면 list() (비어 있으면 기본값), float/int/str은 생성자로 변환하고
+    변환할 수 없으면(ValueError/TypeError/JSONDecodeError) 기본값. 그 밖의 타입은 값을 그대로 둠.
+    """
+    make_default = _property_default_factory(default_value)
+    expected_type = type(default_value)
+
+    if expected_type == list:
+        def coerce(value):
+            try:
+                if isinstance(value, str):
+                    return json.loads(value)
+                return list(value) if value else make_default()
+            except (ValueError, TypeError, json.JSONDecodeError):
+                return make_default()
+    elif expected_type in (float, int, str):
+        def coerce(value):
+            try:
+                return expected_type(value)
+            except (ValueError, TypeError):
+                return make_default()
+    else:
+        def coerce(value):
+            return value
+    return coerce
+
+def _compile_property_table(default_props: dict) -> list:
+    """
+    default_props -> [(key, 기대 타입, 변환 함수, 기본값 생성 함수)] (default_props 순서).
+
+    feature마다 type(default_value)와 if/elif 변환 분기를 다시 구하지 않도록 코스(파일)마다 한 번만 만들어 씀.
+    """
+    return [(key, type(default_value), _property_coercer(default_value), _property_default_factory(default_value))
+            for key, default_value in default_props.items()]
 
 def clean_and_normalize_features(features, default_props, mapdscourseid=None):
     """
@@ -392,6 +856,8 @@ def clean_and_normalize_features(features, default_props, mapdscourseid=None):
         default_props: 기본 properties 딕셔너리
         mapdscourseid: 모든 feature에 적용할 mapdscourseid (선택사항)
     """
+    table = _compile_property_table(default_props)
+
     # Client별 mapdscourseid 매핑 생성 (mapdscourseid 파라미터가 없을 때만 사용)
     client_to_courseid = {}
     if not mapdscourseid:
@@ -409,33 +875,14 @@ def clean_and_normalize_features(features, default_props, mapdscourseid=None):
         current_props = feature['properties']
         cleaned_props = {}
         
-        # 1. default_props의 키만 유지하고 기본값 채우기
-        for key, default_value in default_props.items():
-            if key in current_props:
-                value = current_props[key]
-                
-                # 2. 타입 변환
-                expected_type = type(default_value)
-                if not isinstance(value, expected_type):
-                    try:
-                        if expected_type == list:
-                            if isinstance(value, str):
-                                value = json.loads(value)
-                            else:
-                                value = list(value) if value else default_value.copy()
-                        elif expected_type == float:
-                            value = float(value)
-                        elif expected_type == int:
-                            value = int(value)
-                        elif expected_type == str:
-                            value = str(value)
-                    except (ValueError, TypeError, json.JSONDecodeError):
-                        value = default_value.copy() if isinstance(default_value, list) else default_value
-                
-                cleaned_props[key] = value
-            else:
-                # 기본값 사용
-                cleaned_props[key] = default_value.copy() if isinstance(default_value, list) else default_value
+        # 1. default_props의 키만 유지하고 기본값 채우기, 2. 타입이 다르면 key별 변환 함수로 변환
+        for key, expected_type, coerce, make_default in table:
+            value = current_props.get(key, _MISSING)
+            if value is _MISSING:
+                value = make_default()
+            elif type(value) is not expected_type and not isinstance(value, expected_type):
+                value = coerce(value)
+            cleaned_props[key] = value
         
         # 3. mapdscourseid 처리
         if mapdscourseid:
@@ -448,6 +895,9 @@ def clean_and_normalize_features(features, default_props, mapdscourseid=None):
                 cleaned_props['mapdscourseid'] = client_to_courseid[client]
         
         feature['properties'] = cleaned_props
+
+    # 이 features로 만든 위치 인덱스는 이전 properties(Hole/Type/Client/Course)를 들고 있으므로 버림
+    _evict_location_index(features)
     
     print(f"Processed {len(features)} features")
     print(f"Properties keys: {list(default_props.keys())}")
@@ -463,13 +913,11 @@ def clean_and_normalize_json_file(file_path, default_props, mapdscourseid=None):
         default_props: 기본 properties 딕셔너리
         mapdscourseid: 모든 feature에 적용할 mapdscourseid (선택사항)
     """
-    with open(file_path, 'r', encoding='utf8') as f:
-        json_content = json.load(f)
+    json_content = json_codec.load_file(file_path)
     
     features = clean_and_normalize_features(json_content['features'], default_props, mapdscourseid)
 
-    with open(file_path, 'w', encoding='utf8') as f:
-        json.dump(json_content, f, ensure_ascii=False, indent=2)
+    json_codec.dump_file(file_path, json_content)
 
     print(f"Updated: {file_path} ({len(features)} features)")
     
@@ -479,11 +927,17 @@ def download_baseinfo(base_folder):
 
     Args:
         base_folder: 다운로드할 로컬 폴더 경로
+
+    Returns:
+        dict: prefix별 download_s3_folder 결과 요약
     """
     prefixes = ['common/', 'geo/', 'outrecord/', 'work/']
+    summaries = {}
     for prefix in prefixes:
-        download_s3_folder(bucket_name='dsbaseinfo', s3_prefix=prefix, local_dir=base_folder+'/'+prefix)
-        fix_korean_json(base_folder+'/'+prefix)
+        # 바뀐 파일만 받아서 받은 파일만 한글 인코딩 수정 (이미 같은 파일은 건너뜀)
+        summaries[prefix] = download_s3_folder(bucket_name='dsbaseinfo', s3_prefix=prefix, local_dir=base_folder+'/'+prefix,
+                                               postprocess=_fix_korean_file)
+    return summaries
 
 def download_course_geojson(grp_name, geojson_folder):
   
@@ -494,9 +948,12 @@ def download_course_geojson(grp_name, geojson_folder):
     Args:
         grp_name: 그룹 이름 (예: 'dsgeoadmin')
         geojson_folder: 다운로드할 로컬 폴더 경로
+
+    Returns:
+        dict: download_s3_folder 결과 요약
     """
-    download_s3_folder(bucket_name='dsgeousergrp', s3_prefix=grp_name+'/coursegeojson/', local_dir=geojson_folder)
-    fix_korean_json(geojson_folder)
+    return download_s3_folder(bucket_name='dsgeousergrp', s3_prefix=grp_name+'/coursegeojson/', local_dir=geojson_folder,
+                              postprocess=_fix_korean_file)
 
 def updateMGCbaseinfoFromFile(out_folder):
     """
@@ -514,7 +971,7 @@ def updateMGCbaseinfoFromFile(out_folder):
         print(file)
     
     # Upload files to S3
-    s3_client = boto3.client('s3')
+    s3_client = get_s3()
     bucket_name = 'dsbaseinfo'
     
     for file in file_list:
@@ -544,7 +1001,7 @@ def updateTGCbaseinfoFromFile(out_folder):
         print(file)
 
     # Upload files to S3
-    s3_client = boto3.client('s3')
+    s3_client = get_s3()
     bucket_name = 'dsbaseinfo'
 
     for file in file_list:
@@ -558,9 +1015,6 @@ def updateTGCbaseinfoFromFile(out_folder):
             print(f"Error uploading {file}: {e}")
 
 
-import re
-from botocore.exceptions import ClientError
-
 def load_default_feature_properties(file_path: str = './sample_cleanup/default_feature_properties.json') -> dict:
     """
     GeoJSON feature의 기본 properties 템플릿을 로드합니다.
@@ -574,8 +1028,7 @@ def load_default_feature_properties(file_path: str = './sample_cleanup/default_f
     Example:
         default_props = load_default_feature_properties()
     """
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return json_codec.load_file(file_path)
 
 
 def get_available_dates(src_folder: str) -> list:
@@ -622,6 +1075,131 @@ def get_available_dates(src_folder: str) -> list:
     return available_dates
 
 
+def _list_remote_objects(bucket_name: str, prefix: str) -> dict:
+    """prefix 아래 {S3 key: {'etag', 'size'}} (페이지 단위 목록 조회 1회)"""
+    remote = {}
+    paginator = get_s3().get_paginator('list_objects_v2')
+    for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix):
+        for obj in page.get('Contents', []):
+            remote[obj['Key']] = {'etag': obj.get('ETag', '').strip('"'), 'size': obj['Size']}
+    return remote
+
+def _sync_record(local_path: str, bucket_name: str, s3_key: str, manifests: dict):
+    """
+    local_path를 받은 download_s3_folder 기록 {etag, size, local_size, local_mtime_ns} (없으면 None).
+    파일 폴더부터 위로 올라가며 처음 만나는 .s3sync를 사용하고, 기록한 버킷/prefix가 s3_key와 맞을 때만 반환.
+    manifests: 폴더별 .s3sync 내용 캐시
+    """
+    directory = os.path.dirname(os.path.abspath(local_path))
+    while True:
+        if directory not in manifests:
+            try:
+                manifests[directory] = json_codec.load_file(os.path.join(directory, SYNC_MANIFEST_NAME))
+            except (OSError, ValueError):
+                manifests[directory] = None
+        manifest = manifests[directory]
+        if manifest is not None:
+            relative_path = os.path.relpath(os.path.abspath(local_path), directory).replace(os.sep, '/')
+            if manifest.get('bucket') != bucket_name or manifest.get('prefix', '') + relative_path != s3_key:
+                return None
+            return manifest.get('files', {}).get(relative_path)
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return None
+        directory = parent
+
+def _plan_uploads(bucket_name: str, files: dict, max_workers: int = None) -> dict:
+    """
+    files({S3 key: 로컬 경로})를 S3와 비교하여 {'add', 'change', 'identical'} 목록으로 분류.
+
+    원격 ETag는 파일들의 공통 prefix로 한 번만 목록 조회함. download_baseinfo/download_course_geojson으로 받은
+    파일은 받은 뒤 indent=2로 다시 쓰여 MD5가 S3 ETag와 다르므로, .s3sync 기록(받을 때의 ETag, 로컬 크기/수정 시각)과
+    같으면(받은 뒤 수정하지 않았고 S3도 그대로) identical. 기록이 없거나 다르면 로컬 MD5를 병렬로 계산해 비교
+    (크기가 다르면 MD5 계산 없이 change). 각 항목은 {'s3_key', 'local_path', 'size'}.
+    """
+    prefix = os.path.commonprefix(list(files))
+    prefix = prefix[:prefix.rfind('/') + 1]
+    remote = _list_remote_objects(bucket_name, prefix) if files else {}
+    manifests = {}
+    records = {s3_key: _sync_record(local_path, bucket_name, s3_key, manifests) for s3_key, local_path in files.items()}
+
+    def classify(s3_key):
+        local_path = files[s3_key]
+        stat = os.stat(local_path)
+        item = {'s3_key': s3_key, 'local_path': local_path, 'size': stat.st_size}
+        obj = remote.get(s3_key)
+        if obj is None:
+            return 'add', item
+        record = records[s3_key]
+        if record and record.get('etag') == obj['etag'] and record.get('local_size') == stat.st_size \
+                and record.get('local_mtime_ns') == stat.st_mtime_ns:
+            return 'identical', item
+        if obj['size'] == item['size'] and _etag_matches(local_path, obj['etag']):
+            return 'identical', item
+        return 'change', item
+
+    plan = {'add': [], 'change': [], 'identical': []}
+    with ThreadPoolExecutor(max_workers=max(1, max_workers or UPLOAD_MAX_WORKERS)) as executor:
+        for action, item in executor.map(classify, sorted(files)):
+            plan[action].append(item)
+    return plan
+
+def _execute_uploads(bucket_name: str, items: list, max_workers: int = None, uploaded: list = None) -> tuple:
+    """plan의 add/change 항목만 병렬 업로드하고 (성공 수, 실패 수) 반환. uploaded 리스트를 주면 성공한 항목을 채움"""
+    s3_client = get_s3()
+    uploaded_count = 0
+    error_count = 0
+    if not items:
+        return (0, 0)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers or UPLOAD_MAX_WORKERS, len(items)))) as executor:
+        futures = {executor.submit(s3_client.upload_file, item['local_path'], bucket_name, item['s3_key']): item
+                   for item in items}
+        for future in as_completed(futures):
+            item = futures[future]
+            try:
+                future.result()
+                print(f"Uploaded: {item['s3_key']}")
+                uploaded_count += 1
+                if uploaded is not None:
+                    uploaded.append(item)
+            except (ClientError, OSError) as e:
+                print(f"Error uploading {item['local_path']}: {e}")
+                error_count += 1
+    return (uploaded_count, error_count)
+
+def _baseinfo_upload_files(src_folder: str, date_str: str):
+    """baseinfo{date} 폴더의 {S3 key: 로컬 경로} (폴더가 없으면 None)"""
+    baseinfo_folder = os.path.join(src_folder, f'baseinfo{date_str}')
+
+    if not os.path.exists(baseinfo_folder):
+        print(f"baseinfo 폴더가 존재하지 않습니다: {baseinfo_folder}")
+        return None
+
+    files = {}
+    for root, dirs, filenames in os.walk(baseinfo_folder):
+        for file in filenames:
+            if file.endswith('.json'):
+                local_path = os.path.join(root, file)
+                relative_path = os.path.relpath(local_path, baseinfo_folder)
+                files[relative_path.replace('\\', '/')] = local_path
+    return files
+
+
+def _geojson_upload_files(src_folder: str, date_str: str, grp_name: str):
+    """geojson{date} 폴더의 {S3 key: 로컬 경로} (폴더가 없으면 None)"""
+    geojson_folder = os.path.join(src_folder, f'geojson{date_str}')
+
+    if not os.path.exists(geojson_folder):
+        print(f"geojson 폴더가 존재하지 않습니다: {geojson_folder}")
+        return None
+
+    return {
+        f"{grp_name}/coursegeojson/{file}": os.path.join(geojson_folder, file)
+        for file in os.listdir(geojson_folder) if file.endswith('.json')
+    }
+
+
 def upload_baseinfo_to_s3(src_folder: str, date_str: str) -> tuple:
     """
     지정된 날짜의 baseinfo 폴더 내용을 S3 dsbaseinfo 버킷에 업로드합니다.
@@ -632,45 +1210,30 @@ def upload_baseinfo_to_s3(src_folder: str, date_str: str) -> tuple:
 
     Returns:
         tuple: (업로드 성공 수, 실패 수)
+               S3와 내용(MD5/ETag)이 같거나 받은 뒤 수정하지 않은 파일(.s3sync)은 건너뛰고 그 수는 출력만 함
 
     Example:
         upload_baseinfo_to_s3('./Downloaded/dsgeoadmin', '20260112')
     """
-    s3_client = boto3.client('s3')
     bucket_name = 'dsbaseinfo'
 
-    baseinfo_folder = os.path.join(src_folder, f'baseinfo{date_str}')
-
-    if not os.path.exists(baseinfo_folder):
-        print(f"baseinfo 폴더가 존재하지 않습니다: {baseinfo_folder}")
+    files = _baseinfo_upload_files(src_folder, date_str)
+    if files is None:
         return (0, 0)
 
-    uploaded_count = 0
-    error_count = 0
-
-    for root, dirs, files in os.walk(baseinfo_folder):
-        for file in files:
-            if file.endswith('.json'):
-                local_path = os.path.join(root, file)
-                relative_path = os.path.relpath(local_path, baseinfo_folder)
-                s3_key = relative_path.replace('\\', '/')
-
-                try:
-                    s3_client.upload_file(local_path, bucket_name, s3_key)
-                    print(f"Uploaded: {s3_key}")
-                    uploaded_count += 1
-                except ClientError as e:
-                    print(f"Error uploading {local_path}: {e}")
-                    error_count += 1
+    plan = _plan_uploads(bucket_name, files)
+    skipped_count = len(plan['identical'])
+    uploaded_count, error_count = _execute_uploads(bucket_name, plan['add'] + plan['change'])
 
     print(f"\n=== baseinfo 업로드 완료 ===")
-    print(f"성공: {uploaded_count}개, 실패: {error_count}개")
+    print(f"성공: {uploaded_count}개, 실패: {error_count}개, 동일하여 건너뜀: {skipped_count}개")
     return (uploaded_count, error_count)
 
 
 def upload_geojson_to_s3(src_folder: str, date_str: str, grp_name: str = 'dsgeoadmin') -> tuple:
     """
     지정된 날짜의 geojson 폴더 내용을 S3 dsgeousergrp 버킷에 업로드합니다.
+    업로드한 코스마다 GeoParquet 사본({grp_name}/coursegeoparquet/)도 저장합니다 (COURSE_GEOPARQUET=0이면 생략).
 
     Args:
         src_folder: Downloaded/{grp_name} 폴더 경로
@@ -679,64 +1242,117 @@ def upload_geojson_to_s3(src_folder: str, date_str: str, grp_name: str = 'dsgeoa
 
     Returns:
         tuple: (업로드 성공 수, 실패 수)
+               S3와 내용(MD5/ETag)이 같거나 받은 뒤 수정하지 않은 파일(.s3sync)은 건너뛰고 그 수는 출력만 함
 
     Example:
         upload_geojson_to_s3('./Downloaded/dsgeoadmin', '20260112', 'dsgeoadmin')
     """
-    s3_client = boto3.client('s3')
     bucket_name = 'dsgeousergrp'
 
-    geojson_folder = os.path.join(src_folder, f'geojson{date_str}')
-
-    if not os.path.exists(geojson_folder):
-        print(f"geojson 폴더가 존재하지 않습니다: {geojson_folder}")
+    files = _geojson_upload_files(src_folder, date_str, grp_name)
+    if files is None:
         return (0, 0)
 
-    uploaded_count = 0
-    error_count = 0
-
-    for file in os.listdir(geojson_folder):
-        if file.endswith('.json'):
-            local_path = os.path.join(geojson_folder, file)
-            s3_key = f"{grp_name}/coursegeojson/{file}"
-
-            try:
-                s3_client.upload_file(local_path, bucket_name, s3_key)
-                print(f"Uploaded: {s3_key}")
-                uploaded_count += 1
-            except ClientError as e:
-                print(f"Error uploading {local_path}: {e}")
-                error_count += 1
+    plan = _plan_uploads(bucket_name, files)
+    skipped_count = len(plan['identical'])
+    uploaded = []
+    uploaded_count, error_count = _execute_uploads(bucket_name, plan['add'] + plan['change'], uploaded=uploaded)
+    _upload_geoparquet_siblings(bucket_name, uploaded)
 
     print(f"\n=== geojson 업로드 완료 ===")
-    print(f"성공: {uploaded_count}개, 실패: {error_count}개")
+    print(f"성공: {uploaded_count}개, 실패: {error_count}개, 동일하여 건너뜀: {skipped_count}개")
     return (uploaded_count, error_count)
 
 
-def reset_to_date(src_folder: str, date_str: str, grp_name: str = 'dsgeoadmin'):
+def plan_reset_to_date(src_folder: str, date_str: str, grp_name: str = 'dsgeoadmin', max_workers: int = None) -> dict:
     """
-    지정된 날짜의 baseinfo와 geojson을 모두 S3에 업로드하여 해당 날짜로 리셋합니다.
+    reset_to_date가 할 일을 S3에 쓰지 않고 계산합니다.
+
+    버킷 prefix마다 목록 조회 1회(파일별 HEAD 없음)로 원격 ETag를 얻어 다운로드 기록(.s3sync) 또는 로컬 MD5와 비교합니다.
+    받은 뒤 수정하지 않은 스냅샷은 (S3가 그 뒤로 바뀌지 않았다면) 전부 identical입니다.
+
+    Returns:
+        dict: {'baseinfo': plan, 'geojson': plan}
+              plan = {'bucket', 'add': [...], 'change': [...], 'identical': [...]},
+              항목은 {'s3_key', 'local_path', 'size'}
+    """
+    plans = {}
+    targets = [
+        ('baseinfo', 'dsbaseinfo', _baseinfo_upload_files(src_folder, date_str)),
+        ('geojson', 'dsgeousergrp', _geojson_upload_files(src_folder, date_str, grp_name)),
+    ]
+    for name, bucket_name, files in targets:
+        plan = _plan_uploads(bucket_name, files, max_workers=max_workers) if files else \
+            {'add': [], 'change': [], 'identical': []}
+        plans[name] = {'bucket': bucket_name, **plan}
+    return plans
+
+
+def _print_reset_plan(plans: dict, show_files: int = 50):
+    """plan_reset_to_date 결과 출력 (추가/변경 파일은 show_files개까지 나열)"""
+    for name, plan in plans.items():
+        changed_bytes = sum(item['size'] for item in plan['add'] + plan['change'])
+        print(f"[{name}] s3://{plan['bucket']}  추가 {len(plan['add'])}개, 변경 {len(plan['change'])}개, "
+              f"동일 {len(plan['identical'])}개 (업로드 {changed_bytes:,} bytes)")
+        listed = [('+', item) for item in plan['add']] + [('~', item) for item in plan['change']]
+        for mark, item in listed[:show_files]:
+            print(f"  {mark} {item['s3_key']} ({item['size']:,} bytes)")
+        if len(listed) > show_files:
+            print(f"  ... 외 {len(listed) - show_files}개")
+
+
+def reset_to_date(src_folder: str, date_str: str, grp_name: str = 'dsgeoadmin', dry_run: bool = False,
+                  max_workers: int = None) -> dict:
+    """
+    지정된 날짜의 baseinfo와 geojson을 S3에 업로드하여 해당 날짜로 리셋합니다.
+
+    먼저 plan(추가/변경/동일)을 만들어 출력한 뒤, 추가/변경된 파일만 max_workers개씩 동시에 업로드합니다.
 
     Args:
         src_folder: Downloaded/{grp_name} 폴더 경로
         date_str: 날짜 문자열 (YYYYMMDD)
         grp_name: 그룹명 (기본값: 'dsgeoadmin')
+        dry_run: True이면 plan만 출력하고 업로드하지 않음
+        max_workers: 동시 업로드/MD5 계산 수 (기본값: UPLOAD_MAX_WORKERS)
+
+    Returns:
+        dict: {'plan': plan_reset_to_date 결과, 'baseinfo': (성공, 실패, 건너뜀), 'geojson': (성공, 실패, 건너뜀)}
+              (dry_run이면 'plan'만)
 
     Example:
+        reset_to_date('./Downloaded/dsgeoadmin', '20260112', 'dsgeoadmin', dry_run=True)
         reset_to_date('./Downloaded/dsgeoadmin', '20260112', 'dsgeoadmin')
     """
-    print(f"===== {date_str} 날짜로 리셋 시작 =====\n")
+    print(f"===== {date_str} 날짜로 리셋 {'계획 (dry run)' if dry_run else '시작'} =====\n")
 
-    print("[1/2] baseinfo 업로드 중...")
-    base_result = upload_baseinfo_to_s3(src_folder, date_str)
+    plans = plan_reset_to_date(src_folder, date_str, grp_name, max_workers=max_workers)
+    _print_reset_plan(plans)
+    if not any(plan['add'] or plan['change'] for plan in plans.values()):
+        print("변경 없음: S3가 이미 이 날짜의 내용과 같습니다.")
     print()
 
-    print("[2/2] geojson 업로드 중...")
-    geo_result = upload_geojson_to_s3(src_folder, date_str, grp_name)
-    print()
+    result = {'plan': plans}
+    if dry_run:
+        return result
 
+    for step, name in enumerate(plans, start=1):
+        plan = plans[name]
+        changes = plan['add'] + plan['change']
+        print(f"[{step}/{len(plans)}] {name} 업로드 중... ({len(changes)}개)")
+        uploaded = []
+        uploaded_count, error_count = _execute_uploads(plan['bucket'], changes, max_workers=max_workers,
+                                                       uploaded=uploaded)
+        if name == 'geojson':
+            _upload_geoparquet_siblings(plan['bucket'], uploaded, max_workers=max_workers)
+        result[name] = (uploaded_count, error_count, len(plan['identical']))
+        print()
+
+    base_result, geo_result = result['baseinfo'], result['geojson']
     print(f"===== {date_str} 날짜로 리셋 완료 =====")
-    print(f"총 업로드: baseinfo {base_result[0]}개, geojson {geo_result[0]}개")
+    print(f"총 업로드: baseinfo {base_result[0]}개, geojson {geo_result[0]}개 "
+          f"(실패: baseinfo {base_result[1]}개, geojson {geo_result[1]}개 / "
+          f"동일하여 건너뜀: baseinfo {base_result[2]}개, geojson {geo_result[2]}개)")
+    return result
 
 
 def extract_types_from_geojson(geojson_path: str) -> list:
@@ -750,8 +1366,7 @@ def extract_types_from_geojson(geojson_path: str) -> list:
         list: 정렬된 Type 값 리스트
     """
     try:
-        with open(geojson_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = json_codec.load_file(geojson_path)
 
         types_found = set()
         if 'features' in data:
@@ -785,8 +1400,7 @@ def update_type_created_from_geojson(baseinfo_path: str, geojson_folder: str, pr
         # 모두 처리
         data = update_type_created_from_geojson(baseinfo_path, geojson_folder)
     """
-    with open(baseinfo_path, 'r', encoding='utf-8') as f:
-        baseinfo_data = json.load(f)
+    baseinfo_data = json_codec.load_file(baseinfo_path)
 
     updated_count = 0
     not_found_count = 0
@@ -815,8 +1429,7 @@ def update_type_created_from_geojson(baseinfo_path: str, geojson_folder: str, pr
             print(f"  Geojson not found: {course_id}")
 
     # 파일 저장
-    with open(baseinfo_path, 'w', encoding='utf-8') as f:
-        json.dump(baseinfo_data, f, ensure_ascii=False, indent=2)
+    json_codec.dump_file(baseinfo_path, baseinfo_data)
 
     print(f"=== Type_created 업데이트 완료 ({prefix or 'ALL'}) ===")
     print(f"업데이트: {updated_count}개, 미발견: {not_found_count}개, 스킵: {skipped_count}개")
@@ -855,17 +1468,38 @@ def get_course_files(folder: str, prefix: str, min_num: int = 1, max_num: int =
     return sorted(result)
 
 
-def check_geojson_file(file_path: str, default_props: dict, unwanted_types: list = None) -> dict:
+def _write_json_atomic(file_path: str, data):
+    """임시 파일에 쓴 뒤 교체 (중간에 실패해도 원본이 깨지지 않음, 원본 파일 권한 유지)"""
+    import shutil
+
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(file_path)), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(json_codec.dumps(data, pretty=True))
+        shutil.copymode(file_path, tmp_path)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def check_and_fix_geojson_file(file_path: str, default_props: dict, unwanted_types: list = None, fix: bool = True) -> dict:
     """
-    GeoJSON 파일을 검사하여 문제점을 반환합니다.
+    GeoJSON 파일을 한 번 읽고 feature를 한 번 돌면서 검사하고, fix=True면 같은 루프에서 수정합니다.
+
+    검사 결과는 check_geojson_file, 수정 결과/저장 내용은 fix_geojson_file과 같습니다
+    (검사는 수정 전 properties 기준). 수정할 것이 없으면 파일을 다시 쓰지 않고,
+    쓸 때는 임시 파일에 쓴 뒤 교체합니다.
 
     Args:
         file_path: GeoJSON 파일 경로
         default_props: 기본 properties 템플릿
-        unwanted_types: 허용되지 않는 Type 리스트 (기본값: ['Undefined', '그린B'])
+        unwanted_types: 허용되지 않는(삭제할) Type 리스트 (기본값: ['Undefined', '그린B'])
+        fix: False면 검사만
 
     Returns:
-        dict: 검사 결과 (unwanted_types, missing_keys, type_mismatches, extra_keys, wrong_courseid)
+        dict: {'check': 검사 결과, 'fix': 수정 결과 (fix=False면 None), 'written': 파일을 다시 썼는지}
     """
     from collections import defaultdict
 
@@ -875,7 +1509,7 @@ def check_geojson_file(file_path: str, default_props: dict, unwanted_types: list
     basename = os.path.basename(file_path)
     expected_courseid = basename.replace('.json', '')
 
-    result = {
+    check = {
         'file': basename,
         'expected_courseid': expected_courseid,
         'feature_count': 0,
@@ -885,60 +1519,234 @@ def check_geojson_file(file_path: str, default_props: dict, unwanted_types: list
         'extra_keys': set(),
         'wrong_courseid': defaultdict(int),
     }
+    fixed = {
+        'file': basename,
+        'deleted_features': 0,
+        'fixed_missing_keys': 0,
+        'fixed_extra_keys': 0,
+        'fixed_type_mismatches': 0,
+        'fixed_wrong_courseid': 0,
+    } if fix else None
+    outcome = {'check': check, 'fix': fixed, 'written': False}
 
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = json_codec.load_file(file_path)
     except Exception as e:
-        result['error'] = str(e)
-        return result
+        check['error'] = str(e)
+        if fix:
+            fixed['error'] = str(e)
+        return outcome
+
+    # 기본 properties의 key별 (타입, 타입 이름)과 변환 표 - feature마다 다시 구하지 않도록
+    expected_types = {key: (type(value), type(value).__name__) for key, value in default_props.items()}
+    table = _compile_property_table(default_props)
 
+    changed = 'features' not in data
     features = data.get('features', [])
-    result['feature_count'] = len(features)
+    check['feature_count'] = len(features)
+    kept_features = []
 
     for feature in features:
+        if 'properties' not in feature:
+            changed = True
         props = feature.get('properties', {})
 
-        # 1. Unwanted Type 검사
+        # 검사 (수정 전 상태)
         feature_type = props.get('Type', '')
         if feature_type in unwanted_types:
-            result['unwanted_types'][feature_type] += 1
+            check['unwanted_types'][feature_type] += 1
 
-        # 2. Missing Keys 검사
-        for key in default_props.keys():
+        for key in expected_types:
             if key not in props:
-                result['missing_keys'].add(key)
+                check['missing_keys'].add(key)
 
-        # 3. Type Mismatches & Extra Keys 검사
         for key, value in props.items():
-            if key in default_props:
-                expected_type = type(default_props[key])
-                actual_type = type(value)
-                if expected_type != actual_type:
-                    result['type_mismatches'][key].add(
-                        f"{actual_type.__name__} (expected: {expected_type.__name__})"
-                    )
-            else:
-                result['extra_keys'].add(key)
+            expected = expected_types.get(key)
+            if expected is None:
+                check['extra_keys'].add(key)
+            elif type(value) != expected[0]:
+                check['type_mismatches'][key].add(f"{type(value).__name__} (expected: {expected[1]})")
 
-        # 4. mapdscourseid 검사
         mapdscourseid = props.get('mapdscourseid', '')
         if mapdscourseid != expected_courseid:
-            result['wrong_courseid'][mapdscourseid] += 1
+            check['wrong_courseid'][mapdscourseid] += 1
+
+        if not fix:
+            continue
+
+        # 수정 (fix_geojson_file과 같은 순서)
+        if feature_type in unwanted_types:
+            fixed['deleted_features'] += 1
+            continue
+
+        if props.get('mapdscourseid', '') != expected_courseid:
+            props['mapdscourseid'] = expected_courseid
+            fixed['fixed_wrong_courseid'] += 1
+
+        for key, expected_type, coerce, make_default in table:
+            if key not in props:
+                props[key] = make_default()
+                fixed['fixed_missing_keys'] += 1
+            elif not isinstance(props[key], expected_type):
+                props[key] = coerce(props[key])
+                fixed['fixed_type_mismatches'] += 1
+
+        extra_keys = [k for k in props.keys() if k not in default_props]
+        for key in extra_keys:
+            del props[key]
+            fixed['fixed_extra_keys'] += 1
+
+        feature['properties'] = props
+        kept_features.append(feature)
+
+    if not fix:
+        return outcome
+
+    data['features'] = kept_features
+    if changed or any(count for key, count in fixed.items() if key != 'file'):
+        _write_json_atomic(file_path, data)
+        outcome['written'] = True
+    return outcome
+
+
+def check_geojson_file(file_path: str, default_props: dict, unwanted_types: list = None) -> dict:
+    """
+    GeoJSON 파일을 검사하여 문제점을 반환합니다.
+
+    Args:
+        file_path: GeoJSON 파일 경로
+        default_props: 기본 properties 템플릿
+        unwanted_types: 허용되지 않는 Type 리스트 (기본값: ['Undefined', '그린B'])
 
+    Returns:
+        dict: 검사 결과 (unwanted_types, missing_keys, type_mismatches, extra_keys, wrong_courseid)
+    """
+    return check_and_fix_geojson_file(file_path, default_props, unwanted_types, fix=False)['check']
+
+
+def _check_rules_hash(default_props: dict, unwanted_types: list) -> str:
+    """검사 결과에 영향을 주는 규칙(기본 properties의 key/타입, unwanted_types)의 해시"""
+    rules = {'props': {key: type(value).__name__ for key, value in default_props.items()},
+             'unwanted_types': list(unwanted_types)}
+    return hashlib.md5(json_codec.dumps(rules, sort_keys=True)).hexdigest()
+
+def _check_result_to_json(result: dict) -> dict:
+    """check_geojson_file 결과 -> JSON 저장용 (set은 정렬된 list, wrong_courseid는 [값, 개수] 쌍)"""
+    data = dict(result)
+    data['unwanted_types'] = dict(result['unwanted_types'])
+    data['missing_keys'] = sorted(result['missing_keys'])
+    data['type_mismatches'] = {key: sorted(values) for key, values in result['type_mismatches'].items()}
+    data['extra_keys'] = sorted(result['extra_keys'])
+    data['wrong_courseid'] = [[value, count] for value, count in result['wrong_courseid'].items()]
+    return data
+
+def _check_result_from_json(data: dict) -> dict:
+    """_check_result_to_json의 역변환 (check_geojson_file이 반환하는 것과 같은 타입)"""
+    from collections import defaultdict
+
+    result = dict(data)
+    result['unwanted_types'] = defaultdict(int, data['unwanted_types'])
+    result['missing_keys'] = set(data['missing_keys'])
+    result['type_mismatches'] = defaultdict(set, {key: set(values) for key, values in data['type_mismatches'].items()})
+    result['extra_keys'] = set(data['extra_keys'])
+    result['wrong_courseid'] = defaultdict(int, {value: count for value, count in data['wrong_courseid']})
     return result
 
+def _file_md5(path: str) -> str:
+    digest = hashlib.md5()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _load_check_cache(folder: str, rules_hash: str) -> dict:
+    """{파일명: {'hash', 'size', 'mtime_ns', 'result'}} (캐시가 없거나 규칙이 바뀌었으면 빈 dict)"""
+    try:
+        cache = json_codec.load_file(os.path.join(folder, CHECK_CACHE_NAME))
+    except (OSError, ValueError):
+        return {}
+    return cache.get('files', {}) if cache.get('rules') == rules_hash else {}
+
+def _save_check_cache(folder: str, rules_hash: str, files: dict):
+    """검사 캐시 저장 (읽기 전용 폴더 등으로 쓸 수 없으면 저장하지 않고 넘어감)"""
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=folder, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(json_codec.dumps({'rules': rules_hash, 'files': files}))
+        os.replace(tmp_path, os.path.join(folder, CHECK_CACHE_NAME))
+    except OSError:
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def _run_checks(file_paths: list, default_props: dict, unwanted_types: list, max_workers: int) -> dict:
+    """check_geojson_file을 프로세스 풀로 실행하여 {파일 경로: 결과} 반환 (1개 이하/workers 1이면 현재 프로세스)"""
+    workers = max(1, min(max_workers, len(file_paths)))
+    if workers == 1:
+        return {path: check_geojson_file(path, default_props, unwanted_types) for path in file_paths}
+
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(check_geojson_file, path, default_props, unwanted_types): path
+                   for path in file_paths}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    return results
+
+def _write_check_report(path: str, header: dict, entries: list):
+    """구조화된 검사 리포트 저장. .ndjson이면 첫 줄 header + 파일당 한 줄, 아니면 {**header, 'files': entries}"""
+    if path.endswith('.ndjson'):
+        with open(path, 'wb') as f:
+            f.write(json_codec.dumps({'type': 'header', **header}) + b'\n')
+            for entry in entries:
+                f.write(json_codec.dumps({'type': 'file', **entry}) + b'\n')
+    else:
+        json_codec.dump_file(path, {**header, 'files': entries})
+
+def load_geojson_report(report_path: str) -> dict:
+    """
+    check_geojson_files의 JSON/NDJSON 리포트를 읽어 {**header, 'files': [...]}로 반환.
 
-def check_geojson_files(folder: str, default_props: dict = None, unwanted_types: list = None, prefixes: list = None, save_report: str = None):
+    files의 각 항목: {'file', 'hash', 'size', 'mtime_ns', 'has_problems', 'result'}
+    (result는 check_geojson_file 결과와 같은 타입으로 복원)
+    """
+    if report_path.endswith('.ndjson'):
+        report = {'files': []}
+        with open(report_path, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json_codec.loads(line)
+                if record.pop('type', None) == 'header':
+                    report.update(record)
+                else:
+                    report['files'].append(record)
+    else:
+        report = json_codec.load_file(report_path)
+
+    for entry in report['files']:
+        entry['result'] = _check_result_from_json(entry['result'])
+    return report
+
+def check_geojson_files(folder: str, default_props: dict = None, unwanted_types: list = None, prefixes: list = None, save_report: str = None,
+                        max_workers: int = None, use_cache: bool = True, json_report: str = None):
     """
     폴더 내 모든 GeoJSON 파일을 검사하고 결과를 출력합니다.
 
+    파일은 프로세스 풀로 나눠 검사하고, use_cache=True면 결과를 폴더의 .geojson_check에 내용 해시(MD5)와 함께
+    저장하여 다음 실행 때 내용이 같은 파일(같은 검사 규칙)은 다시 검사하지 않습니다.
+    크기와 수정 시각이 기록과 같은 파일은 해시 계산도 생략합니다. 폴더에 쓸 수 없으면 캐시 없이 검사만 합니다.
+
     Args:
         folder: GeoJSON 파일이 있는 폴더 경로
         default_props: 기본 properties 템플릿 (None이면 자동 로드)
         unwanted_types: 허용되지 않는 Type 리스트
         prefixes: 검사할 prefix 리스트 (기본값: ['MGC', 'TGC'])
         save_report: 결과를 저장할 파일 경로 (None이면 저장 안함)
+        max_workers: 동시 검사 프로세스 수 (기본값: CHECK_MAX_WORKERS, 1이면 현재 프로세스에서 순차 검사)
+        use_cache: False면 캐시를 읽거나 쓰지 않고 모든 파일을 다시 검사 (폴더를 수정하지 않음)
+        json_report: 구조화된 리포트 경로 (.json 또는 .ndjson). 파일별 문제, MD5, 크기, 수정 시각과
+                     검사 규칙을 기록하며 fix_geojsons_from_report가 이것을 읽음 (None이면 저장 안함)
 
     Returns:
         tuple: (all_results, problem_results)
@@ -962,11 +1770,43 @@ def check_geojson_files(folder: str, default_props: dict = None, unwanted_types:
 
     print(f"검사 대상: {' + '.join([f'{p}: {file_counts[p]}개' for p in prefixes])} = 총 {len(all_files)}개")
 
-    # 검사 실행
-    all_results = []
+    # 검사 실행 (내용 해시가 캐시와 같은 파일은 저장된 결과 사용)
+    started = time.perf_counter()
+    rules_hash = _check_rules_hash(default_props, unwanted_types)
+    cache = _load_check_cache(folder, rules_hash) if use_cache else {}
+    file_hashes = {}
+    file_stats = {}
     for file_path in all_files:
-        result = check_geojson_file(file_path, default_props, unwanted_types)
-        all_results.append(result)
+        entry = cache.get(os.path.basename(file_path), {})
+        try:
+            stat = os.stat(file_path)
+            file_stats[file_path] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+            # 크기/수정 시각이 기록과 같으면 해시 계산 생략
+            if entry.get('size') == stat.st_size and entry.get('mtime_ns') == stat.st_mtime_ns:
+                file_hashes[file_path] = entry.get('hash')
+            else:
+                file_hashes[file_path] = _file_md5(file_path)
+        except OSError:
+            file_hashes[file_path] = None
+    hashed = time.perf_counter()
+
+    cached_results = {}
+    for file_path in all_files:
+        entry = cache.get(os.path.basename(file_path))
+        if entry and file_hashes[file_path] is not None and entry.get('hash') == file_hashes[file_path]:
+            cached_results[file_path] = _check_result_from_json(entry['result'])
+    pending = [file_path for file_path in all_files if file_path not in cached_results]
+    workers = max_workers or CHECK_MAX_WORKERS
+    checked_results = _run_checks(pending, default_props, unwanted_types, workers)
+    checked = time.perf_counter()
+
+    all_results = [cached_results.get(file_path) or checked_results[file_path] for file_path in all_files]
+    if use_cache:
+        _save_check_cache(folder, rules_hash, {
+            os.path.basename(file_path): {'hash': file_hashes[file_path], **file_stats[file_path],
+                                          'result': _check_result_to_json(result)}
+            for file_path, result in zip(all_files, all_results) if file_hashes[file_path] is not None
+        })
 
     # 문제 있는 결과 필터링
     def has_problems(r):
@@ -1043,6 +1883,12 @@ def check_geojson_files(folder: str, default_props: dict = None, unwanted_types:
     else:
         summary_lines.append("✅ 모든 파일이 정상입니다!")
 
+    summary_lines.extend([
+        f"검사 시간: {checked - started:.2f}초 (해시 {hashed - started:.2f}초, 검사 {checked - hashed:.2f}초)",
+        f"  - 새로 검사: {len(pending)}개 (프로세스 {max(1, min(workers, len(pending)))}개), "
+        f"변경 없음(캐시): {len(cached_results)}개"
+    ])
+
     for line in summary_lines:
         print(line)
         report_lines.append(line)
@@ -1053,6 +1899,24 @@ def check_geojson_files(folder: str, default_props: dict = None, unwanted_types:
             f.write('\n'.join(report_lines))
         print(f"\n📄 리포트 저장: {save_report}")
 
+    if json_report:
+        header = {
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'folder': os.path.abspath(folder),
+            'rules': rules_hash,
+            'default_props': default_props,
+            'unwanted_types': list(unwanted_types),
+            'file_count': len(all_results),
+            'problem_count': len(problem_results),
+        }
+        entries = [
+            {'file': result['file'], 'hash': file_hashes[file_path], **file_stats.get(file_path, {}),
+             'has_problems': bool(has_problems(result)), 'result': _check_result_to_json(result)}
+            for file_path, result in zip(all_files, all_results)
+        ]
+        _write_check_report(json_report, header, entries)
+        print(f"📄 JSON 리포트 저장: {json_report}")
+
     return all_results, problem_results
 
 
@@ -1061,14 +1925,19 @@ def parse_geojson_report(report_path: str) -> list:
     CRS-0에서 생성된 리포트 파일을 파싱하여 문제가 있는 코스 ID 리스트를 반환합니다.
 
     Args:
-        report_path: 리포트 파일 경로
+        report_path: 리포트 파일 경로 (텍스트, 또는 .json/.ndjson 구조화 리포트)
 
     Returns:
         list: 문제가 있는 코스 ID 리스트 (예: ['MGC001', 'TGC002'])
 
     Example:
         problem_ids = parse_geojson_report('./Reports/geojson_check_20260120.txt')
+        problem_ids = parse_geojson_report('./Reports/geojson_check_20260120.json')
     """
+    if report_path.endswith(('.json', '.ndjson')):
+        return [entry['file'].replace('.json', '') for entry in load_geojson_report(report_path)['files']
+                if entry['has_problems']]
+
     problem_ids = []
 
     with open(report_path, 'r', encoding='utf-8') as f:
@@ -1093,6 +1962,9 @@ def fix_geojson_file(file_path: str, default_props: dict = None, unwanted_types:
     4. Type Mismatches: 올바른 타입으로 변환
     5. Wrong mapdscourseid: 파일명 기준으로 수정
 
+    check_and_fix_geojson_file로 처리하므로 수정할 것이 없으면 파일을 다시 쓰지 않고,
+    쓸 때는 임시 파일에 쓴 뒤 교체합니다.
+
     Args:
         file_path: GeoJSON 파일 경로
         default_props: 기본 properties 템플릿 (None이면 자동 로드)
@@ -1108,122 +1980,76 @@ def fix_geojson_file(file_path: str, default_props: dict = None, unwanted_types:
     if default_props is None:
         default_props = load_default_feature_properties()
 
-    if unwanted_types is None:
-        unwanted_types = ['Undefined', '그린B']
+    return check_and_fix_geojson_file(file_path, default_props, unwanted_types)['fix']
 
-    basename = os.path.basename(file_path)
-    expected_courseid = basename.replace('.json', '')
 
-    result = {
-        'file': basename,
-        'deleted_features': 0,
-        'fixed_missing_keys': 0,
-        'fixed_extra_keys': 0,
-        'fixed_type_mismatches': 0,
-        'fixed_wrong_courseid': 0,
-    }
+def _changed_since_check(file_path: str, entry: dict) -> bool:
+    """리포트 기록(크기/수정 시각, 다르면 MD5)과 현재 파일이 다른지"""
+    stat = os.stat(file_path)
+    if entry.get('size') == stat.st_size and entry.get('mtime_ns') == stat.st_mtime_ns:
+        return False
+    return entry.get('hash') is None or _file_md5(file_path) != entry['hash']
 
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-    except Exception as e:
-        result['error'] = str(e)
-        return result
+def _run_fixes(file_paths: list, default_props: dict, unwanted_types: list, max_workers: int) -> dict:
+    """fix_geojson_file을 프로세스 풀로 실행하여 {파일 경로: 결과} 반환 (1개 이하/workers 1이면 현재 프로세스)"""
+    workers = max(1, min(max_workers, len(file_paths)))
+    if workers == 1:
+        return {path: fix_geojson_file(path, default_props, unwanted_types) for path in file_paths}
 
-    features = data.get('features', [])
-    original_count = len(features)
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(fix_geojson_file, path, default_props, unwanted_types): path
+                   for path in file_paths}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    return results
 
-    # 1. Unwanted Types feature 삭제
-    filtered_features = []
-    for feature in features:
-        props = feature.get('properties', {})
-        feature_type = props.get('Type', '')
-        if feature_type in unwanted_types:
-            result['deleted_features'] += 1
-        else:
-            filtered_features.append(feature)
-
-    # 남은 features 처리
-    for feature in filtered_features:
-        props = feature.get('properties', {})
-
-        # 2. Wrong mapdscourseid 수정
-        if props.get('mapdscourseid', '') != expected_courseid:
-            props['mapdscourseid'] = expected_courseid
-            result['fixed_wrong_courseid'] += 1
-
-        # 3. Missing Keys 추가 및 Type Mismatches 수정
-        for key, default_value in default_props.items():
-            if key not in props:
-                props[key] = default_value.copy() if isinstance(default_value, list) else default_value
-                result['fixed_missing_keys'] += 1
-            else:
-                # Type mismatch 수정
-                expected_type = type(default_value)
-                if not isinstance(props[key], expected_type):
-                    try:
-                        if expected_type == list:
-                            if isinstance(props[key], str):
-                                props[key] = json.loads(props[key])
-                            else:
-                                props[key] = list(props[key]) if props[key] else default_value.copy()
-                        elif expected_type == float:
-                            props[key] = float(props[key])
-                        elif expected_type == int:
-                            props[key] = int(props[key])
-                        elif expected_type == str:
-                            props[key] = str(props[key])
-                        result['fixed_type_mismatches'] += 1
-                    except (ValueError, TypeError, json.JSONDecodeError):
-                        props[key] = default_value.copy() if isinstance(default_value, list) else default_value
-                        result['fixed_type_mismatches'] += 1
-
-        # 4. Extra Keys 제거
-        extra_keys = [k for k in props.keys() if k not in default_props]
-        for key in extra_keys:
-            del props[key]
-            result['fixed_extra_keys'] += 1
-
-        feature['properties'] = props
-
-    # features 업데이트
-    data['features'] = filtered_features
-
-    # 파일 저장
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-
-    return result
 
-
-def fix_geojsons_from_report(report_path: str, geojson_folder: str, default_props: dict = None, unwanted_types: list = None) -> list:
+def fix_geojsons_from_report(report_path: str, geojson_folder: str, default_props: dict = None, unwanted_types: list = None,
+                             max_workers: int = None) -> list:
     """
     리포트 파일을 읽어 문제가 있는 GeoJSON 파일들을 수정합니다.
 
+    JSON/NDJSON 리포트(check_geojson_files의 json_report)이면 검사 때의 default_props/unwanted_types를 쓰고,
+    검사 후 내용이 바뀐 파일은 수정하지 않고 건너뜁니다 (다시 검사 필요).
+    텍스트 리포트는 기존처럼 코스 ID만 읽어서 수정합니다.
+    파일 수정은 프로세스 풀로 나눠 실행합니다.
+
     Args:
-        report_path: CRS-0에서 생성된 리포트 파일 경로
+        report_path: check_geojson_files의 json_report 경로 (.json/.ndjson, 텍스트 save_report도 가능)
         geojson_folder: GeoJSON 파일들이 있는 폴더 경로
-        default_props: 기본 properties 템플릿 (None이면 자동 로드)
-        unwanted_types: 삭제할 Type 리스트 (기본값: ['Undefined', '그린B'])
+        default_props: 기본 properties 템플릿 (None이면 리포트 기록, 없으면 자동 로드)
+        unwanted_types: 삭제할 Type 리스트 (None이면 리포트 기록, 없으면 ['Undefined', '그린B'])
+        max_workers: 동시 수정 프로세스 수 (기본값: CHECK_MAX_WORKERS)
 
     Returns:
-        list: 각 파일별 수정 결과 리스트
+        list: 각 파일별 수정 결과 리스트 (건너뛴 파일은 {'file', 'skipped': 사유})
 
     Example:
         results = fix_geojsons_from_report(
-            './Reports/geojson_check_20260120.txt',
+            './Reports/geojson_check_20260120.json',
             './ToUpload/dsgeoadmin/coursegeojson'
         )
     """
+    # 리포트에서 문제 있는 코스 파싱 (구조화 리포트면 검사 당시 파일 상태와 규칙도)
+    entries = {}
+    if report_path.endswith(('.json', '.ndjson')):
+        report = load_geojson_report(report_path)
+        if default_props is None:
+            default_props = report.get('default_props')
+        if unwanted_types is None:
+            unwanted_types = report.get('unwanted_types')
+        entries = {entry['file'].replace('.json', ''): entry for entry in report['files'] if entry['has_problems']}
+        problem_ids = list(entries)
+    else:
+        problem_ids = parse_geojson_report(report_path)
+
     if default_props is None:
         default_props = load_default_feature_properties()
 
     if unwanted_types is None:
         unwanted_types = ['Undefined', '그린B']
 
-    # 리포트에서 문제 있는 코스 ID 파싱
-    problem_ids = parse_geojson_report(report_path)
-
     if not problem_ids:
         print("리포트에서 문제가 있는 파일을 찾을 수 없습니다.")
         return []
@@ -1231,20 +2057,38 @@ def fix_geojsons_from_report(report_path: str, geojson_folder: str, default_prop
     print(f"=== 수정 대상: {len(problem_ids)}개 파일 ===")
     print(f"코스 ID: {problem_ids}\n")
 
+    # 없는 파일/검사 후 바뀐 파일은 수정하지 않음
+    not_fixed = {}
+    to_fix = []
+    for course_id in problem_ids:
+        file_path = os.path.join(geojson_folder, f'{course_id}.json')
+
+        if not os.path.exists(file_path):
+            not_fixed[course_id] = {'file': f'{course_id}.json', 'error': 'File not found'}
+        elif course_id in entries and _changed_since_check(file_path, entries[course_id]):
+            not_fixed[course_id] = {'file': f'{course_id}.json', 'skipped': 'changed since check'}
+        else:
+            to_fix.append(file_path)
+
+    fixed = _run_fixes(to_fix, default_props, unwanted_types, max_workers or CHECK_MAX_WORKERS)
+
     results = []
     total_deleted = 0
+    skipped_count = 0
 
     for course_id in problem_ids:
         file_path = os.path.join(geojson_folder, f'{course_id}.json')
+        result = not_fixed.get(course_id) or fixed[file_path]
+        results.append(result)
 
-        if not os.path.exists(file_path):
-            print(f"⚠️ 파일 없음: {file_path}")
-            results.append({'file': f'{course_id}.json', 'error': 'File not found'})
+        if course_id in not_fixed:
+            if result.get('skipped'):
+                print(f"⏭️ {result['file']}: 검사 후 변경되어 건너뜀 (다시 검사 필요)")
+                skipped_count += 1
+            else:
+                print(f"⚠️ 파일 없음: {file_path}")
             continue
 
-        result = fix_geojson_file(file_path, default_props, unwanted_types)
-        results.append(result)
-
         # 수정 결과 출력
         deleted = result.get('deleted_features', 0)
         total_deleted += deleted
@@ -1267,8 +2111,10 @@ def fix_geojsons_from_report(report_path: str, geojson_folder: str, default_prop
 
     # 최종 요약
     print(f"\n=== 수정 완료 ===")
-    total_files = len([r for r in results if not r.get('error')])
+    total_files = len([r for r in results if not r.get('error') and not r.get('skipped')])
     print(f"처리 파일: {total_files}개")
+    if skipped_count > 0:
+        print(f"검사 후 변경되어 건너뜀: {skipped_count}개")
     if total_deleted > 0:
         print(f"삭제된 feature 총: {total_deleted}개")
 
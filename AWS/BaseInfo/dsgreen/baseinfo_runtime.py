@@ -0,0 +1,676 @@
+"""
+baseinfo Lambda 공통 런타임.
+
+DSGEOBaseInfoLambda / DSWorkBaseInfo / dsOutBaseinfo / dsOutBaseinfo_v2가 함께 쓰는
+S3 로딩(웜 캐시, bundle), 저장, ETag/304, keys/exclude projection, PATCH, 저장 압축 처리를 모은 모듈.
+(GET 응답 압축은 API Gateway의 minimumCompressionSize 설정으로 처리, docs/baseinfoS3.md 참고)
+Lambda 배포 시 dsgreen 폴더를 함께 패키징(또는 layer)하여 `from dsgreen.baseinfo_runtime import ...`로 사용.
+
+cold start를 줄이기 위해 boto3는 import 시점이 아니라 첫 S3 호출(get_s3) 때 로드하고,
+만든 클라이언트는 웜 컨테이너의 호출 간에 재사용함.
+"""
+import copy
+import gzip
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from datetime import datetime
+
+from dsgreen import json_codec
+
+_clients = {}
+
+def get_s3():
+    """S3 클라이언트 (처음 호출 시 생성, 이후 재사용 - boto3 클라이언트는 스레드 간 공유 가능)"""
+    client = _clients.get('s3')
+    if client is None:
+        import boto3
+        client = _clients['s3'] = boto3.client('s3')
+    return client
+
+# load_all_json_from_prefix 동시 다운로드 스레드 수 (환경변수로 조정 가능)
+LOAD_MAX_WORKERS = int(os.environ.get('LOAD_MAX_WORKERS', '8'))
+# save_json_by_key_to_s3 동시 업로드 스레드 수
+SAVE_MAX_WORKERS = int(os.environ.get('SAVE_MAX_WORKERS', '8'))
+
+# 저장 형식: identity(기본, 평문 JSON) | gzip | zstd(zstandard 패키지 필요)
+# 읽기는 형식과 무관하게 매직 바이트로 판별하므로 기존 평문 파일과 섞여 있어도 됨
+BASEINFO_STORAGE_ENCODING = os.environ.get('BASEINFO_STORAGE_ENCODING', 'identity')
+_GZIP_MAGIC = b'\x1f\x8b'
+_ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+# 웜 컨테이너에서 호출 간 재사용하는 baseinfo JSON 캐시 ((bucket, key) → ETag, 크기, 파싱된 데이터)
+# BASEINFO_CACHE_MAX_BYTES: 캐시할 원본 JSON 크기 합계 상한 (초과 시 LRU 제거)
+# BASEINFO_CACHE_TTL: 이 시간(초) 이내에 확인한 prefix는 목록 조회 없이 캐시 사용 (0이면 매번 목록으로 재검증)
+BASEINFO_CACHE_MAX_BYTES = int(os.environ.get('BASEINFO_CACHE_MAX_BYTES', str(64 * 1024 * 1024)))
+BASEINFO_CACHE_TTL = float(os.environ.get('BASEINFO_CACHE_TTL', '0'))
+
+_json_cache = OrderedDict()
+_prefix_checked = {}
+_cache_stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'listings': 0, 'bytes': 0}
+
+# common/에 저장되는 key (나머지는 소비자 폴더)
+COMMON_KEYS = ['dsOrgList', 'dsworkcourse_info', 'mapcourse_info']
+
+# 소비자별 사전 병합 스냅샷 (bundle/{consumer}.json = common/ + consumer prefix)
+# BUNDLE_VERIFY: GET 시 manifest의 소스 ETag를 목록 조회로 확인하여 오래된 bundle을 재생성
+BUNDLE_PREFIX = 'bundle/'
+BUNDLE_PREFIXES = {'geo': 'geo/', 'work': 'work/', 'outrecord': 'outrecord/'}
+BUNDLE_VERIFY = os.environ.get('BUNDLE_VERIFY', '1') == '1'
+
+
+def encode_body(raw: bytes, encoding: str = None) -> bytes:
+    """평문 JSON 바이트를 저장 형식(identity/gzip/zstd)으로 인코딩"""
+    encoding = encoding or BASEINFO_STORAGE_ENCODING
+    if encoding == 'gzip':
+        return gzip.compress(raw, compresslevel=6, mtime=0)
+    if encoding == 'zstd':
+        import zstandard
+        return zstandard.ZstdCompressor(level=10).compress(raw)
+    return raw
+
+def decode_body(body: bytes) -> bytes:
+    """저장된 바이트를 평문 JSON 바이트로 복원 (gzip/zstd는 매직 바이트로 판별, 평문은 그대로)"""
+    if body[:2] == _GZIP_MAGIC:
+        return gzip.decompress(body)
+    if body[:4] == _ZSTD_MAGIC:
+        import zstandard
+        return zstandard.ZstdDecompressor().decompress(body)
+    return body
+
+def _content_encoding_args(body: bytes) -> dict:
+    """put_object에 넘길 ContentEncoding (평문이면 없음)"""
+    if body[:2] == _GZIP_MAGIC:
+        return {'ContentEncoding': 'gzip'}
+    if body[:4] == _ZSTD_MAGIC:
+        return {'ContentEncoding': 'zstd'}
+    return {}
+
+def _put_json_object(s3_client, bucket_name: str, s3_key: str, body: bytes):
+    """put_object 실행 후 (소요 ms, 에러 메시지 또는 None) 반환"""
+    started = time.perf_counter()
+    try:
+        s3_client.put_object(Bucket=bucket_name, Key=s3_key, Body=body, ContentType='application/json',
+                             **_content_encoding_args(body))
+        error = None
+    except Exception as e:
+        error = str(e)
+    return round((time.perf_counter() - started) * 1000, 1), error
+
+def save_json_by_key_to_s3(data_dict, common_keys, bucket_name, consumer):
+    """
+    data_dict의 최상위 key별로 common/ 또는 소비자(consumer) 폴더 아래 JSON 파일로 저장.
+
+    직렬화한 내용의 MD5를 목록 조회로 얻은 기존 객체 ETag와 비교해 바뀐 key만 병렬 업로드하고
+    {'written', 'skipped', 'failed', 'bundles', 'elapsed_ms'} 결과를 반환.
+    (SSE-KMS 등으로 ETag가 MD5가 아니면 항상 바뀐 것으로 보고 업로드)
+    """
+    s3 = get_s3()
+    started = time.perf_counter()
+    report = {'written': [], 'skipped': [], 'failed': [], 'bundles': []}
+
+    # 1. 저장 대상 직렬화
+    uploads = {}
+    for key, value in data_dict.items():
+        # 저장 제외 조건
+        if key in ["mapdscourseid", "dsmapcourseid","user","User","users"]:
+            print(f"⚠️ Skipping key: {key}")
+            continue
+
+        s3_key = f"common/{key}.json" if key in common_keys else f"{BUNDLE_PREFIXES[consumer]}{key}.json"
+        uploads[key] = (s3_key, encode_body(json_codec.dumps(value)))
+
+    # 2. 기존 객체 ETag 조회 (prefix당 목록 조회 1회)
+    stored_etags = {}
+    try:
+        for prefix in sorted({s3_key.split('/')[0] + '/' for s3_key, _ in uploads.values()}):
+            for obj in _iter_json_objects(s3, bucket_name, prefix):
+                stored_etags[obj['Key']] = obj.get('ETag', '').strip('"')
+    except Exception as e:
+        print(f"⚠️ Error listing stored objects, saving all keys: {e}")
+
+    changed = {}
+    for key, (s3_key, body) in uploads.items():
+        if stored_etags.get(s3_key) == hashlib.md5(body).hexdigest():
+            report['skipped'].append({'key': key, 's3_key': s3_key})
+        else:
+            changed[key] = (s3_key, body)
+
+    # 3. 바뀐 key만 병렬 업로드
+    if changed:
+        with ThreadPoolExecutor(max_workers=min(SAVE_MAX_WORKERS, len(changed))) as executor:
+            futures = {
+                executor.submit(_put_json_object, s3, bucket_name, s3_key, body): key
+                for key, (s3_key, body) in changed.items()
+            }
+            for future in as_completed(futures):
+                key = futures[future]
+                s3_key, body = changed[key]
+                elapsed_ms, error = future.result()
+                if error:
+                    print(f"❌ Error saving {key} to S3: {error}")
+                    report['failed'].append({'key': key, 's3_key': s3_key, 'error': error, 'ms': elapsed_ms})
+                    continue
+
+                invalidate_json_cache(bucket_name, s3_key)
+                print(f"✅ Saved {key} to s3://{bucket_name}/{s3_key} ({elapsed_ms}ms)")
+                report['written'].append({'key': key, 's3_key': s3_key, 'bytes': len(body), 'ms': elapsed_ms})
+
+    # 4. 저장된 key에 맞춰 bundle 재생성 (common/이 바뀌면 모든 소비자의 bundle)
+    if report['written']:
+        common_written = any(item['s3_key'].startswith('common/') for item in report['written'])
+        for consumer in (list(BUNDLE_PREFIXES) if common_written else [consumer]):
+            bundle_started = time.perf_counter()
+            try:
+                bundle = publish_bundle(bucket_name, consumer)
+                entry = {'consumer': consumer, 'version': bundle['version']}
+                print(f"✅ Published bundle {consumer} (version {bundle['version'][:12]})")
+            except Exception as e:
+                entry = {'consumer': consumer, 'error': str(e)}
+                print(f"❌ Error publishing bundle {consumer}: {e}")
+            entry['ms'] = round((time.perf_counter() - bundle_started) * 1000, 1)
+            report['bundles'].append(entry)
+
+    report['elapsed_ms'] = round((time.perf_counter() - started) * 1000, 1)
+    print(f"Saved {len(report['written'])}, skipped {len(report['skipped'])}, failed {len(report['failed'])} "
+          f"in {report['elapsed_ms']}ms")
+    return report
+
+def _json_name(key: str) -> str:
+    """S3 key의 파일명에서 .json을 제거하여 딕셔너리 key로 사용"""
+    return key.split('/')[-1].replace('.json', '')
+
+def _cache_get(bucket_name: str, key: str, etag: str = None):
+    """캐시 항목 반환 (etag가 주어지면 일치할 때만). LRU 순서 갱신"""
+    entry = _json_cache.get((bucket_name, key))
+    if entry is None or (etag is not None and entry['etag'] != etag):
+        return None
+    _json_cache.move_to_end((bucket_name, key))
+    return entry
+
+def _cache_put(bucket_name: str, key: str, etag: str, size: int, data):
+    """캐시에 저장하고 BASEINFO_CACHE_MAX_BYTES를 넘으면 오래된 항목부터 제거"""
+    old = _json_cache.pop((bucket_name, key), None)
+    if old is not None:
+        _cache_stats['bytes'] -= old['size']
+    if size > BASEINFO_CACHE_MAX_BYTES:
+        return
+
+    _json_cache[(bucket_name, key)] = {'etag': etag, 'size': size, 'data': data}
+    _cache_stats['bytes'] += size
+    while _cache_stats['bytes'] > BASEINFO_CACHE_MAX_BYTES:
+        _, evicted = _json_cache.popitem(last=False)
+        _cache_stats['bytes'] -= evicted['size']
+        _cache_stats['evictions'] += 1
+
+def _cache_prune(bucket_name: str, prefix: str, listed_keys: set):
+    """목록에서 사라진(삭제된) prefix 아래 key를 캐시에서 제거"""
+    for cache_key in [k for k in _json_cache if k[0] == bucket_name and k[1].startswith(prefix)]:
+        if cache_key[1] not in listed_keys:
+            _cache_stats['bytes'] -= _json_cache.pop(cache_key)['size']
+
+def invalidate_json_cache(bucket_name: str, key: str = None):
+    """S3에 저장한 뒤 호출. key(없으면 버킷 전체)의 캐시와 prefix 확인 기록을 제거"""
+    for cache_key in [k for k in _json_cache if k[0] == bucket_name and (key is None or k[1] == key)]:
+        _cache_stats['bytes'] -= _json_cache.pop(cache_key)['size']
+    for checked_key in [k for k in _prefix_checked if k[0] == bucket_name and (key is None or key.startswith(k[1]))]:
+        del _prefix_checked[checked_key]
+
+def baseinfo_cache_stats() -> dict:
+    """캐시 hit/miss/eviction 카운터와 현재 항목 수, 크기"""
+    return {**_cache_stats, 'entries': len(_json_cache)}
+
+def _load_json_object(s3_client, bucket_name: str, key: str):
+    """S3 객체 하나를 읽어 (ETag, 크기, 파싱된 JSON)으로 반환"""
+    content_object = s3_client.get_object(Bucket=bucket_name, Key=key)
+    file_content = decode_body(content_object['Body'].read())
+    return content_object.get('ETag'), len(file_content), json_codec.loads(file_content)
+
+def _iter_json_objects(s3_client, bucket_name: str, prefix: str):
+    """list_objects_v2를 페이지 단위로 따라가며 .json 객체 정보를 반환 (1000개 초과 지원)"""
+    paginator = s3_client.get_paginator('list_objects_v2')
+    for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix):
+        for obj in page.get('Contents', []):
+            if obj['Key'].endswith('.json'):
+                yield obj
+
+def iter_json_from_prefix(bucket_name: str, prefix: str, max_workers: int = None, errors: dict = None, use_cache: bool = True,
+                          manifest: dict = None, names: set = None, exclude: set = None):
+    """
+    prefix 아래의 JSON 파일들을 스레드 풀로 동시에 읽어 (파일명, 데이터)를 도착 순서대로 yield.
+
+    목록 조회는 페이지 단위로 진행되고, 진행 중인 다운로드는 max_workers * 2개로 제한되므로
+    전체 결과를 메모리에 모으지 않고 호출측에서 바로 병합/필터링할 수 있음.
+
+    use_cache=True이면 웜 컨테이너 캐시를 사용: 목록의 ETag가 캐시와 같은 파일은 다운로드/파싱 없이
+    캐시된 객체를 반환하고, BASEINFO_CACHE_TTL초 이내에 확인한 prefix는 목록 조회도 생략함.
+    캐시된 객체는 호출 간에 공유되므로 호출측에서 수정하면 안 됨.
+
+    max_workers: 동시 get_object 수 (기본값: LOAD_MAX_WORKERS)
+    errors: dict를 넘기면 읽기에 실패한 S3 key별 에러 메시지를 채움
+    manifest: dict를 넘기면 반환한 파일의 S3 key별 ETag를 채움
+    names, exclude: 파일명(.json 제외) 집합. 해당하지 않는 파일은 다운로드/파싱하지 않음
+    """
+    if use_cache:
+        checked = _prefix_checked.get((bucket_name, prefix))
+        if checked and time.time() - checked['at'] < BASEINFO_CACHE_TTL:
+            selected = [key for key in checked['keys'] if is_selected(_json_name(key), names, exclude)]
+            entries = [_cache_get(bucket_name, key) for key in selected]
+            if all(entry is not None for entry in entries):
+                _cache_stats['hits'] += len(entries)
+                for key, entry in zip(selected, entries):
+                    if manifest is not None:
+                        manifest[key] = entry['etag']
+                    yield _json_name(key), entry['data']
+                return
+
+    s3 = get_s3()
+    workers = max(1, max_workers or LOAD_MAX_WORKERS)
+    pending = {}
+    listed_keys = []
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        def finished(return_when):
+            done, _ = wait(pending, return_when=return_when)
+            for future in done:
+                key = pending.pop(future)
+                try:
+                    etag, size, json_data = future.result()
+                except Exception as e:
+                    print(f"Error reading {key}: {e}")
+                    if errors is not None:
+                        errors[key] = str(e)
+                    continue
+
+                if use_cache:
+                    _cache_stats['misses'] += 1
+                    _cache_put(bucket_name, key, etag, size, json_data)
+                if manifest is not None:
+                    manifest[key] = etag
+                yield _json_name(key), json_data
+
+        for obj in _iter_json_objects(s3, bucket_name, prefix):
+            key = obj['Key']
+            listed_keys.append(key)
+            if not is_selected(_json_name(key), names, exclude):
+                continue
+
+            entry = _cache_get(bucket_name, key, obj.get('ETag')) if use_cache else None
+            if entry is not None:
+                _cache_stats['hits'] += 1
+                if manifest is not None:
+                    manifest[key] = entry['etag']
+                yield _json_name(key), entry['data']
+                continue
+
+            pending[executor.submit(_load_json_object, s3, bucket_name, key)] = key
+            if len(pending) >= workers * 2:
+                yield from finished(FIRST_COMPLETED)
+
+        while pending:
+            yield from finished(FIRST_COMPLETED)
+
+    if use_cache:
+        _cache_stats['listings'] += 1
+        _cache_prune(bucket_name, prefix, set(listed_keys))
+        _prefix_checked[(bucket_name, prefix)] = {'at': time.time(), 'keys': listed_keys}
+
+    if not listed_keys:
+        print("No files found.")
+
+def load_all_json_from_prefix(bucket_name: str, prefix: str, max_workers: int = None, errors: dict = None, use_cache: bool = True):
+    """prefix 아래의 JSON 파일 전체를 {파일명: 데이터}로 반환 (파일명 순 정렬)"""
+    items = iter_json_from_prefix(bucket_name, prefix, max_workers=max_workers, errors=errors, use_cache=use_cache)
+    return dict(sorted(items, key=lambda item: item[0]))
+
+def _manifest_version(manifest: dict) -> str:
+    """소스 key/ETag manifest로부터 결정적인 버전 문자열 생성"""
+    digest = hashlib.sha1(json_codec.dumps(sorted(manifest.items())))
+    return digest.hexdigest()
+
+def list_bundle_manifest(bucket_name: str, consumer: str) -> dict:
+    """common/ + consumer prefix의 현재 {S3 key: ETag} (목록 조회만 사용, 다운로드 없음)"""
+    s3 = get_s3()
+    manifest = {}
+    for prefix in ('common/', BUNDLE_PREFIXES[consumer]):
+        for obj in _iter_json_objects(s3, bucket_name, prefix):
+            manifest[obj['Key']] = obj.get('ETag')
+    return manifest
+
+def publish_bundle(bucket_name: str, consumer: str) -> dict:
+    """
+    common/ + consumer prefix를 병합한 스냅샷을 bundle/{consumer}.json 하나로 저장.
+
+    bundle = {'consumer', 'version', 'built_at', 'manifest': {소스 S3 key: ETag}, 'data': 병합된 데이터}
+    """
+    manifest = {}
+    data = {}
+    for prefix in ('common/', BUNDLE_PREFIXES[consumer]):
+        data.update(iter_json_from_prefix(bucket_name, prefix, manifest=manifest))
+
+    bundle = {
+        'consumer': consumer,
+        'version': _manifest_version(manifest),
+        'built_at': datetime.now().isoformat(),
+        'manifest': manifest,
+        'data': data,
+    }
+    raw = json_codec.dumps(bundle)
+    body = encode_body(raw)
+    bundle_key = f"{BUNDLE_PREFIX}{consumer}.json"
+
+    s3 = get_s3()
+    response = s3.put_object(Bucket=bucket_name, Key=bundle_key, Body=body, ContentType='application/json',
+                             **_content_encoding_args(body))
+    _cache_put(bucket_name, bundle_key, response.get('ETag'), len(raw), bundle)
+    return bundle
+
+def load_json_cached(bucket_name: str, key: str):
+    """
+    S3 JSON 객체 하나를 캐시를 거쳐 읽음. 캐시에 있으면 조건부 GET(If-None-Match)으로 재검증.
+    객체가 없으면 None 반환. 반환된 객체는 공유되므로 수정하면 안 됨.
+    """
+    s3 = get_s3()
+    from botocore.exceptions import ClientError
+
+    cached = _cache_get(bucket_name, key)
+
+    try:
+        kwargs = {'IfNoneMatch': cached['etag']} if cached else {}
+        content_object = s3.get_object(Bucket=bucket_name, Key=key, **kwargs)
+    except ClientError as e:
+        if cached and e.response.get('ResponseMetadata', {}).get('HTTPStatusCode') == 304:
+            _cache_stats['hits'] += 1
+            return cached['data']
+        if e.response.get('Error', {}).get('Code') in ('NoSuchKey', '404'):
+            return None
+        raise
+
+    file_content = decode_body(content_object['Body'].read())
+    json_data = json_codec.loads(file_content)
+    _cache_stats['misses'] += 1
+    _cache_put(bucket_name, key, content_object.get('ETag'), len(file_content), json_data)
+    return json_data
+
+def load_bundle(bucket_name: str, consumer: str, verify: bool = None, manifest: dict = None) -> dict:
+    """
+    bundle/{consumer}.json을 읽어 병합된 데이터를 반환. 캐시된 bundle은 조건부 GET(If-None-Match)으로 재사용.
+
+    verify=True(기본값: BUNDLE_VERIFY)이면 manifest를 현재 소스 목록의 ETag와 비교하여
+    bundle이 없거나 오래된 경우 다시 만들어 저장함.
+    manifest: 이미 조회한 현재 소스 manifest (주어지면 목록 조회 없이 이것과 비교)
+    """
+    if verify is None:
+        verify = BUNDLE_VERIFY or manifest is not None
+
+    bundle_key = f"{BUNDLE_PREFIX}{consumer}.json"
+    bundle = load_json_cached(bucket_name, bundle_key)
+
+    if verify and manifest is None:
+        manifest = list_bundle_manifest(bucket_name, consumer)
+    if bundle is None or (verify and bundle.get('manifest') != manifest):
+        print(f"Rebuilding stale bundle: {bundle_key}")
+        bundle = publish_bundle(bucket_name, consumer)
+
+    return bundle['data']
+
+def is_selected(name: str, names=None, exclude=None) -> bool:
+    """파일명이 keys(names)/exclude 조건에 맞는지"""
+    return (names is None or name in names) and not (exclude and name in exclude)
+
+def parse_projection(event):
+    """keys=, exclude= 쿼리 파라미터(콤마 구분)를 (keys set 또는 None, exclude set 또는 None)으로 반환"""
+    querystring = event.get('params', {}).get('querystring') or {}
+
+    def split(value):
+        names = {name.strip() for name in (value or '').split(',') if name.strip()}
+        return names or None
+
+    return split(querystring.get('keys')), split(querystring.get('exclude'))
+
+def project_manifest(manifest: dict, names=None, exclude=None) -> dict:
+    """manifest에서 keys/exclude에 해당하는 소스만 남김"""
+    if names is None and not exclude:
+        return manifest
+    return {key: etag for key, etag in manifest.items() if is_selected(_json_name(key), names, exclude)}
+
+def projection_variant(names=None, exclude=None) -> tuple:
+    """ETag 계산에 포함할 projection 값 (projection이 없으면 빈 tuple)"""
+    variant = ()
+    if names is not None:
+        variant += ('keys=' + ','.join(sorted(names)),)
+    if exclude:
+        variant += ('exclude=' + ','.join(sorted(exclude)),)
+    return variant
+
+def load_projection(bucket_name: str, consumer: str, names=None, exclude=None) -> dict:
+    """bundle 대신 common/ + consumer prefix에서 keys/exclude에 해당하는 파일만 다운로드하여 병합"""
+    data = {}
+    for prefix in ('common/', BUNDLE_PREFIXES[consumer]):
+        data.update(iter_json_from_prefix(bucket_name, prefix, names=names, exclude=exclude))
+    return data
+
+def bundle_etag(manifest: dict, *variant) -> str:
+    """소스 manifest(와 응답을 바꾸는 쿼리 값)로부터 HTTP ETag 생성"""
+    parts = [_manifest_version(manifest)] + [str(v) for v in variant]
+    return '"%s"' % hashlib.sha1('|'.join(parts).encode('utf-8')).hexdigest()
+
+def client_etag(event):
+    """
+    클라이언트가 가지고 있는 버전의 ETag (쿼리 파라미터 etag=, 없으면 None).
+
+    non-proxy 통합에서는 응답의 statusCode/headers가 HTTP 상태/헤더가 아니라 JSON 본문의 필드이므로
+    브라우저가 If-None-Match를 보내지 않음. 클라이언트가 이전 응답의 headers.ETag를 etag=로 넘긴 경우에만 비교함.
+    """
+    querystring = event.get('params', {}).get('querystring') or {}
+    return querystring.get('etag') or None
+
+def etag_matches(event, etag: str) -> bool:
+    """요청의 etag= 값이 etag와 일치하는지 (약한 비교, W/ 접두사 무시)"""
+    requested = client_etag(event)
+    if not requested:
+        return False
+    tags = [tag.strip() for tag in requested.split(',')]
+    return etag in [tag[2:] if tag.startswith('W/') else tag for tag in tags]
+
+def not_modified_response(etag: str) -> dict:
+    """
+    본문 없는 304 응답 (etag=를 넘긴 클라이언트에게만 반환).
+    HTTP 상태는 200이고 JSON 본문의 statusCode가 304이므로 클라이언트는 가지고 있던 데이터를 그대로 사용.
+    """
+    return {
+        "statusCode": 304,
+        "body": "",
+        "headers": {"ETag": etag, "Cache-Control": "no-cache"}
+    }
+
+def _pointer_tokens(path: str) -> list:
+    """JSON Pointer(RFC 6901) 문자열을 토큰 리스트로 변환"""
+    if path == '':
+        return []
+    if not path.startswith('/'):
+        raise ValueError(f"Invalid JSON pointer: {path}")
+    return [token.replace('~1', '/').replace('~0', '~') for token in path[1:].split('/')]
+
+def _child_index(container, token: str, for_add: bool = False):
+    """컨테이너(list/dict)에서 토큰이 가리키는 인덱스/키 반환 (없으면 예외)"""
+    if isinstance(container, list):
+        if for_add and token == '-':
+            return len(container)
+        if not token.isdigit() or int(token) >= len(container) + (1 if for_add else 0):
+            raise IndexError(f"Invalid list index: {token}")
+        return int(token)
+    if isinstance(container, dict):
+        if not for_add and token not in container:
+            raise KeyError(token)
+        return token
+    raise TypeError(f"Cannot index {type(container).__name__} with {token}")
+
+def _get_pointer(doc, tokens: list):
+    for token in tokens:
+        doc = doc[_child_index(doc, token)]
+    return doc
+
+def _copy_path(doc, tokens: list):
+    """
+    tokens 경로의 부모까지 컨테이너를 얕은 복사하여 (새 root, 부모)를 반환.
+    원본(캐시된 객체)은 수정하지 않고 바뀌는 경로만 복사함 (copy-on-write)
+    """
+    root = copy.copy(doc)
+    parent = root
+    for token in tokens[:-1]:
+        index = _child_index(parent, token)
+        parent[index] = copy.copy(parent[index])
+        parent = parent[index]
+    return root, parent
+
+def _json_equal(a, b) -> bool:
+    """JSON 값 비교 (RFC 6902 test: 타입까지 같아야 함 - true와 1은 다름, 1과 1.0은 같은 number)"""
+    if isinstance(a, bool) or isinstance(b, bool):
+        return type(a) is type(b) and a == b
+    if isinstance(a, (int, float)) and isinstance(b, (int, float)):
+        return a == b
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_json_equal(a[key], b[key]) for key in a)
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(_json_equal(x, y) for x, y in zip(a, b))
+    return type(a) is type(b) and a == b
+
+def _apply_json_patch(doc, operations: list):
+    """JSON Patch(RFC 6902) 연산을 순서대로 적용한 새 문서를 반환 (원본은 수정하지 않음)"""
+    for operation in operations:
+        op = operation.get('op')
+        tokens = _pointer_tokens(operation['path'])
+
+        if op == 'test':
+            if not _json_equal(_get_pointer(doc, tokens), operation['value']):
+                raise ValueError(f"Test failed: {operation['path']}")
+            continue
+
+        if op in ('move', 'copy'):
+            from_tokens = _pointer_tokens(operation['from'])
+            value = _get_pointer(doc, from_tokens)
+            if op == 'move':
+                op = 'add'
+                root, parent = _copy_path(doc, from_tokens)
+                del parent[_child_index(parent, from_tokens[-1])]
+                doc = root
+            else:
+                op = 'add'
+        elif op in ('add', 'replace'):
+            value = operation['value']
+        elif op != 'remove':
+            raise ValueError(f"Unsupported patch op: {op}")
+
+        if not tokens:
+            if op == 'remove':
+                raise ValueError("Cannot remove the document root")
+            doc = value
+            continue
+
+        root, parent = _copy_path(doc, tokens)
+        if op == 'add' and isinstance(parent, list):
+            parent.insert(_child_index(parent, tokens[-1], for_add=True), value)
+        elif op == 'add':
+            parent[_child_index(parent, tokens[-1], for_add=True)] = value
+        elif op == 'replace':
+            parent[_child_index(parent, tokens[-1])] = value
+        else:
+            del parent[_child_index(parent, tokens[-1])]
+        doc = root
+
+    return doc
+
+def _apply_merge_patch(target, patch):
+    """JSON Merge Patch(RFC 7396)를 적용한 새 값을 반환 (원본은 수정하지 않음)"""
+    if not isinstance(patch, dict):
+        return patch
+    result = dict(target) if isinstance(target, dict) else {}
+    for key, value in patch.items():
+        if value is None:
+            result.pop(key, None)
+        else:
+            result[key] = _apply_merge_patch(result.get(key), value)
+    return result
+
+def resolve_patch_changes(body: dict, load_current) -> dict:
+    """
+    PATCH body를 key별 새 값으로 변환.
+
+    body = {
+      "keys": {"task_info": [...]},                                              # key 단위 교체
+      "patches": [
+        {"key": "mapcourse_info", "patch": [{"op": "replace", "path": "/3/name", "value": "..."}]},  # RFC 6902
+        {"key": "dsOrgList", "merge": {...}}                                                     # RFC 7396
+      ]
+    }
+    load_current(key): patch를 적용할 현재 값을 반환하는 함수
+
+    body 형식이 잘못되면 TypeError/ValueError (호출측에서 400으로 응답). 연산 하나라도 실패하면
+    예외가 나고 아무 key도 반환하지 않음 (원본은 수정하지 않으므로 부분 적용 없음).
+    """
+    _validate_patch_body(body)
+
+    changes = dict(body.get('keys') or {})
+    for item in body.get('patches') or []:
+        key = item['key']
+        current = changes[key] if key in changes else load_current(key)
+        if 'patch' in item:
+            if current is None:
+                raise KeyError(key)
+            changes[key] = _apply_json_patch(current, item['patch'])
+        elif 'merge' in item:
+            changes[key] = _apply_merge_patch(current, item['merge'])
+        else:
+            raise ValueError(f"patch or merge required: {key}")
+    return changes
+
+def _validate_patch_body(body):
+    """PATCH body 구조 검사 (body는 dict, keys는 dict, patches는 {'key', 'patch' 또는 'merge'} 리스트, patch는 op 객체 리스트)"""
+    if not isinstance(body, dict):
+        raise TypeError(f"PATCH body must be an object, not {type(body).__name__}")
+    if not isinstance(body.get('keys') or {}, dict):
+        raise TypeError("keys must be an object")
+    patches = body.get('patches') or []
+    if not isinstance(patches, list):
+        raise TypeError("patches must be a list")
+
+    for item in patches:
+        if not isinstance(item, dict) or not isinstance(item.get('key'), str):
+            raise TypeError(f"Invalid patches item: {item!r}")
+        if 'patch' not in item:
+            if 'merge' not in item:
+                raise ValueError(f"patch or merge required: {item['key']}")
+            continue
+        operations = item['patch']
+        if not isinstance(operations, list):
+            raise TypeError(f"patch must be a list of operations: {item['key']}")
+        for operation in operations:
+            if not isinstance(operation, dict) or not isinstance(operation.get('op'), str) \
+                    or not isinstance(operation.get('path'), str):
+                raise TypeError(f"Invalid patch operation: {operation!r}")
+            if operation['op'] in ('move', 'copy') and not isinstance(operation.get('from'), str):
+                raise TypeError(f"Invalid patch operation: {operation!r}")
+
+def patch_baseinfo(event, consumer: str, bucket_name: str = 'dsbaseinfo') -> dict:
+    """PATCH: 바뀐 key/연산만 받아 서버에서 적용하고 영향을 받는 객체만 저장"""
+    def load_current(key):
+        prefix = 'common/' if key in COMMON_KEYS else BUNDLE_PREFIXES[consumer]
+        return load_json_cached(bucket_name, f"{prefix}{key}.json")
+
+    try:
+        changes = resolve_patch_changes(event.get('body-json', {}), load_current)
+    except (KeyError, IndexError, TypeError, ValueError) as e:
+        return {
+            "statusCode": 400,
+            "body": {"message": f"Invalid patch: {e!r}"},
+            "headers": {"Content-Type": "application/json"}
+        }
+
+    return {
+        "statusCode": 200,
+        "body": save_json_by_key_to_s3(changes, COMMON_KEYS, bucket_name, consumer),
+        "headers": {"Content-Type": "application/json"}
+    }
@@ -0,0 +1,80 @@
+"""
+baseinfo JSON 직렬화 공통 모듈.
+
+Lambda(DSGEO/DSWork/dsOut)와 aws_helpers가 같은 규칙으로 JSON을 읽고 쓰도록 한 곳에 모은 것.
+orjson이 설치되어 있으면 사용하고, 없으면 표준 json으로 동작 (출력 형식은 동일하게 맞춤).
+
+- loads: bytes/str 모두 받음 (S3 Body를 decode 없이 바로 파싱)
+- dumps: 기본은 공백 없는 compact UTF-8 bytes (S3 저장/응답용), pretty=True면 indent=2 (사람이 보는 로컬 파일용)
+- Decimal(DynamoDB 등)은 정수면 int, 아니면 float으로 직렬화
+"""
+import json
+from decimal import Decimal
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+BACKEND = 'orjson' if orjson is not None else 'json'
+
+
+def _default(obj):
+    """기본 직렬화기가 모르는 타입 처리"""
+    if isinstance(obj, Decimal):
+        if obj.is_finite() and obj == obj.to_integral_value():
+            return int(obj)
+        return float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def loads(data, use_decimal: bool = False):
+    """
+    JSON 파싱.
+
+    use_decimal: 실수를 Decimal로 파싱 (DynamoDB에 그대로 넣어야 할 때만, 표준 json 경로 사용)
+    """
+    if use_decimal:
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            data = bytes(data).decode('utf-8')
+        return json.loads(data, parse_float=Decimal)
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        data = bytes(data).decode('utf-8')
+    return json.loads(data)
+
+
+def dumps(obj, pretty: bool = False, sort_keys: bool = False) -> bytes:
+    """JSON을 UTF-8 bytes로 직렬화 (한글은 escape하지 않음)"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=_default, option=option)
+    if pretty:
+        text = json.dumps(obj, ensure_ascii=False, indent=2, sort_keys=sort_keys, default=_default)
+    else:
+        text = json.dumps(obj, ensure_ascii=False, separators=(',', ':'), sort_keys=sort_keys, default=_default)
+    return text.encode('utf-8')
+
+
+def dumps_str(obj, pretty: bool = False, sort_keys: bool = False) -> str:
+    """dumps의 str 버전 (API Gateway 응답 body 등)"""
+    return dumps(obj, pretty=pretty, sort_keys=sort_keys).decode('utf-8')
+
+
+def load_file(path: str, use_decimal: bool = False):
+    """로컬 JSON 파일 읽기"""
+    with open(path, 'rb') as f:
+        return loads(f.read(), use_decimal=use_decimal)
+
+
+def dump_file(path: str, obj, pretty: bool = True):
+    """로컬 JSON 파일 쓰기 (기본 indent=2, 끝에 줄바꿈 없음 - 기존 json.dump 형식, orjson은 작은 실수를 지수 없이 표기)"""
+    with open(path, 'wb') as f:
+        f.write(dumps(obj, pretty=pretty))
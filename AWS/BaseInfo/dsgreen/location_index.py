@@ -0,0 +1,221 @@
+"""
+코스 GeoJSON 위치 인덱스 (GPS -> Hole/Area/Client/Course).
+
+get_location_from_gps가 GPS 점마다 모든 feature에 대해 shape()를 만들고 contains를 돌던 것을
+코스별로 한 번만 준비해 두고 재사용하도록 한 것.
+
+- geometry는 한 번만 만들어 prepare (GEOS prepared geometry)
+- STRtree로 bbox 후보만 고른 뒤 후보에 대해서만 contains 검사
+- Hole/Area/Client/Course는 feature 순서대로 병렬 배열(records)에 보관
+- 결과와 순서는 기존 get_location_from_gps와 동일 (geometry 변환/Hole int 변환이 실패한 feature는 제외)
+
+best_location은 우선순위 순서로 정렬해 둔 feature를 bbox 후보에 한해 차례로 검사하고 첫 포함에서 멈춤.
+best_locations는 여러 GPS 점을 한 번에 처리 (shapely 2 벡터 predicate + 우선순위 정렬).
+
+같은 crs_geojson dict로 반복 조회하면 get_location_index가 캐시된 인덱스를 돌려줌.
+feature의 geometry/properties를 그 자리에서 수정하면 evict_location_index(crs_geojson 또는 features)로
+해당 코스의 인덱스를 버려야 함 (aws_helpers.clean_and_normalize_features는 직접 호출함).
+캐시는 인덱스마다 원본 코스 dict를 참조하므로 LOCATION_INDEX_MAX개까지만 보관.
+"""
+import os
+from collections import OrderedDict
+
+import numpy as np
+import shapely
+from shapely.geometry import shape
+
+DEFAULT_PRIORITY = ['홀영역', '그린', '지역', '코스', '전면']
+
+LOCATION_INDEX_MAX = int(os.environ.get('LOCATION_INDEX_MAX', '8'))  # 캐시할 코스 수 (코스 dict도 함께 유지됨)
+
+_index_cache = OrderedDict()  # id(crs_geojson) -> CourseLocationIndex
+
+
+def _location_record(props: dict) -> dict:
+    """feature properties -> location 정보 (기존 get_location_from_gps와 같은 변환)"""
+    return {
+        'Hole': int(props.get('Hole', 0)) if props.get('Hole') is not None else 0,
+        'Area': props.get('Type', ''),
+        'Client': props.get('Client', ''),
+        'Course': props.get('Course', '')
+    }
+
+
+class CourseLocationIndex:
+    """코스 하나의 feature geometry STRtree + location 정보 병렬 배열"""
+
+    def __init__(self, crs_geojson: dict):
+        self.source = crs_geojson
+        self.features = crs_geojson.get('features', [])
+        self.feature_count = len(self.features)
+
+        geometries = []
+        records = []
+        for feature in self.features:
+            try:
+                geometry = shape(feature['geometry'])
+                record = _location_record(feature.get('properties', {}))
+            except Exception:
+                continue
+            geometries.append(geometry)
+            records.append(record)
+
+        self.geometries = np.array(geometries, dtype=object)
+        self.records = records
+        self._priority_positions = {}  # tuple(priority) -> feature별 검사 순서 (작을수록 먼저)
+        shapely.prepare(self.geometries)
+        self.tree = shapely.STRtree(self.geometries)
+        self._priority_position(DEFAULT_PRIORITY)
+
+    def __len__(self):
+        return len(self.records)
+
+    def is_current(self, crs_geojson: dict) -> bool:
+        """인덱스가 crs_geojson의 현재 features로 만들어졌는지 (features 리스트 교체/추가·삭제 감지)"""
+        features = crs_geojson.get('features', [])
+        return self.source is crs_geojson and self.features is features and self.feature_count == len(features)
+
+    def candidates(self, lng: float, lat: float) -> np.ndarray:
+        """bbox에 점이 들어가는 feature 번호 (feature 순서로 정렬)"""
+        return np.sort(self.tree.query(shapely.points(lng, lat)))
+
+    def lookup(self, lng: float, lat: float) -> list:
+        """점을 포함하는 모든 feature의 location 정보 (feature 순서)"""
+        return [dict(self.records[i]) for i in self._lookup_indices(lng, lat)]
+
+    def _lookup_indices(self, lng: float, lat: float):
+        """점을 포함하는 feature 번호 (feature 순서)"""
+        candidates = self.candidates(lng, lat)
+        if len(candidates) == 0:
+            return []
+
+        try:
+            hits = candidates[shapely.contains_xy(self.geometries[candidates], lng, lat)]
+        except Exception:
+            # 일부 geometry에서 GEOS 오류가 나면 기존처럼 해당 feature만 건너뜀
+            point = shapely.points(lng, lat)
+            hits = []
+            for i in candidates:
+                try:
+                    if self.geometries[i].contains(point):
+                        hits.append(i)
+                except Exception:
+                    continue
+
+        return hits
+
+    def _area_rank(self, priority: list) -> np.ndarray:
+        """feature별 Area 우선순위 (priority에 없으면 len(priority))"""
+        rank_of = {area: rank for rank, area in reversed(list(enumerate(priority)))}
+        return np.array([rank_of.get(record['Area'], len(priority)) for record in self.records], dtype=np.int64)
+
+    def _priority_position(self, priority: list) -> np.ndarray:
+        """priority별 feature 검사 순서 (우선순위, feature 순서) - priority마다 한 번만 계산"""
+        key = tuple(priority)
+        position = self._priority_positions.get(key)
+        if position is None:
+            order = np.lexsort((np.arange(len(self.records)), self._area_rank(priority)))
+            position = np.empty(len(order), dtype=np.int64)
+            position[order] = np.arange(len(order))
+            self._priority_positions[key] = position
+        return position
+
+    def best_location(self, lng: float, lat: float, priority: list = None, stats: dict = None):
+        """
+        점을 포함하는 feature 중 우선순위가 가장 높은 것의 location 정보 (없으면 None).
+
+        bbox 후보를 (우선순위, feature 순서)로 정렬해 차례로 contains 검사하고 첫 포함에서 멈춤.
+        stats dict를 주면 {'candidates': bbox 후보 수, 'tests': contains 검사 수}를 채움.
+        """
+        if priority is None:
+            priority = DEFAULT_PRIORITY
+
+        candidates = self.tree.query(shapely.points(lng, lat))
+        if len(candidates):
+            candidates = candidates[np.argsort(self._priority_position(priority)[candidates])]
+
+        tests = 0
+        best = None
+        for i in candidates:
+            tests += 1
+            try:
+                if shapely.contains_xy(self.geometries[i], lng, lat):
+                    best = i
+                    break
+            except Exception:
+                continue
+
+        if stats is not None:
+            stats['candidates'] = len(candidates)
+            stats['tests'] = tests
+        return dict(self.records[best]) if best is not None else None
+
+    def best_locations(self, lngs, lats, priority: list = None) -> np.ndarray:
+        """
+        GPS 점 배열마다 우선순위가 가장 높은 feature 번호 (없으면 -1).
+
+        get_best_location_from_gps와 같은 규칙: priority 순서대로 첫 Area, 같은 Area면 feature 순서,
+        priority에 없는 Area뿐이면 feature 순서로 첫번째. 경도나 위도가 0인 점은 -1.
+        """
+        if priority is None:
+            priority = DEFAULT_PRIORITY
+
+        lngs = np.asarray(lngs, dtype=float)
+        lats = np.asarray(lats, dtype=float)
+        best = np.full(len(lngs), -1, dtype=np.int64)
+        if len(self.records) == 0 or len(lngs) == 0:
+            return best
+
+        valid = np.flatnonzero((lngs != 0) & (lats != 0))
+        try:
+            point_idx, feature_idx = self.tree.query(shapely.points(lngs[valid], lats[valid]), predicate='within')
+        except Exception:
+            # GEOS 오류가 나는 geometry가 있으면 점 단위 조회로 (해당 feature만 건너뜀)
+            pairs = [(p, i) for p, v in enumerate(valid)
+                     for i in self._lookup_indices(lngs[v], lats[v])]
+            point_idx = np.array([p for p, _ in pairs], dtype=np.int64)
+            feature_idx = np.array([i for _, i in pairs], dtype=np.int64)
+        if len(point_idx) == 0:
+            return best
+
+        # 점별로 (우선순위, feature 순서)가 가장 작은 것
+        order = np.lexsort((feature_idx, self._area_rank(priority)[feature_idx], point_idx))
+        point_idx, feature_idx = point_idx[order], feature_idx[order]
+        first = np.flatnonzero(np.r_[True, point_idx[1:] != point_idx[:-1]])
+        best[valid[point_idx[first]]] = feature_idx[first]
+        return best
+
+    def records_for(self, feature_indices) -> list:
+        """best_locations 결과 -> location 정보 리스트 (-1은 None)"""
+        return [dict(self.records[i]) if i >= 0 else None for i in feature_indices]
+
+
+def build_location_index(crs_geojson: dict) -> CourseLocationIndex:
+    """crs_geojson으로 인덱스를 새로 만들어 캐시에 넣음"""
+    index = CourseLocationIndex(crs_geojson)
+    key = id(crs_geojson)
+    _index_cache[key] = index
+    _index_cache.move_to_end(key)
+    while len(_index_cache) > LOCATION_INDEX_MAX:
+        _index_cache.popitem(last=False)
+    return index
+
+
+def get_location_index(crs_geojson: dict) -> CourseLocationIndex:
+    """캐시된 인덱스 반환 (없거나 features가 바뀌었으면 새로 만듦)"""
+    index = _index_cache.get(id(crs_geojson))
+    if index is not None and index.is_current(crs_geojson):
+        _index_cache.move_to_end(id(crs_geojson))
+        return index
+    return build_location_index(crs_geojson)
+
+
+def evict_location_index(crs_geojson_or_features):
+    """crs_geojson 또는 그 features 리스트로 만든 캐시 인덱스를 제거 (feature를 제자리에서 수정한 뒤 호출)"""
+    for key in [key for key, index in _index_cache.items()
+                if index.source is crs_geojson_or_features or index.features is crs_geojson_or_features]:
+        del _index_cache[key]
+
+
+def clear_location_index_cache():
+    _index_cache.clear()
@@ -1,86 +1,56 @@
-import json
-import boto3
+from botocore.exceptions import ClientError
 from datetime import datetime
 
-s3 = boto3.client('s3')
-
-def load_all_json_from_prefix(bucket_name: str, prefix: str):
-    s3 = boto3.client('s3')
-    result_dict = {}
-
-    # 1. prefix 경로 아래의 모든 객체 리스트 가져오기
-    response = s3.list_objects_v2(Bucket=bucket_name, Prefix=prefix)
-
-    if 'Contents' not in response:
-        print("No files found.")
-        return result_dict
-
-    for obj in response['Contents']:
-        key = obj['Key']
-        if key.endswith('.json'):
-            try:
-                content_object = s3.get_object(Bucket=bucket_name, Key=key)
-                file_content = content_object['Body'].read().decode('utf-8')
-                json_data = json.loads(file_content)
-
-                # 파일명에서 .json 제거하고 딕셔너리 key로 사용
-                filename = key.split('/')[-1].replace('.json', '')
-                result_dict[filename] = json_data
-
-            except Exception as e:
-                print(f"Error reading {key}: {e}")
-
-    return result_dict
-
-def save_json_by_key_to_s3(data_dict, common_keys, bucket_name):
-
-    results = []
-
-    for key, value in data_dict.items():
-        # 저장 제외 조건
-        if key in ["mapdscourseid", "dsmapcourseid","user","User","users"]:
-            print(f"⚠️ Skipping key: {key}")
-            continue
-
-        s3_key = f"common/{key}.json" if key in common_keys else f"geo/{key}.json"
-
-        try:
-            s3.put_object(
-                Bucket=bucket_name,
-                Key=s3_key,
-                Body=json.dumps(value, ensure_ascii=False, indent=2).encode('utf-8')
-            )
-            msg = f"✅ Saved {key} to s3://{bucket_name}/{s3_key}"
-            print(msg)
-            results.append(msg)
-        except Exception as e:
-            err = f"❌ Error saving {key} to S3: {e}"
-            print(err)
-            results.append(err)
-
-    return results
-
+from dsgreen import json_codec
+from dsgreen.baseinfo_runtime import (
+    COMMON_KEYS, bundle_etag, client_etag, decode_body, etag_matches, get_s3,
+    list_bundle_manifest, load_bundle, load_projection, not_modified_response, parse_projection,
+    patch_baseinfo, project_manifest, projection_variant, resolve_patch_changes,
+    save_json_by_key_to_s3,
+)
 
+# 이 Lambda의 소비자 폴더/bundle (저장·PATCH 시 공통 key가 아니면 이 폴더에 저장)
+BUNDLE_CONSUMER = 'geo'
 
 def lambda_handler(event, context):
     
     user = event['params']['querystring'].get('user')
-    
+    headers = {}
     
     if event['context']['http-method'] == 'GET':
     # TODO implement
 
         if user !='dsgeoadmin' :
 
-    
-            content_object = s3.get_object(Bucket = 'dsgeousergrp', Key = user+'/base.json')
-            file_content = content_object['Body'].read().decode('utf-8')
-            response = json.loads(file_content)
+            # 사용자 파일은 S3 ETag 그대로 사용, 클라이언트가 넘긴 etag=는 S3 조건부 GET으로 전달
+            if_none_match = client_etag(event)
+            try:
+                kwargs = {'IfNoneMatch': if_none_match} if if_none_match else {}
+                content_object = get_s3().get_object(Bucket = 'dsgeousergrp', Key = user+'/base.json', **kwargs)
+            except ClientError as e:
+                if e.response.get('ResponseMetadata', {}).get('HTTPStatusCode') == 304:
+                    return not_modified_response(if_none_match)
+                raise
+            response = json_codec.loads(decode_body(content_object['Body'].read()))
+            headers = {'ETag': content_object['ETag'], 'Cache-Control': 'no-cache'}
         else:
 
-            common = load_all_json_from_prefix('dsbaseinfo','common/')
-            geo = load_all_json_from_prefix('dsbaseinfo','geo/')
-            response = {**common, **geo}
+            # keys=, exclude= 가 있으면 해당 파일만 로드 (예: exclude=tmp_extracted_map)
+            names, exclude = parse_projection(event)
+            projected = names is not None or bool(exclude)
+
+            # 소스 ETag(목록 조회만)로 버전 계산, 클라이언트가 같은 버전을 가지고 있으면 304
+            manifest = list_bundle_manifest('dsbaseinfo', 'geo')
+            etag = bundle_etag(project_manifest(manifest, names, exclude), *projection_variant(names, exclude))
+            if etag_matches(event, etag):
+                return not_modified_response(etag)
+
+            if projected:
+                response = load_projection('dsbaseinfo', 'geo', names, exclude)
+            else:
+                # common/ + geo/ 사전 병합 bundle 한 번 읽기 (오래된 경우 재생성)
+                response = load_bundle('dsbaseinfo', 'geo', manifest=manifest)
+            headers = {'ETag': etag, 'Cache-Control': 'no-cache'}
 
 
         
@@ -92,16 +62,39 @@ def lambda_handler(event, context):
                 'Bucket': 'dsgeousergrp',
                 'Key': user+'/base.json'
             }
-            boto3.resource('s3').meta.client.copy(copy_source, 'dsgeousergrp', user+'/base{}.json'.format(now))
-            response = s3.put_object(Body=json.dumps(event["body-json"]).encode('UTF-8'), Bucket = 'dsgeousergrp', Key = user+'/base.json')
+            get_s3().copy(copy_source, 'dsgeousergrp', user+'/base{}.json'.format(now))
+            response = get_s3().put_object(Body=json_codec.dumps(event["body-json"]), Bucket = 'dsgeousergrp', Key = user+'/base.json')
         else:
-            response = save_json_by_key_to_s3(event["body-json"], ['dsOrgList', 'dsworkcourse_info', 'mapcourse_info'], 'dsbaseinfo')
+            response = save_json_by_key_to_s3(event["body-json"], COMMON_KEYS, 'dsbaseinfo', BUNDLE_CONSUMER)
         # response = save_json_by_key_to_s3(event["body-json"], [], 'dsbaseinfo')
+    elif event['context']['http-method'] == 'PATCH':
+        if user !='dsgeoadmin' :
+            # 사용자 base.json 하나에 바뀐 key/연산만 반영
+            content_object = get_s3().get_object(Bucket = 'dsgeousergrp', Key = user+'/base.json')
+            base = json_codec.loads(decode_body(content_object['Body'].read()))
+            try:
+                changes = resolve_patch_changes(event.get('body-json', {}), base.get)
+            except (KeyError, IndexError, TypeError, ValueError) as e:
+                return {
+                    'statusCode': 400,
+                    'body': {'message': f"Invalid patch: {e!r}"}
+                }
+
+            now = datetime.now()
+            copy_source = {
+                'Bucket': 'dsgeousergrp',
+                'Key': user+'/base.json'
+            }
+            get_s3().copy(copy_source, 'dsgeousergrp', user+'/base{}.json'.format(now))
+            response = get_s3().put_object(Body=json_codec.dumps({**base, **changes}), Bucket = 'dsgeousergrp', Key = user+'/base.json')
+        else:
+            return patch_baseinfo(event, BUNDLE_CONSUMER)
     else:
         response = "문제가 있는데...."
     
     return {
         'statusCode': 200,
-        'body': response
+        'body': response,
+        'headers': headers
         # 'body': json.dumps(event)
     }
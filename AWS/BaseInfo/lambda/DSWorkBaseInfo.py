@@ -1,65 +1,15 @@
-import json
-import boto3
 from datetime import datetime
 
-s3 = boto3.client('s3')
+from dsgreen import json_codec
+from dsgreen.baseinfo_runtime import (
+    COMMON_KEYS, bundle_etag, etag_matches, get_s3, list_bundle_manifest,
+    load_bundle, load_projection, not_modified_response, parse_projection, patch_baseinfo,
+    project_manifest, projection_variant, save_json_by_key_to_s3,
+)
 
+# 이 Lambda의 소비자 폴더/bundle (저장·PATCH 시 공통 key가 아니면 이 폴더에 저장)
+BUNDLE_CONSUMER = 'work'
 
-def save_json_by_key_to_s3(data_dict, common_keys, bucket_name):
-
-    results = []
-
-    for key, value in data_dict.items():
-        # 저장 제외 조건
-        if key in ["mapdscourseid", "dsmapcourseid","user","User","users"]:
-            print(f"⚠️ Skipping key: {key}")
-            continue
-
-        s3_key = f"common/{key}.json" if key in common_keys else f"work/{key}.json"
-
-        try:
-            s3.put_object(
-                Bucket=bucket_name,
-                Key=s3_key,
-                Body=json.dumps(value, ensure_ascii=False, indent=2).encode('utf-8')
-            )
-            msg = f"✅ Saved {key} to s3://{bucket_name}/{s3_key}"
-            print(msg)
-            results.append(msg)
-        except Exception as e:
-            err = f"❌ Error saving {key} to S3: {e}"
-            print(err)
-            results.append(err)
-
-    return results
-
-def load_all_json_from_prefix(bucket_name: str, prefix: str):
-    s3 = boto3.client('s3')
-    result_dict = {}
-
-    # 1. prefix 경로 아래의 모든 객체 리스트 가져오기
-    response = s3.list_objects_v2(Bucket=bucket_name, Prefix=prefix)
-
-    if 'Contents' not in response:
-        print("No files found.")
-        return result_dict
-
-    for obj in response['Contents']:
-        key = obj['Key']
-        if key.endswith('.json'):
-            try:
-                content_object = s3.get_object(Bucket=bucket_name, Key=key)
-                file_content = content_object['Body'].read().decode('utf-8')
-                json_data = json.loads(file_content)
-
-                # 파일명에서 .json 제거하고 딕셔너리 key로 사용
-                filename = key.split('/')[-1].replace('.json', '')
-                result_dict[filename] = json_data
-
-            except Exception as e:
-                print(f"Error reading {key}: {e}")
-
-    return result_dict
 
 # Lambda 핸들러
 def lambda_handler(event, context):
@@ -71,12 +21,14 @@ def lambda_handler(event, context):
         return replace_data(event)
     elif method == "POST":
         return replace_data(event)
+    elif method == "PATCH":
+        return patch_baseinfo(event, BUNDLE_CONSUMER)
     elif method == "DELETE":
         return delete_data(event)
     
     return {
         "statusCode": 405,
-        "body": json.dumps({"error": "Method Not Allowed"}),
+        "body": json_codec.dumps_str({"error": "Method Not Allowed"}),
         "headers": {"Content-Type": "application/json"}
     }
 
@@ -86,17 +38,29 @@ def get_data(event):
     flg = event['params']['querystring'].get('flg', None)
     outflg = event['params']['querystring'].get('outflg', None)
 
-    json_content = load_all_json_from_prefix('dsbaseinfo','work/')
-    common = load_all_json_from_prefix('dsbaseinfo','common/')
-    json_content =  {**common, **json_content}
+    # keys=, exclude= 가 있으면 해당 파일만 로드 (나머지는 다운로드하지 않음)
+    names, exclude = parse_projection(event)
+    projected = names is not None or bool(exclude)
+
+    # 소스 ETag(목록 조회만)로 버전 계산, 클라이언트가 같은 버전을 가지고 있으면 304
+    manifest = list_bundle_manifest('dsbaseinfo', 'work')
+    etag = bundle_etag(project_manifest(manifest, names, exclude), *projection_variant(names, exclude))
+    if etag_matches(event, etag):
+        return not_modified_response(etag)
+
+    if projected:
+        json_content = load_projection('dsbaseinfo', 'work', names, exclude)
+    else:
+        # common/ + work/ 사전 병합 bundle 한 번 읽기 (오래된 경우 재생성)
+        json_content = load_bundle('dsbaseinfo', 'work', manifest=manifest)
     
     # if method == 'GET':
         # TODO implement
-        # content_object = s3.get_object(Bucket = 'dsworkbase', Key = 'baseinfo/base.json')
+        # content_object = get_s3().get_object(Bucket = 'dsworkbase', Key = 'baseinfo/base.json')
         # file_content = content_object['Body'].read().decode('utf-8')
         # json_content = json.loads(file_content)
 
-    # content_object = s3.get_object(Bucket = 'dsworkbase', Key = 'baseinfo/base_total.json')
+    # content_object = get_s3().get_object(Bucket = 'dsworkbase', Key = 'baseinfo/base_total.json')
     # file_content = content_object['Body'].read().decode('utf-8')
     # json_content = json.loads(file_content)
     
@@ -111,7 +75,8 @@ def get_data(event):
 
     return {
         'statusCode': 200,
-        'body': json_content
+        'body': json_content,
+        'headers': {'ETag': etag, 'Cache-Control': 'no-cache'}
         # 'body': json.dumps(event)
     }
         
@@ -124,14 +89,14 @@ def replace_data(event):
         'Bucket': 'dsworkbase',
         'Key': 'baseinfo/base_total.json'
         }
-    boto3.resource('s3').meta.client.copy(copy_source, 'dsworkbase', 'baseinfo/base_total{}.json'.format(now))
+    get_s3().copy(copy_source, 'dsworkbase', 'baseinfo/base_total{}.json'.format(now))
         
         # bucket = s3.Bucket('dsworkbaseinfo')
         # bucket.copy(copy_source, 'baseinfo/base{}.json'.format(now))    
     
     
-    json_content = s3.put_object(Body=json.dumps(event['body-json']).encode('UTF-8'),Bucket = 'dsworkbase', Key = 'baseinfo/base_total.json')
-    json_content = save_json_by_key_to_s3(event["body-json"], ['dsOrgList', 'dsworkcourse_info', 'mapcourse_info'], 'dsbaseinfo')
+    json_content = get_s3().put_object(Body=json_codec.dumps(event['body-json']),Bucket = 'dsworkbase', Key = 'baseinfo/base_total.json')
+    json_content = save_json_by_key_to_s3(event["body-json"], COMMON_KEYS, 'dsbaseinfo', BUNDLE_CONSUMER)
     
     return {
         'statusCode': 200,
@@ -1,67 +1,54 @@
-import simplejson as json
-import boto3
-from decimal import Decimal
+import os
+from collections import OrderedDict
 
-# S3 클라이언트 초기화
-s3 = boto3.client('s3')
-s3_Bucket = 'dsbaseinfo'
-
-
-def save_json_by_key_to_s3(data_dict, common_keys, bucket_name):
-
-    results = []
-
-    for key, value in data_dict.items():
-        # 저장 제외 조건
-        if key in ["mapdscourseid", "dsmapcourseid","user","User","users"]:
-            print(f"⚠️ Skipping key: {key}")
-            continue
-
-        s3_key = f"common/{key}.json" if key in common_keys else f"outrecord/{key}.json"
-
-        try:
-            s3.put_object(
-                Bucket=bucket_name,
-                Key=s3_key,
-                Body=json.dumps(value, ensure_ascii=False, indent=2).encode('utf-8')
-            )
-            msg = f"✅ Saved {key} to s3://{bucket_name}/{s3_key}"
-            print(msg)
-            results.append(msg)
-        except Exception as e:
-            err = f"❌ Error saving {key} to S3: {e}"
-            print(err)
-            results.append(err)
+from dsgreen import json_codec
+from dsgreen.baseinfo_runtime import (
+    COMMON_KEYS, bundle_etag, etag_matches, is_selected, list_bundle_manifest,
+    load_bundle, load_json_cached, load_projection, not_modified_response, parse_projection,
+    patch_baseinfo, project_manifest, projection_variant, save_json_by_key_to_s3,
+)
 
-    return results
-
-def load_all_json_from_prefix(bucket_name: str, prefix: str):
-    s3 = boto3.client('s3')
-    result_dict = {}
-
-    # 1. prefix 경로 아래의 모든 객체 리스트 가져오기
-    response = s3.list_objects_v2(Bucket=bucket_name, Prefix=prefix)
-
-    if 'Contents' not in response:
-        print("No files found.")
-        return result_dict
-
-    for obj in response['Contents']:
-        key = obj['Key']
-        if key.endswith('.json'):
-            try:
-                content_object = s3.get_object(Bucket=bucket_name, Key=key)
-                file_content = content_object['Body'].read().decode('utf-8')
-                json_data = json.loads(file_content)
-
-                # 파일명에서 .json 제거하고 딕셔너리 key로 사용
-                filename = key.split('/')[-1].replace('.json', '')
-                result_dict[filename] = json_data
-
-            except Exception as e:
-                print(f"Error reading {key}: {e}")
+s3_Bucket = 'dsbaseinfo'
 
-    return result_dict
+# 이 Lambda의 소비자 폴더/bundle (저장·PATCH 시 공통 key가 아니면 이 폴더에 저장)
+BUNDLE_CONSUMER = 'outrecord'
+
+# mapdscourseid별 dstask 뷰 캐시 (mapcourse_info/dstask 캐시 객체가 바뀌면 새 세대로 다시 만듦)
+COURSE_VIEW_MAX = int(os.environ.get('COURSE_VIEW_MAX', '256'))
+_course_views = {'mapcourse_info': None, 'dstask': None, 'index': {}, 'views': OrderedDict()}
+
+
+def dstask_view(mapcourse_info: list, dstask: list, mapdscourseid) -> list:
+    """
+    mapdscourseid 코스의 course_names를 courseNames로 넣은 dstask 리스트 반환 (코스가 없으면 dstask 그대로).
+
+    mapcourse_info/dstask는 캐시에서 공유되는 객체이므로, 같은 객체인 동안(같은 캐시 세대)은
+    id->course 인덱스와 코스별 결과를 재사용하여 반복 요청은 스캔/복사 없이 dict 조회만 함.
+    반환된 리스트도 공유되므로 수정하면 안 됨.
+    """
+    if _course_views['mapcourse_info'] is not mapcourse_info or _course_views['dstask'] is not dstask:
+        index = {}
+        for item in mapcourse_info:
+            # 기존 next(...) 선형 탐색과 같이 id가 중복되면 앞쪽 항목 사용
+            index.setdefault(str(item.get('id')), item)
+        _course_views.update(mapcourse_info=mapcourse_info, dstask=dstask, index=index, views=OrderedDict())
+
+    views = _course_views['views']
+    course_id = str(mapdscourseid)
+    view = views.get(course_id)
+    if view is None:
+        matched_item = _course_views['index'].get(course_id)
+        if matched_item is None:
+            view = dstask
+        else:
+            new_course_names = matched_item.get("course_names", [])
+            view = [{**task, "courseNames": new_course_names} for task in dstask]
+        views[course_id] = view
+        if len(views) > COURSE_VIEW_MAX:
+            views.popitem(last=False)
+    else:
+        views.move_to_end(course_id)
+    return view
 
 # Lambda 핸들러
 def lambda_handler(event, context):
@@ -73,12 +60,14 @@ def lambda_handler(event, context):
         return replace_data(event)
     elif method == "POST":
         return replace_data(event)
+    elif method == "PATCH":
+        return patch_baseinfo(event, BUNDLE_CONSUMER)
     elif method == "DELETE":
         return delete_data(event)
 
     return {
         "statusCode": 405,
-        "body": json.dumps({"error": "Method Not Allowed"}),
+        "body": json_codec.dumps_str({"error": "Method Not Allowed"}),
         "headers": {"Content-Type": "application/json"}
     }
 
@@ -87,52 +76,67 @@ def get_data(event):
     query_params = event.get('params', {}).get('querystring', {})
     mapdscourseid = query_params.get('mapdscourseid')
 
-    # common/ + outrecord/ 전체 로드 (DSWorkBaseInfo, DSGEOBaseInfo와 동일 패턴)
-    outrecord = load_all_json_from_prefix('dsbaseinfo', 'outrecord/')
-    common = load_all_json_from_prefix('dsbaseinfo', 'common/')
-    json_content = {**common, **outrecord}
-
-    if not json_content:
+    # keys=, exclude= 가 있으면 해당 파일만 로드 (나머지는 다운로드하지 않음)
+    names, exclude = parse_projection(event)
+    projected = names is not None or bool(exclude)
+
+    # 소스 ETag(목록 조회만)와 mapdscourseid로 버전 계산, 클라이언트가 같은 버전을 가지고 있으면 304
+    # (dstask의 courseNames는 mapcourse_info에 의존하므로 dstask를 요청하면 mapcourse_info도 버전에 포함)
+    manifest = list_bundle_manifest('dsbaseinfo', 'outrecord')
+    version_manifest = project_manifest(manifest, names, exclude)
+    if projected and is_selected('dstask', names, exclude) and 'common/mapcourse_info.json' in manifest:
+        version_manifest = {**version_manifest, 'common/mapcourse_info.json': manifest['common/mapcourse_info.json']}
+    etag = bundle_etag(version_manifest, mapdscourseid, *projection_variant(names, exclude))
+    if etag_matches(event, etag):
+        return not_modified_response(etag)
+
+    if projected:
+        json_content = load_projection('dsbaseinfo', 'outrecord', names, exclude)
+    else:
+        # common/ + outrecord/ 사전 병합 bundle 한 번 읽기 (오래된 경우 재생성)
+        # bundle은 캐시되어 공유되므로 얕은 복사본에 dstask를 반영
+        json_content = dict(load_bundle('dsbaseinfo', 'outrecord', manifest=manifest))
+
+    if not json_content and not projected:
         return {
             "statusCode": 500,
-            "body": json.dumps({"message": "Failed to load base info"}, ensure_ascii=False),
+            "body": json_codec.dumps_str({"message": "Failed to load base info"}),
             "headers": {"Content-Type": "application/json"}
         }
 
-    # mapcourse_info는 common/에서 이미 로드됨
-    mapcourse_info = json_content.get("mapcourse_info", [])
-    matched_item = next((item for item in mapcourse_info if str(item.get('id')) == str(mapdscourseid)), None)
+    # mapcourse_info는 common/에서 이미 로드됨 (projection으로 빠졌고 dstask가 있으면 따로 로드)
+    mapcourse_info = json_content.get("mapcourse_info")
+    if mapcourse_info is None and "dstask" in json_content:
+        mapcourse_info = load_json_cached('dsbaseinfo', 'common/mapcourse_info.json')
 
-    # dstask 내부 courseNames 업데이트
-    if matched_item and "dstask" in json_content and isinstance(json_content["dstask"], list):
-        new_course_names = matched_item.get("course_names", [])
-        for task in json_content["dstask"]:
-            task["courseNames"] = new_course_names
+    # dstask 내부 courseNames 반영 (캐시 세대별로 미리 만든 코스별 뷰 사용)
+    if mapcourse_info and isinstance(json_content.get("dstask"), list):
+        json_content["dstask"] = dstask_view(mapcourse_info, json_content["dstask"], mapdscourseid)
 
     return {
         "statusCode": 200,
         "body": json_content,
-        "headers": {"Content-Type": "application/json"}
+        "headers": {"Content-Type": "application/json", "ETag": etag, "Cache-Control": "no-cache"}
     }
 
 def replace_data(event):
     try:
-        new_data = json.loads(json.dumps(event["body-json"]).encode('UTF-8'), parse_float=Decimal)
+        new_data = event["body-json"]
 
         try:
-            response = save_json_by_key_to_s3(event["body-json"], ['dsOrgList', 'dsworkcourse_info', 'mapcourse_info'], 'dsbaseinfo')
+            response = save_json_by_key_to_s3(new_data, COMMON_KEYS, 'dsbaseinfo', BUNDLE_CONSUMER)
             return {
                 "statusCode": 200,
-                "body": json.dumps({"message": "Data replaced successfully"}),
+                "body": json_codec.dumps_str({"message": "Data replaced successfully"}),
                 "response": response
             }
         except Exception as e:
             return {
                 "statusCode": 500,
-                "body": json.dumps({"message": f"Error replacing data: {str(e)}"})
+                "body": json_codec.dumps_str({"message": f"Error replacing data: {str(e)}"})
             }
     except Exception as e:
         return {
             "statusCode": 400,
-            "body": json.dumps({"message": f"Invalid request body: {str(e)}"})
+            "body": json_codec.dumps_str({"message": f"Invalid request body: {str(e)}"})
         }